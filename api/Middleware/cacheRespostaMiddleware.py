@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import os
+from functools import wraps
+from flask import request, make_response
+from api.utils.cacheRespostas import CacheRespostas
+from api.utils.metricas import Metricas
+
+
+class CacheRespostaMiddleware:
+    """
+    Middleware Flask que serve GETs de catálogo a partir do CacheRespostas.
+
+    - Chave: caminho + query string (ordenada), então ?fields= diferentes
+      ficam em entradas diferentes.
+    - Acerto: devolve os bytes guardados com o ETag, sem tocar no banco nem
+      serializar JSON; If-None-Match igual ao ETag -> 304 sem corpo.
+    - Erro: só respostas 200 são guardadas.
+    - CACHE_RESPOSTAS_ENABLED=0 desliga o cache (o ETag continua sendo enviado).
+
+    Deve ficar depois do validate_token: a autenticação continua valendo em todo acerto.
+    """
+
+    HEADER_CACHE = "X-Cache"
+
+    def __init__(self, cache: CacheRespostas):
+        print("⬆️  CacheRespostaMiddleware.__init__()")
+        self.__cache = cache
+        self.__habilitado = os.environ.get("CACHE_RESPOSTAS_ENABLED", "1").lower() not in ("0", "false", "nao")
+
+    @staticmethod
+    def __chave() -> str:
+        query = "&".join(sorted(f"{nome}={valor}" for nome, valor in request.args.items(multi=True)))
+        return f"{request.path}?{query}"
+
+    def cacheado(self, f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            chave = self.__chave()
+
+            entrada = self.__cache.obter(chave) if self.__habilitado else None
+            Metricas.registrar_cache(f"respostas_{self.__cache.nome}", entrada is not None)
+            if entrada is not None:
+                return self.__responder(entrada.status, entrada.corpo, entrada.etag, entrada.content_type, "HIT")
+
+            geracao = self.__cache.geracao()  # lida antes da consulta: escrita concorrente invalida esta entrada
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200 or response.direct_passthrough:
+                return response
+
+            corpo = response.get_data()
+            if self.__habilitado:
+                entrada = self.__cache.guardar(chave, geracao, response.status_code, corpo, response.content_type)
+                etag = entrada.etag
+            else:
+                etag = CacheRespostas.calcular_etag(corpo)
+            return self.__responder(response.status_code, corpo, etag, response.content_type, "MISS")
+        return decorated_function
+
+    def __responder(self, status: int, corpo: bytes, etag: str, content_type: str, origem: str):
+        # clientes guardam a resposta, mas revalidam sempre (If-None-Match -> 304)
+        if etag in request.if_none_match:
+            response = make_response("", 304)
+        else:
+            response = make_response(corpo, status)
+            response.content_type = content_type
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.headers[self.HEADER_CACHE] = origem
+        return response
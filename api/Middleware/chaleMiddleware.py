@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
-from flask import request
+from flask import request, g
+from api.modelo.chale import Chale
 from api.utils.errorResponse import ErrorResponse
+from api.utils.validacao import validar_entidade
 
 class ChaleMiddleware:
     """
@@ -17,14 +19,16 @@ class ChaleMiddleware:
         """
         Decorator para validar o corpo da requisição (JSON) para operações de Chale.
 
-        Verifica apenas a existência:
+        Etapa única de validação:
         - O objeto 'Chale' existe
-        - O campo obrigatório 'nomeChale' está presente
+        - Todos os campos passam pelas regras de domínio do modelo Chale
+          (erros coletados de uma vez)
+        - O Chale validado fica em g.chale para o control e o service
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 ChaleMiddleware.validate_body()")
-            body = request.get_json()
+            body = request.get_json(silent=True)
 
             if not body or 'Chale' not in body:
                 raise ErrorResponse(
@@ -32,12 +36,7 @@ class ChaleMiddleware:
                     {"message": "O campo 'Chale' é obrigatório!"}
                 )
 
-            Chale = body['Chale']
-            if 'nome' not in Chale:
-                raise ErrorResponse(
-                    400, "Erro na validação de dados",
-                    {"message": "O campo 'nome' é obrigatório!"}
-                )
+            g.chale = validar_entidade(Chale, body['Chale'], "Erro na validação de dados")
 
             return f(*args, **kwargs)
         return decorated_function
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from flask import request, make_response
+from api.utils.cacheCompartilhado import CacheCompartilhado
+
+"""
+Modo de contingência para quedas do banco.
+
+- guardar() (after_request): guarda o corpo da última resposta 200 dos GETs
+  das rotas monitoradas, por path + query string. Com CacheCompartilhado (arquivo
+  próprio, separado do cache de respostas) a cópia vale para todos os workers do
+  host; sem ele, fica num LRU do processo. Cada chave é regravada no máximo a cada
+  CONTINGENCIA_INTERVALO segundos; corpos maiores que CONTINGENCIA_MAX_KB não são guardados.
+- responder() (handler de BancoIndisponivelError): num GET, devolve essa cópia
+  com os headers Warning (110 "Response is Stale"), Age e X-Stale; sem cópia,
+  ou em escritas, devolve None e o Server responde 503 com Retry-After.
+"""
+
+CABECALHO = struct.Struct("<dH")  # instante da gravação (epoch), tamanho do content_type
+
+
+class ContingenciaMiddleware:
+    HEADER_STALE = "X-Stale"
+    MAX_LOCAL = 256
+
+    def __init__(self, prefixos: tuple, compartilhado: CacheCompartilhado | None = None, intervalo: float | None = None,
+                 max_bytes: int | None = None):
+        """
+        :param prefixos: paths monitorados (ex.: ("/api/v1/chales", "/api/v1/reservas"))
+        :param compartilhado: CacheCompartilhado opcional e exclusivo da contingência (cópias vistas por todos os workers)
+        :param intervalo: segundos mínimos entre duas gravações da mesma chave (padrão CONTINGENCIA_INTERVALO ou 5)
+        :param max_bytes: maior corpo guardado (padrão CONTINGENCIA_MAX_KB ou 256 KB)
+        """
+        print("⬆️  ContingenciaMiddleware.__init__()")
+        self.__prefixos = tuple(prefixos)
+        self.__compartilhado = compartilhado
+        self.__intervalo = intervalo if intervalo is not None else float(os.environ.get("CONTINGENCIA_INTERVALO", 5))
+        self.__max_bytes = max_bytes or int(os.environ.get("CONTINGENCIA_MAX_KB", 256)) * 1024
+        self.__local = OrderedDict()  # chave -> bytes (sem CacheCompartilhado)
+        self.__gravadas = OrderedDict()  # chave -> instante da última gravação por este processo
+        self.__trava = threading.Lock()
+
+    @staticmethod
+    def __chave() -> str:
+        query = "&".join(sorted(f"{nome}={valor}" for nome, valor in request.args.items(multi=True)))
+        return f"contingencia:{request.path}?{query}"
+
+    def guardar(self, response):
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or self.HEADER_STALE in response.headers
+            or not request.path.startswith(self.__prefixos)
+        ):
+            return response
+
+        chave = self.__chave()
+        agora = time.time()
+        ultima = self.__gravadas.get(chave)
+        if ultima is not None and agora - ultima < self.__intervalo:
+            return response
+
+        corpo = response.get_data()
+        if len(corpo) > self.__max_bytes:
+            return response  # listas grandes: a contingência fica com a cópia anterior (se houver)
+
+        tipo = response.content_type.encode()
+        valor = CABECALHO.pack(agora, len(tipo)) + tipo + corpo
+        if self.__compartilhado is not None:
+            self.__compartilhado.guardar(chave, valor)
+        else:
+            self.__lembrar(self.__local, chave, valor)
+        self.__lembrar(self.__gravadas, chave, agora)
+        return response
+
+    def responder(self):
+        """Última resposta boa para o GET atual (marcada como desatualizada), ou None."""
+        if request.method != "GET" or not request.path.startswith(self.__prefixos):
+            return None
+
+        chave = self.__chave()
+        if self.__compartilhado is not None:
+            valor = self.__compartilhado.obter(chave)
+        else:
+            valor = self.__local.get(chave)
+        if valor is None:
+            return None
+
+        gravado_em, tamanho_tipo = CABECALHO.unpack_from(valor)
+        inicio_corpo = CABECALHO.size + tamanho_tipo
+        idade = max(0, int(time.time() - gravado_em))
+        print(f"🟠 ContingenciaMiddleware: servindo cópia de {idade}s atrás para {request.path}")
+
+        response = make_response(valor[inicio_corpo:], 200)
+        response.content_type = valor[CABECALHO.size:inicio_corpo].decode()
+        response.headers["Warning"] = '110 - "Response is Stale"'
+        response.headers["Age"] = str(idade)
+        response.headers[self.HEADER_STALE] = "true"
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    def __lembrar(self, destino: OrderedDict, chave: str, valor):
+        with self.__trava:
+            destino[chave] = valor
+            destino.move_to_end(chave)
+            while len(destino) > self.MAX_LOCAL:
+                destino.popitem(last=False)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import wraps
+from flask import request, jsonify, make_response
+from api.utils.armazenamentoLocal import ArmazenamentoLocal
+
+"""
+Suporte ao header Idempotency-Key nas rotas de criação.
+
+- A primeira requisição com uma chave grava um marcador "processando",
+  executa a rota e guarda a resposta (status, corpo e headers relevantes).
+- Repetições com a mesma chave devolvem a resposta guardada (header
+  Idempotent-Replayed: true) sem executar a rota de novo.
+- A mesma chave com outro corpo -> 422; enquanto a primeira ainda está em
+  andamento -> 409 com Retry-After.
+- Respostas 5xx, 429 e exceções não são guardadas: o cliente pode tentar de novo.
+- Nas rotas com rate limit, idempotente fica por fora do limitar(): a
+  repetição é respondida antes de consumir tokens do balde.
+
+Os registros ficam na tabela idempotencia do ArmazenamentoLocal (busca pela
+chave primária, compartilhada entre workers), expiram após IDEMPOTENCIA_TTL
+segundos e a tabela é limitada a IDEMPOTENCIA_MAX registros.
+"""
+
+DDL_IDEMPOTENCIA = """
+CREATE TABLE IF NOT EXISTS idempotencia (
+    chave        TEXT PRIMARY KEY,
+    fingerprint  TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    http_status  INTEGER,
+    corpo        BLOB,
+    headers      TEXT,
+    criado_em    REAL NOT NULL,
+    expira_em    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_idempotencia_expira_em ON idempotencia (expira_em);
+"""
+
+HEADERS_GUARDADOS = ("Content-Type", "Location")
+
+
+class IdempotenciaMiddleware:
+    HEADER = "Idempotency-Key"
+    TAMANHO_MAXIMO_CHAVE = 255
+    LIMPEZA_A_CADA = 100  # gravações entre limpezas de expirados/excedentes
+    PRAZO_PROCESSANDO = 60  # segundos até um marcador "processando" ser considerado abandonado
+
+    def __init__(self, armazenamento: ArmazenamentoLocal, ttl: int | None = None, max_registros: int | None = None):
+        print("⬆️  IdempotenciaMiddleware.__init__()")
+        self.__armazenamento = armazenamento
+        self.__ttl = ttl if ttl is not None else int(os.environ.get("IDEMPOTENCIA_TTL", 24 * 3600))
+        self.__max_registros = max_registros if max_registros is not None else int(os.environ.get("IDEMPOTENCIA_MAX", 10000))
+        self.__gravacoes = 0
+        self.__trava = threading.Lock()
+        self.__armazenamento.garantir_esquema("idempotencia", DDL_IDEMPOTENCIA)
+
+    def idempotente(self, f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            chave_cliente = request.headers.get(self.HEADER)
+            if not chave_cliente:
+                return f(*args, **kwargs)
+
+            print("🔷 IdempotenciaMiddleware.idempotente()")
+            if len(chave_cliente) > self.TAMANHO_MAXIMO_CHAVE:
+                return self.__erro(400, f"{self.HEADER} deve ter no máximo {self.TAMANHO_MAXIMO_CHAVE} caracteres", "INVALID_IDEMPOTENCY_KEY")
+
+            chave = f"{request.method} {request.path} {chave_cliente}"
+            fingerprint = hashlib.sha256(request.get_data(cache=True)).hexdigest()
+
+            existente = self.__reservar(chave, fingerprint)
+            if existente is not None:
+                return self.__responder_existente(existente, fingerprint)
+
+            try:
+                response = make_response(f(*args, **kwargs))
+            except BaseException:
+                self.__liberar(chave)
+                raise
+
+            if response.status_code >= 500 or response.status_code == 429:
+                self.__liberar(chave)
+            else:
+                self.__guardar(chave, response)
+            return response
+        return decorated_function
+
+    # ---------------- armazenamento ----------------
+    def __reservar(self, chave: str, fingerprint: str) -> dict | None:
+        """Grava o marcador "processando" ou devolve o registro já existente."""
+        agora = time.time()
+        with self.__armazenamento.transacao() as conexao:
+            linha = conexao.execute(
+                "SELECT fingerprint, status, http_status, corpo, headers, criado_em FROM idempotencia "
+                "WHERE chave = ? AND expira_em > ?",
+                (chave, agora),
+            ).fetchone()
+            abandonado = linha is not None and linha["status"] == "processando" \
+                and linha["criado_em"] < agora - self.PRAZO_PROCESSANDO
+            if linha is not None and not abandonado:
+                return dict(linha)
+            conexao.execute(
+                "INSERT OR REPLACE INTO idempotencia (chave, fingerprint, status, criado_em, expira_em) "
+                "VALUES (?, ?, 'processando', ?, ?)",
+                (chave, fingerprint, agora, agora + self.__ttl),
+            )
+        return None
+
+    def __guardar(self, chave: str, response):
+        headers = {nome: response.headers[nome] for nome in HEADERS_GUARDADOS if nome in response.headers}
+        self.__armazenamento.executar(
+            "UPDATE idempotencia SET status = 'concluido', http_status = ?, corpo = ?, headers = ? WHERE chave = ?",
+            (response.status_code, response.get_data(), json.dumps(headers), chave),
+        )
+        self.__limpar_periodicamente()
+
+    def __liberar(self, chave: str):
+        self.__armazenamento.executar("DELETE FROM idempotencia WHERE chave = ? AND status = 'processando'", (chave,))
+
+    def __limpar_periodicamente(self):
+        with self.__trava:
+            self.__gravacoes += 1
+            if self.__gravacoes % self.LIMPEZA_A_CADA:
+                return
+        self.__armazenamento.executar("DELETE FROM idempotencia WHERE expira_em <= ?", (time.time(),))
+        self.__armazenamento.executar(
+            "DELETE FROM idempotencia WHERE chave IN ("
+            "  SELECT chave FROM idempotencia ORDER BY criado_em DESC LIMIT -1 OFFSET ?"
+            ")",
+            (self.__max_registros,),
+        )
+
+    # ---------------- respostas ----------------
+    def __responder_existente(self, registro: dict, fingerprint: str):
+        if registro["fingerprint"] != fingerprint:
+            return self.__erro(422, f"{self.HEADER} já utilizada com outro corpo de requisição", "IDEMPOTENCY_KEY_REUSED")
+
+        if registro["status"] != "concluido":
+            resposta, status = self.__erro(409, "Requisição com esta Idempotency-Key ainda em processamento", "IDEMPOTENCY_IN_PROGRESS")
+            resposta.headers["Retry-After"] = "1"
+            return resposta, status
+
+        print("♻️  IdempotenciaMiddleware: resposta reaproveitada")
+        response = make_response(registro["corpo"], registro["http_status"])
+        for nome, valor in json.loads(registro["headers"] or "{}").items():
+            response.headers[nome] = valor
+        response.headers["Idempotent-Replayed"] = "true"
+        return response
+
+    def __erro(self, status: int, mensagem: str, codigo: str):
+        return jsonify({
+            "success": False,
+            "error": {"message": mensagem, "code": codigo}
+        }), status
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
-from flask import request
+from flask import request, g
+from api.modelo.inquilino import Inquilino
 from api.utils.errorResponse import ErrorResponse
+from api.utils.validacao import validar_entidade
 
 class InquilinoMiddleware:
     """
@@ -17,14 +19,16 @@ class InquilinoMiddleware:
         """
         Decorator para validar o corpo da requisição (JSON) para operações de Inquilino.
 
-        Verifica apenas a existência:
+        Etapa única de validação:
         - O objeto 'Inquilino' existe
-        - O campo obrigatório 'nomeInquilino' está presente
+        - Todos os campos passam pelas regras de domínio do modelo Inquilino
+          (erros coletados de uma vez)
+        - O Inquilino validado fica em g.inquilino para o control e o service
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 InquilinoMiddleware.validate_body()")
-            body = request.get_json()
+            body = request.get_json(silent=True)
 
             if not body or 'Inquilino' not in body:
                 raise ErrorResponse(
@@ -32,12 +36,7 @@ class InquilinoMiddleware:
                     {"message": "O campo 'Inquilino' é obrigatório!"}
                 )
 
-            Inquilino = body['Inquilino']
-            if 'nomeInquilino' not in Inquilino:
-                raise ErrorResponse(
-                    400, "Erro na validação de dados",
-                    {"message": "O campo 'nomeInquilino' é obrigatório!"}
-                )
+            g.inquilino = validar_entidade(Inquilino, body['Inquilino'], "Erro na validação de dados")
 
             return f(*args, **kwargs)
         return decorated_function
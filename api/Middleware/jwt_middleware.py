@@ -12,19 +12,51 @@ class JwtMiddleware:
             print("🔷 JwtMiddleware.validate_token()")
             
             authorization = request.headers.get("Authorization", None)
-            jwt_instance = MeuTokenJWT()
+            return self.__validar(authorization, f, *args, **kwargs)
+
+        return decorated_function
+
+    def validate_ticket_eventos(self, f):
+        """
+        Como validate_token, mas aceita também ?ticket=<ticket>.
+
+        Usado em rotas de streaming (Server-Sent Events): o EventSource do
+        navegador não permite enviar o header Authorization. O ticket vem de
+        POST /reservas/eventos/ticket, vale poucos segundos e só abre o stream;
+        o token de acesso nunca vai na URL.
+        """
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            print("🔷 JwtMiddleware.validate_ticket_eventos()")
+
+            authorization = request.headers.get("Authorization")
+            if authorization:
+                return self.__validar(authorization, f, *args, **kwargs)
 
-            if jwt_instance.validar_token(authorization):
-                # ✅ Armazena payload no contexto Flask
+            jwt_instance = MeuTokenJWT()
+            if jwt_instance.validar_ticket_eventos(request.args.get("ticket")):
                 g.jwt_payload = jwt_instance.payload
                 return f(*args, **kwargs)
-            else:
-                return jsonify({
-                    "success": False,
-                    "error": {
-                        "message": jwt_instance.error_message or "Token inválido",
-                        "code": "INVALID_TOKEN"
-                    }
-                }), 401
+            return self.__negar(jwt_instance)
 
         return decorated_function
+
+    def __validar(self, authorization, f, *args, **kwargs):
+        jwt_instance = MeuTokenJWT()
+
+        if jwt_instance.validar_token(authorization):
+            # ✅ Armazena payload no contexto Flask
+            g.jwt_payload = jwt_instance.payload
+            return f(*args, **kwargs)
+        else:
+            return self.__negar(jwt_instance)
+
+    @staticmethod
+    def __negar(jwt_instance: MeuTokenJWT):
+        return jsonify({
+            "success": False,
+            "error": {
+                "message": jwt_instance.error_message or "Token inválido",
+                "code": "INVALID_TOKEN"
+            }
+        }), 401
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import math
+import os
+from functools import wraps
+from flask import request, jsonify
+from api.utils.limitadorTaxa import LimitadorTaxa
+
+
+class RateLimitMiddleware:
+    """
+    Middleware Flask de limitação de taxa (token bucket) por IP e global.
+
+    Cada rota protegida tem um nome e dois limites no formato
+    "quantidade/segundos" (capacidade do balde / tempo para reabastecê-lo):
+
+        RATE_LIMIT_<NOME>_IP=5/60        -> 5 requisições por minuto por IP
+        RATE_LIMIT_<NOME>_GLOBAL=60/60   -> 60 requisições por minuto no total
+
+    Os baldes ficam no LimitadorTaxa (memória compartilhada), então o limite
+    vale para todos os workers. Estourado, responde 429 com Retry-After.
+    """
+
+    # Limites padrão por rota (sobrescritos pelas variáveis de ambiente)
+    LIMITES_PADRAO = {
+        "reserva_publica": {"ip": "5/60", "global": "120/60"},
+        "login": {"ip": "10/60", "global": "300/60"},
+        "disponibilidade": {"ip": "30/60", "global": "600/60"},
+    }
+
+    def __init__(self, limitador: LimitadorTaxa):
+        print("⬆️  RateLimitMiddleware.__init__()")
+        self.__limitador = limitador
+        self.__habilitado = os.environ.get("RATE_LIMIT_ENABLED", "1").lower() not in ("0", "false", "nao")
+        # Atrás de um proxy reverso confiável (Railway, nginx) o IP real vem em X-Forwarded-For
+        self.__confiar_proxy = os.environ.get("RATE_LIMIT_CONFIAR_PROXY", "").lower() in ("1", "true", "sim")
+
+    @staticmethod
+    def _parse_limite(valor: str) -> tuple[float, float] | None:
+        """"5/60" -> (capacidade 5, 5/60 tokens por segundo); "0" ou vazio desabilita."""
+        if not valor or valor.strip() in ("0", "off"):
+            return None
+        quantidade, _, segundos = valor.partition("/")
+        quantidade = float(quantidade)
+        segundos = float(segundos or 1)
+        return quantidade, quantidade / segundos
+
+    def __ip_cliente(self) -> str:
+        if self.__confiar_proxy and request.access_route:
+            return request.access_route[0]
+        return request.remote_addr or "desconhecido"
+
+    def limitar(self, nome: str):
+        """Decorator que aplica os limites configurados para a rota 'nome'."""
+        padrao = self.LIMITES_PADRAO.get(nome, {})
+        variavel = f"RATE_LIMIT_{nome.upper()}"
+        por_ip = self._parse_limite(os.environ.get(f"{variavel}_IP", padrao.get("ip", "")))
+        global_ = self._parse_limite(os.environ.get(f"{variavel}_GLOBAL", padrao.get("global", "")))
+
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                if not self.__habilitado or request.method == "OPTIONS":
+                    return f(*args, **kwargs)
+
+                baldes = []
+                if por_ip:
+                    baldes.append((f"{nome}:ip:{self.__ip_cliente()}", por_ip[0], por_ip[1]))
+                if global_:
+                    baldes.append((f"{nome}:global", global_[0], global_[1]))
+                if not baldes:
+                    return f(*args, **kwargs)
+
+                permitido, espera = self.__limitador.consumir(baldes)
+                if permitido:
+                    return f(*args, **kwargs)
+
+                print(f"🚫 RateLimitMiddleware: limite de '{nome}' excedido")
+                response = jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Muitas requisições. Tente novamente em instantes.",
+                        "code": "RATE_LIMITED"
+                    }
+                })
+                response.headers["Retry-After"] = str(max(1, math.ceil(espera)))
+                return response, 429
+            return decorated_function
+        return decorator
@@ -1,79 +1,36 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
-from flask import request
-from datetime import datetime, date
+from flask import request, g
+from api.modelo.reserva import Reserva
 from api.utils.errorResponse import ErrorResponse
+from api.utils.validacao import validar_entidade
 
 
 class ReservaMiddleware:
     """
     Middleware para validação de requisições relacionadas à entidade Reserva.
 
-    Validações incluídas:
+    Validações incluídas (etapa única, regras do modelo Reserva):
     - Corpo da requisição (existência de 'Reserva' e campos obrigatórios)
     - Formato das datas (YYYY-MM-DD)
     - Ordem cronológica (inicio < fim)
     - Data de início não anterior a hoje
     - idInquilino / idChale devem ser inteiros positivos
+
+    A Reserva validada fica em g.reserva; control e service não repetem
+    o parse das datas.
     """
 
     def validate_body(self, f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 ReservaMiddleware.validate_body()")
-            body = request.get_json()
-            errors = []
+            body = request.get_json(silent=True)
 
             if not body or 'Reserva' not in body:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'Reserva' é obrigatório!"})
 
-            reserva = body['Reserva']
-
-            # campos obrigatórios
-            required = ['idInquilino', 'idChale', 'inicio', 'fim']
-            for campo in required:
-                if campo not in reserva:
-                    errors.append(f"O campo '{campo}' é obrigatório.")
-
-            # validar ids
-            if 'idInquilino' in reserva:
-                try:
-                    ii = int(reserva.get('idInquilino'))
-                    if ii <= 0:
-                        errors.append("idInquilino deve ser um inteiro positivo.")
-                except (ValueError, TypeError):
-                    errors.append("idInquilino deve ser um inteiro.")
-
-            if 'idChale' in reserva:
-                try:
-                    ic = int(reserva.get('idChale'))
-                    if ic <= 0:
-                        errors.append("idChale deve ser um inteiro positivo.")
-                except (ValueError, TypeError):
-                    errors.append("idChale deve ser um inteiro.")
-
-            # validar datas
-            di = None
-            df = None
-            if 'inicio' in reserva:
-                try:
-                    di = datetime.strptime(str(reserva.get('inicio')), "%Y-%m-%d").date()
-                except Exception:
-                    errors.append("Data de início inválida ou formato incorreto (esperado YYYY-MM-DD).")
-            if 'fim' in reserva:
-                try:
-                    df = datetime.strptime(str(reserva.get('fim')), "%Y-%m-%d").date()
-                except Exception:
-                    errors.append("Data de fim inválida ou formato incorreto (esperado YYYY-MM-DD).")
-
-            if di and df:
-                if df <= di:
-                    errors.append("Data de fim deve ser posterior à data de início.")
-                if di < date.today():
-                    errors.append("Data de início não pode ser anterior a hoje.")
-
-            if errors:
-                raise ErrorResponse(400, "Erro na validação de dados da Reserva", {"errors": errors})
+            g.reserva = validar_entidade(Reserva, body['Reserva'], "Erro na validação de dados da Reserva")
 
             return f(*args, **kwargs)
         return decorated_function
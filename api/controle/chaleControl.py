@@ -1,4 +1,4 @@
-from flask import request, jsonify
+from flask import request, jsonify, g
 from api.service.chaleService import ChaleService
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Chale.
@@ -20,8 +20,8 @@ class ChaleControl:
         """Cria um novo Chale"""
         print("🔵 ChaleControle.store()")
        
-        Chale_body_request = request.json.get("Chale")  #Pega os dados do Chale no corpo da requisição
-        novo_id = self.__Chale_service.createChale(Chale_body_request)
+        chale = g.chale  # Chale já validado pelo ChaleMiddleware.validate_body
+        novo_id = self.__Chale_service.createChale(chale)
 
         obj_resposta = {
             "success": True,
@@ -30,8 +30,9 @@ class ChaleControl:
                 "Chales": [
                     {
                         "idChale": novo_id,
-                        "nomeChale": Chale_body_request.get("nome"),
-                        "capacidade": Chale_body_request.get("capacidade"),
+                        "nomeChale": chale.nome,
+                        "capacidade": chale.capacidade,
+                        "tipo": chale.tipo,
                     }
                 ]
             }
@@ -45,7 +46,8 @@ class ChaleControl:
         """Lista todos os Chales cadastrados"""
         print("🔵 ChaleControle.index()")
        
-        array_Chales = self.__Chale_service.findAll()
+        campos = self.__Chale_service.parse_fields(request.args.get("fields"))  # ?fields=idChale,nome
+        array_Chales = self.__Chale_service.findAll(campos)
         
         return jsonify({
             "success": True,
@@ -58,7 +60,8 @@ class ChaleControl:
           # Pega o idChale diretamente da URI
         idChale = request.view_args.get("idChale")
 
-        Chale = self.__Chale_service.findById(idChale)
+        campos = self.__Chale_service.parse_fields(request.args.get("fields"))
+        Chale = self.__Chale_service.findById(idChale, campos)
         obj_resposta = {
             "success": True,
             "message": "Executado com sucesso",
@@ -74,19 +77,19 @@ class ChaleControl:
         # Pega o idChale diretamente da URI
         idChale = request.view_args.get("idChale")
 
-        # Pega os dados do Chale no corpo da requisição
-        json_Chale = request.json.get("Chale")
-        print(json_Chale)
+        # Chale já validado pelo ChaleMiddleware.validate_body
+        chale = g.chale
 
-        resposta = self.__Chale_service.updateChale(idChale, json_Chale)
+        resposta = self.__Chale_service.updateChale(idChale, chale)
         return jsonify({
             "success": True,
             "message": "Chale atualizado com sucesso",
             "data": {
                 "Chale": {
                     "idChale": int(idChale),
-                    "nomeChale": json_Chale.get("nome"),
-                    "capacidade": json_Chale.get("capacidade")
+                    "nomeChale": chale.nome,
+                    "capacidade": chale.capacidade,
+                    "tipo": chale.tipo
                 }
             }
         }), 200
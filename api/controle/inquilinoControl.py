@@ -1,4 +1,4 @@
-from flask import request, jsonify
+from flask import request, jsonify, g
 from api.service.inquilinoService import InquilinoService
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Inquilino.
@@ -20,8 +20,8 @@ class InquilinoControl:
         """Cria um novo Inquilino"""
         print("🔵 InquilinoControle.store()")
        
-        Inquilino_body_request = request.json.get("Inquilino")  #Pega os dados do Inquilino no corpo da requisição
-        novo_id = self.__Inquilino_service.createInquilino(Inquilino_body_request)
+        inquilino = g.inquilino  # Inquilino já validado pelo InquilinoMiddleware.validate_body
+        novo_id = self.__Inquilino_service.createInquilino(inquilino)
 
         obj_resposta = {
             "success": True,
@@ -30,11 +30,11 @@ class InquilinoControl:
                 "Inquilinos": [
                     {
                         "idInquilino": novo_id,
-                        "nomeInquilino": Inquilino_body_request.get("nomeInquilino"),
-                        "email": Inquilino_body_request.get("email"),
-                        "telefone": Inquilino_body_request.get("telefone"),
-                        "requisicao": Inquilino_body_request.get("requisicao"),
-                        "cpf": Inquilino_body_request.get("cpf")
+                        "nomeInquilino": inquilino.nomeInquilino,
+                        "email": inquilino.email,
+                        "telefone": inquilino.telefone,
+                        "requisicao": inquilino.requisicao,
+                        "cpf": inquilino.cpf
                     }
                 ]
             }
@@ -48,7 +48,8 @@ class InquilinoControl:
         """Lista todos os Inquilinos cadastrados"""
         print("🔵 InquilinoControle.index()")
        
-        array_Inquilinos = self.__Inquilino_service.findAll()
+        campos = self.__Inquilino_service.parse_fields(request.args.get("fields"))  # ?fields=idInquilino,nome
+        array_Inquilinos = self.__Inquilino_service.findAll(campos)
         
         return jsonify({
             "success": True,
@@ -57,11 +58,23 @@ class InquilinoControl:
         }), 200
         
 
+    def busca(self):
+        """Busca typeahead de Inquilinos (?q=texto&limite=20)"""
+        print("🔵 InquilinoControle.busca()")
+
+        resultados = self.__Inquilino_service.buscar(request.args.get("q"), request.args.get("limite"))
+        return jsonify({
+            "success": True,
+            "message": "Busca realizada com sucesso",
+            "data": {"Inquilinos": resultados}
+        }), 200
+
     def show(self):
           # Pega o idInquilino diretamente da URI
         idInquilino = request.view_args.get("idInquilino")
 
-        Inquilino = self.__Inquilino_service.findById(idInquilino)
+        campos = self.__Inquilino_service.parse_fields(request.args.get("fields"))
+        Inquilino = self.__Inquilino_service.findById(idInquilino, campos)
         obj_resposta = {
             "success": True,
             "message": "Executado com sucesso",
@@ -77,18 +90,17 @@ class InquilinoControl:
         # Pega o idInquilino diretamente da URI
         idInquilino = request.view_args.get("idInquilino")
 
-        # Pega os dados do Inquilino no corpo da requisição
-        json_Inquilino = request.json.get("Inquilino")
-        print(json_Inquilino)
+        # Inquilino já validado pelo InquilinoMiddleware.validate_body
+        inquilino = g.inquilino
 
-        resposta = self.__Inquilino_service.updateInquilino(idInquilino, json_Inquilino)
+        resposta = self.__Inquilino_service.updateInquilino(idInquilino, inquilino)
         return jsonify({
             "success": True,
             "message": "Inquilino atualizado com sucesso",
             "data": {
                 "Inquilino": {
                     "idInquilino": int(idInquilino),
-                    "nomeInquilino": json_Inquilino.get("nomeInquilino")
+                    "nomeInquilino": inquilino.nomeInquilino
                 }
             }
         }), 200
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from flask import request, jsonify
+from api.service.relatorioService import RelatorioService
+"""
+Classe responsável por controlar os endpoints de relatórios gerenciais.
+
+Recebe o RelatorioService por injeção de dependência; os cálculos e o cache
+por período ficam no service.
+"""
+class RelatorioControl:
+    def __init__(self, Relatorio_service: RelatorioService):
+        """
+        Construtor da classe RelatorioControl
+        :param Relatorio_service: Instância do RelatorioService (injeção de dependência)
+        """
+        print("⬆️  RelatorioControl.constructor()")
+        self.__Relatorio_service = Relatorio_service
+
+    def ocupacao(self):
+        """Ocupação por chalé/mês, estadia média, antecedência e taxa de retorno (?de=&ate=&idChale=)"""
+        print("🔵 RelatorioControle.ocupacao()")
+
+        relatorio = self.__Relatorio_service.ocupacao(request.args)
+        return jsonify({
+            "success": True,
+            "message": "Relatório gerado com sucesso",
+            "data": {"Relatorio": relatorio}
+        }), 200
@@ -1,4 +1,4 @@
-from flask import request, jsonify
+from flask import Response, request, jsonify, g, stream_with_context
 from api.service.reservaService import ReservaService
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Reserva.
@@ -20,8 +20,8 @@ class ReservaControl:
         """Cria um novo Reserva"""
         print("🔵 ReservaControle.store()")
        
-        Reserva_body_request = request.json.get("Reserva")  #Pega os dados do Reserva no corpo da requisição
-        novo_id = self.__Reserva_service.createReserva(Reserva_body_request)
+        reserva = g.reserva  # Reserva já validada pelo ReservaMiddleware.validate_body
+        novo_id = self.__Reserva_service.createReserva(reserva)
 
         obj_resposta = {
             "success": True,
@@ -30,10 +30,10 @@ class ReservaControl:
                 "Reservas": [
                     {
                         "idReserva": novo_id,
-                        "idInquilino": Reserva_body_request.get("idInquilino"),
-                        "idChale": Reserva_body_request.get("idChale"),
-                        "inicio": Reserva_body_request.get("inicio"),
-                        "fim": Reserva_body_request.get("fim")
+                        "idInquilino": reserva.idInquilino,
+                        "idChale": reserva.idChale,
+                        "inicio": reserva.inicio.isoformat(),
+                        "fim": reserva.fim.isoformat()
                     }
                 ]
             }
@@ -46,21 +46,58 @@ class ReservaControl:
     def index(self):
         """Lista todos os Reservas cadastrados"""
         print("🔵 ReservaControle.index()")
-       
-        array_Reservas = self.__Reserva_service.findAll()
-        
+
+        # ?expand=inquilino,chale -> JOIN; ?ids=1,2,3 -> busca em lote (IN)
+        # ?idChale=&idInquilino=&inicio_de=&inicio_ate=&fim_de=&fim_ate= -> filtros (AND)
+        # ?ordem=-inicio; ?pagina=&por_pagina= ou ?limit=&offset= -> paginação
+        args = request.args
+        expand = self.__Reserva_service.parse_expand(args.get("expand"))
+        campos = self.__Reserva_service.parse_fields(args.get("fields"))
+        filtro = self.__Reserva_service.parse_filtro(args)
+        ordem = self.__Reserva_service.parse_ordem(args.get("ordem"))
+        paginacao = self.__Reserva_service.parse_paginacao(args)
+
+        array_Reservas, meta = self.__Reserva_service.findByFiltro(filtro, expand, campos, ordem, paginacao)
+
+        dados = {"Reservas": array_Reservas}
+        if meta is not None:
+            dados["paginacao"] = meta
+
         return jsonify({
             "success": True,
             "message": "Busca realizada com sucesso",
-            "data": {"Reservas": array_Reservas}
+            "data": dados
         }), 200
         
 
+    def export(self):
+        """Exporta reservas em CSV ou Parquet (?formato=&de=&ate=), em streaming"""
+        print("🔵 ReservaControle.export()")
+
+        export = self.__Reserva_service.exportar(request.args)
+        response = Response(stream_with_context(export["corpo"]), content_type=export["mimetype"])
+        response.headers["Content-Disposition"] = f'attachment; filename="{export["nome_arquivo"]}"'
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    def disponibilidade(self):
+        """Datas livres para uma estadia flexível (?de=&ate=&noites=&pessoas=&modo=primeira|todas)"""
+        print("🔵 ReservaControle.disponibilidade()")
+
+        resultado = self.__Reserva_service.disponibilidade(request.args)
+        return jsonify({
+            "success": True,
+            "message": "Busca realizada com sucesso",
+            "data": {"Disponibilidade": resultado}
+        }), 200
+
     def show(self):
           # Pega o idReserva diretamente da URI
         idReserva = request.view_args.get("idReserva")
+        expand = self.__Reserva_service.parse_expand(request.args.get("expand"))
+        campos = self.__Reserva_service.parse_fields(request.args.get("fields"))
 
-        Reserva = self.__Reserva_service.findById(idReserva)
+        Reserva = self.__Reserva_service.findById(idReserva, expand, campos)
         obj_resposta = {
             "success": True,
             "message": "Executado com sucesso",
@@ -76,21 +113,20 @@ class ReservaControl:
         # Pega o idReserva diretamente da URI
         idReserva = request.view_args.get("idReserva")
 
-        # Pega os dados do Reserva no corpo da requisição
-        json_Reserva = request.json.get("Reserva")
-        print(json_Reserva)
+        # Reserva já validada pelo ReservaMiddleware.validate_body
+        reserva = g.reserva
 
-        resposta = self.__Reserva_service.updateReserva(idReserva, json_Reserva)
+        resposta = self.__Reserva_service.updateReserva(idReserva, reserva)
         return jsonify({
             "success": True,
             "message": "Reserva atualizado com sucesso",
             "data": {
                 "Reserva": {
                     "idReserva": int(idReserva),
-                    "idInquilino": json_Reserva.get("idInquilino"),
-                    "idChale": json_Reserva.get("idChale"),
-                    "inicio": json_Reserva.get("inicio"),
-                    "fim": json_Reserva.get("fim")
+                    "idInquilino": reserva.idInquilino,
+                    "idChale": reserva.idChale,
+                    "inicio": reserva.inicio.isoformat(),
+                    "fim": reserva.fim.isoformat()
                 }
             }
         }), 200
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import time
+from flask import Response, g, jsonify, request, stream_with_context
+from api.http.meu_token_jwt import MeuTokenJWT
+from api.utils.logEventos import LogEventos
+
+"""
+Controle do feed de alterações de reservas (Server-Sent Events).
+
+GET /api/v1/reservas/eventos mantém a conexão aberta e envia cada evento
+publicado pelo ReservaService:
+
+    id: 42
+    event: reserva.criada
+    data: {"idReserva": 7, "idInquilino": 1, "idChale": 2, "inicio": "2030-01-01", "fim": "2030-01-05"}
+
+- Sem Last-Event-ID: começa a partir do próximo evento.
+- Com Last-Event-ID (header enviado pelo EventSource ao reconectar, ou
+  ?lastEventId=): reenvia o que aconteceu depois dele. Se esses eventos já
+  saíram do log, envia "event: reset" e o cliente deve recarregar a lista.
+- Comentário ": ping" a cada SSE_HEARTBEAT segundos mantém proxies abertos.
+- A conexão é encerrada após SSE_DURACAO_MAXIMA segundos; o cliente pede um
+  ticket novo e reabre com ?lastEventId=, sem perder eventos.
+
+Autenticação: POST /api/v1/reservas/eventos/ticket (com Authorization) devolve
+um ticket de SSE_TICKET_DURACAO segundos, aceito só nesta rota em ?ticket=.
+"""
+
+
+class ReservaEventosControl:
+    def __init__(self, eventos: LogEventos):
+        print("⬆️  ReservaEventosControl.constructor()")
+        self.__eventos = eventos
+        self.__heartbeat = float(os.environ.get("SSE_HEARTBEAT", 15))
+        self.__duracao_maxima = float(os.environ.get("SSE_DURACAO_MAXIMA", 300))
+
+    def ticket(self):
+        """Emite o ticket de curta duração que abre o stream (EventSource não envia Authorization)"""
+        print("🔵 ReservaEventosControl.ticket()")
+        jwt_instance = MeuTokenJWT()
+        return jsonify({
+            "success": True,
+            "message": "Ticket emitido",
+            "data": {
+                "ticket": jwt_instance.gerar_ticket_eventos(g.jwt_payload),
+                "expiraEm": jwt_instance.duracao_ticket_eventos
+            }
+        }), 200
+
+    def stream(self):
+        """Abre o stream de eventos de reservas"""
+        print("🔵 ReservaEventosControl.stream()")
+
+        ultimo_id = self.__parse_ultimo_id(request.headers.get("Last-Event-ID") or request.args.get("lastEventId"))
+        # sem retomada: só eventos novos (ponto de partida lido antes de abrir o stream)
+        retomar = ultimo_id is not None
+        if not retomar:
+            ultimo_id = self.__eventos.ultimo_id()
+
+        response = Response(
+            stream_with_context(self.__gerar(ultimo_id, retomar)),
+            mimetype="text/event-stream",
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"  # nginx: não acumular o stream
+        return response
+
+    @staticmethod
+    def __parse_ultimo_id(valor: str | None) -> int | None:
+        if valor is None or not valor.strip().isdigit():
+            return None
+        return int(valor)
+
+    def __gerar(self, ultimo_id: int, retomar: bool):
+        encerrar_em = time.monotonic() + self.__duracao_maxima
+        yield "retry: 3000\n\n"
+
+        if retomar and not self.__eventos.disponivel_desde(ultimo_id):
+            ultimo_id = self.__eventos.ultimo_id()
+            yield self.__formatar(ultimo_id, "reset", {"message": "Eventos perdidos; recarregue a lista"})
+
+        while time.monotonic() < encerrar_em:
+            espera = min(self.__heartbeat, encerrar_em - time.monotonic())
+            eventos = self.__eventos.aguardar(ultimo_id, espera)
+            if not eventos:
+                yield ": ping\n\n"
+                continue
+            for evento in eventos:
+                ultimo_id = evento["id"]
+                yield self.__formatar(evento["id"], evento["tipo"], evento["dados"])
+
+    @staticmethod
+    def __formatar(id_evento: int, tipo: str, dados: dict) -> str:
+        return f"id: {id_evento}\nevent: {tipo}\ndata: {json.dumps(dados, ensure_ascii=False)}\n\n"
@@ -3,20 +3,24 @@
 Controlador para reservas públicas (sem autenticação).
 """
 from flask import request, jsonify
+from api.service.reservaPublicaService import ReservaPublicaService
+from api.database.circuito import BancoIndisponivelError
+from api.utils.errorResponse import ErrorResponse
 
 class ReservaPublicaControl:
     """
     Controlador SIMPLIFICADO para reservas públicas.
     """
     
-    def __init__(self, reserva_service):
+    def __init__(self, publica_service: ReservaPublicaService, fila=None):
         """
-        :param reserva_service: Instância do ReservaService
+        :param publica_service: Instância do ReservaPublicaService
+        :param fila: FilaReservaPublica opcional; quando presente, os pedidos são
+                     enfileirados e a rota responde 202 com um tracking ID
         """
-        from api.service.reservaPublicaService import ReservaPublicaService
-        
-        self.reserva_service = reserva_service
-        self.publica_service = ReservaPublicaService(reserva_service)
+        print("⬆️  ReservaPublicaControl.__init__()")
+        self.publica_service = publica_service
+        self.fila = fila
     
     def store_publica(self):
         """
@@ -56,6 +60,10 @@ class ReservaPublicaControl:
             dados_form = dados_request["reserva_publica"]
             print(f"📝 Dados do formulário: {dados_form}")
             
+            # 2a. MODO FILA: valida sem acessar o banco, enfileira e responde 202
+            if self.fila is not None:
+                return self._enfileirar(dados_form)
+            
             # 2. PROCESSAR RESERVA
             reserva_id = self.publica_service.criar_reserva_simples(dados_form)
             
@@ -86,6 +94,12 @@ class ReservaPublicaControl:
             print(f"📤 Resposta de sucesso: {resposta}")
             return jsonify(resposta), 201
             
+        except BancoIndisponivelError:
+            # banco fora do ar: 503 com Retry-After (tratado no Server), não é erro do formulário
+            raise
+        except ErrorResponse:
+            # validação (400) e chalé indisponível (409): status real pelo handler global do Server
+            raise
         except Exception as e:
             print(f"❌ Erro em store_publica: {str(e)}")
             return jsonify({
@@ -94,4 +108,51 @@ class ReservaPublicaControl:
                     "message": str(e),
                     "code": "RESERVA_ERROR"
                 }
-            }), 400
\ No newline at end of file
+            }), 400
+    
+    def _enfileirar(self, dados_form):
+        self.publica_service.validar_formulario(dados_form)
+        tracking = self.fila.enfileirar(dados_form)
+        
+        resposta = {
+            "success": True,
+            "message": "✅ Pedido de reserva recebido!",
+            "data": {
+                "reserva": {
+                    "tracking": tracking,
+                    "status": "pendente",
+                    "acompanhamento": f"/api/v1/reservas/publica/{tracking}",
+                    "mensagem": "Seu pedido está na fila e será processado em instantes."
+                },
+                "contato": {
+                    "nome": dados_form["nome"],
+                    "email": dados_form["email"],
+                    "telefone": dados_form["telefone"]
+                }
+            }
+        }
+        response = jsonify(resposta)
+        response.headers["Location"] = f"/api/v1/reservas/publica/{tracking}"
+        return response, 202
+    
+    def status_publica(self, tracking):
+        """
+        Consulta o andamento de um pedido enfileirado.
+        """
+        print(f"🔵 ReservaPublicaControl.status_publica({tracking})")
+        
+        pedido = self.fila.status(tracking) if self.fila is not None else None
+        if pedido is None:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Pedido não encontrado",
+                    "code": "TRACKING_NOT_FOUND"
+                }
+            }), 404
+        
+        return jsonify({
+            "success": True,
+            "message": "Status do pedido",
+            "data": {"pedido": pedido}
+        }), 200
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from api.modelo.chale import Chale
 from api.database.database import DatabaseConfig
+from api.dao.sqlExecutor import SqlExecutor
+from api.utils.metricas import Metricas
 
 """
 Representa o DAO (Data Access Object) de Chale.
@@ -10,6 +12,9 @@ Objetivo:
 - Permitir injeção de dependência do MysqlDatabase (que fornece conexões do pool).
 """
 class ChaleDAO:
+    # Colunas aceitas em findByField e em ?fields= (projeção do SELECT)
+    CAMPOS_PERMITIDOS = ("idChale", "nome", "capacidade", "tipo")
+
     def __init__(self, database_dependency: DatabaseConfig):
         """
         Construtor do DAO, recebe o Database (pool de conexões) por injeção de dependência.
@@ -18,76 +23,88 @@ class ChaleDAO:
         """
         print("⬆️  ChaleDAO.__init__()")
         self.__database = database_dependency  
+        self.__sql = SqlExecutor(database_dependency)
 
+    @Metricas.medir_dao
     def create(self, objChale: Chale) -> int:
-        SQL = "INSERT INTO chale (nome,capacidade) VALUES (%s,%s);"
-        params = (objChale.nome,objChale.capacidade)
+        SQL = "INSERT INTO chale (nome,capacidade,tipo) VALUES (%s,%s,%s);"
+        params = (objChale.nome,objChale.capacidade,objChale.tipo)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                insert_id = cursor.lastrowid
+        insert_id = self.__sql.inserir(SQL, params)
 
         if not insert_id:
             raise Exception("Falha ao inserir Chale")
         print("✅ ChaleDAO.create()")
         return insert_id
 
+    @Metricas.medir_dao
     def delete(self, Chale: Chale) -> bool:
         SQL = "DELETE FROM chale WHERE idChale = %s;"
         params = (Chale.idChale,)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                affected = cursor.rowcount
+        affected = self.__sql.executar(SQL, params)
 
         print("✅ ChaleDAO.delete()")
         return affected > 0
 
+    @Metricas.medir_dao
     def update(self, objChale: Chale) -> bool:
-        SQL = "UPDATE Chale SET nome = %s, capacidade = %s WHERE idChale = %s;"
-        params = (objChale.nome, objChale.capacidade, objChale.idChale)
+        # tipo ausente no corpo (None) mantém o tipo atual
+        SQL = "UPDATE Chale SET nome = %s, capacidade = %s, tipo = COALESCE(%s, tipo) WHERE idChale = %s;"
+        params = (objChale.nome, objChale.capacidade, objChale.tipo, objChale.idChale)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                affected = cursor.rowcount
+        affected = self.__sql.executar(SQL, params)
 
         print("✅ ChaleDAO.update()")
         return affected > 0
 
-    def findAll(self) -> list[dict]:
-        SQL = "SELECT * FROM chale;"
+    @Metricas.medir_dao
+    def findAll(self, campos: tuple | None = None) -> list[dict]:
+        SQL = f"SELECT {self._colunas(campos)} FROM chale;"
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                cursor.execute(SQL)
-                resultados = cursor.fetchall()
+        resultados = self.__sql.consultar(SQL)
 
         print(f"✅ ChaleDAO.findAll() -> {len(resultados)} registros encontrados")
         return resultados
 
-    def findById(self, idChale: int) -> dict | None:
-        resultados = self.findByField("idChale", idChale)
+    @Metricas.medir_dao
+    def findById(self, idChale: int, campos: tuple | None = None) -> dict | None:
+        resultados = self.findByField("idChale", idChale, campos)
         print("✅ ChaleDAO.findById()")
         return resultados[0] if resultados else None
 
-    def findByField(self, field: str, value) -> list[dict]:
-        allowed_fields = ["idChale", "nome", "capacidade"]
-        if field not in allowed_fields:
+    @Metricas.medir_dao
+    def findByField(self, field: str, value, campos: tuple | None = None) -> list[dict]:
+        if field not in self.CAMPOS_PERMITIDOS:
             raise ValueError(f"Campo inválido para busca: {field}")
 
-        SQL = f"SELECT * FROM chale WHERE {field} = %s;"
+        SQL = f"SELECT {self._colunas(campos)} FROM chale WHERE {field} = %s;"
         params = (value,)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                cursor.execute(SQL, params)
-                resultados = cursor.fetchall()
+        resultados = self.__sql.consultar(SQL, params)
 
         print("✅ ChaleDAO.findByField()")
-        return resultados
\ No newline at end of file
+        return resultados
+
+    @Metricas.medir_dao
+    def findCatalogo(self) -> list[dict]:
+        """Chalés com tipo definido, agrupáveis por tipo e em ordem crescente de capacidade."""
+        SQL = (
+            "SELECT idChale, nome, capacidade, tipo FROM chale "
+            "WHERE tipo IS NOT NULL ORDER BY tipo, capacidade, idChale;"
+        )
+
+        resultados = self.__sql.consultar(SQL)
+
+        print(f"✅ ChaleDAO.findCatalogo() -> {len(resultados)} registros encontrados")
+        return resultados
+
+    def _colunas(self, campos: tuple | None, alias: str = "") -> str:
+        """Lista de colunas do SELECT: apenas as pedidas (já validadas) ou todas."""
+        prefixo = f"{alias}." if alias else ""
+        if not campos:
+            return f"{prefixo}*"
+        invalidos = [campo for campo in campos if campo not in self.CAMPOS_PERMITIDOS]
+        if invalidos:
+            raise ValueError(f"Campos inválidos: {', '.join(invalidos)}")
+        return ", ".join(f"{prefixo}{campo}" for campo in campos)
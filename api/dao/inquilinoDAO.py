@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from api.modelo.inquilino import Inquilino
 from api.database.database import DatabaseConfig
+from api.dao.sqlExecutor import SqlExecutor
+from api.utils.metricas import Metricas
 """
 Representa o DAO (Data Access Object) de Inquilino.
 
@@ -9,6 +11,9 @@ Objetivo:
 - Permitir injeção de dependência do MysqlDatabase (que fornece conexões do pool).
 """
 class InquilinoDAO:
+    # Colunas aceitas em findByField e em ?fields= (projeção do SELECT)
+    CAMPOS_PERMITIDOS = ("idInquilino", "nome", "email", "telefone", "requisicao", "cpf")
+
     def __init__(self, database_dependency: DatabaseConfig):
         """
         Construtor do DAO, recebe o Database (pool de conexões) por injeção de dependência.
@@ -17,76 +22,74 @@ class InquilinoDAO:
         """
         print("⬆️  InquilinoDAO.__init__()")
         self.__database = database_dependency  
+        self.__sql = SqlExecutor(database_dependency)
 
+    @Metricas.medir_dao
     def create(self, objInquilino: Inquilino) -> int:
         SQL = "INSERT INTO inquilino (nome,email,telefone,requisicao,cpf) VALUES (%s,%s,%s,%s,%s);"
         params = (objInquilino.nomeInquilino,objInquilino.email,objInquilino.telefone,objInquilino.requisicao,objInquilino.cpf)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                insert_id = cursor.lastrowid
+        insert_id = self.__sql.inserir(SQL, params)
 
         if not insert_id:
             raise Exception("Falha ao inserir Inquilino")
         print("✅ InquilinoDAO.create()")
         return insert_id
 
+    @Metricas.medir_dao
     def delete(self, Inquilino: Inquilino) -> bool:
         SQL = "DELETE FROM inquilino WHERE idInquilino = %s;"
         params = (Inquilino.idInquilino,)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                affected = cursor.rowcount
+        affected = self.__sql.executar(SQL, params)
 
         print("✅ InquilinoDAO.delete()")
         return affected > 0
 
+    @Metricas.medir_dao
     def update(self, objInquilino: Inquilino) -> bool:
         SQL = "UPDATE inquilino SET nome = %s, email = %s, telefone = %s, requisicao = %s, cpf = %s WHERE idInquilino = %s;"
         params = (objInquilino.nomeInquilino,objInquilino.email, objInquilino.telefone, objInquilino.requisicao, objInquilino.cpf, objInquilino.idInquilino)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                affected = cursor.rowcount
+        affected = self.__sql.executar(SQL, params)
 
         print("✅ InquilinoDAO.update()")
         return affected > 0
 
-    def findAll(self) -> list[dict]:
-        SQL = "SELECT * FROM inquilino;"
+    @Metricas.medir_dao
+    def findAll(self, campos: tuple | None = None) -> list[dict]:
+        SQL = f"SELECT {self._colunas(campos)} FROM inquilino;"
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                cursor.execute(SQL)
-                resultados = cursor.fetchall()
+        resultados = self.__sql.consultar(SQL)
 
         print(f"✅ InquilinoDAO.findAll() -> {len(resultados)} registros encontrados")
         return resultados
 
-    def findById(self, idInquilino: int) -> dict | None:
-        resultados = self.findByField("idInquilino", idInquilino)
+    @Metricas.medir_dao
+    def findById(self, idInquilino: int, campos: tuple | None = None) -> dict | None:
+        resultados = self.findByField("idInquilino", idInquilino, campos)
         print("✅ InquilinoDAO.findById()")
         return resultados[0] if resultados else None
 
-    def findByField(self, field: str, value) -> list[dict]:
-        allowed_fields = ["idInquilino", "nome", "email", "telefone", "requisicao", "cpf"]
-        if field not in allowed_fields:
+    @Metricas.medir_dao
+    def findByField(self, field: str, value, campos: tuple | None = None) -> list[dict]:
+        if field not in self.CAMPOS_PERMITIDOS:
             raise ValueError(f"Campo inválido para busca: {field}")
 
-        SQL = f"SELECT * FROM inquilino WHERE {field} = %s;"
+        SQL = f"SELECT {self._colunas(campos)} FROM inquilino WHERE {field} = %s;"
         params = (value,)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                cursor.execute(SQL, params)
-                resultados = cursor.fetchall()
+        resultados = self.__sql.consultar(SQL, params)
 
         print("✅ InquilinoDAO.findByField()")
-        return resultados
\ No newline at end of file
+        return resultados
+
+    def _colunas(self, campos: tuple | None, alias: str = "") -> str:
+        """Lista de colunas do SELECT: apenas as pedidas (já validadas) ou todas."""
+        prefixo = f"{alias}." if alias else ""
+        if not campos:
+            return f"{prefixo}*"
+        invalidos = [campo for campo in campos if campo not in self.CAMPOS_PERMITIDOS]
+        if invalidos:
+            raise ValueError(f"Campos inválidos: {', '.join(invalidos)}")
+        return ", ".join(f"{prefixo}{campo}" for campo in campos)
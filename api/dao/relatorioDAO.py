@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from api.database.database import DatabaseConfig
+from api.dao.sqlExecutor import SqlExecutor
+from api.utils.metricas import Metricas
+
+"""
+Representa o DAO dos relatórios (leitura em massa para análise).
+
+Objetivo:
+- Trazer tabelas inteiras com apenas as colunas usadas nos cálculos, no formato
+  por coluna ({"coluna": [valores...]}) que o RelatorioService converte em
+  DataFrame sem passar por um dict por linha.
+"""
+class RelatorioDAO:
+    COLUNAS_RESERVA = ("idReserva", "idInquilino", "idChale", "inicio", "fim", "criado_em")
+    COLUNAS_CHALE = ("idChale", "nome", "capacidade")
+
+    def __init__(self, database_dependency: DatabaseConfig):
+        """
+        :param database_dependency: Instância de MysqlDatabase
+        """
+        print("⬆️  RelatorioDAO.__init__()")
+        self.__sql = SqlExecutor(database_dependency)
+
+    @Metricas.medir_dao
+    def reservas(self) -> dict[str, list]:
+        """Reservas da tabela quente e do histórico (os relatórios cobrem períodos passados)."""
+        selecao = ", ".join(self.COLUNAS_RESERVA)
+        SQL = f"SELECT {selecao} FROM reserva UNION ALL SELECT {selecao} FROM reserva_historico;"
+
+        colunas = self.__sql.consultar_colunas(SQL)
+
+        print(f"✅ RelatorioDAO.reservas() -> {len(colunas['idReserva'])} registros encontrados")
+        return colunas
+
+    @Metricas.medir_dao
+    def chales(self) -> dict[str, list]:
+        SQL = f"SELECT {', '.join(self.COLUNAS_CHALE)} FROM chale ORDER BY idChale;"
+
+        colunas = self.__sql.consultar_colunas(SQL)
+
+        print(f"✅ RelatorioDAO.chales() -> {len(colunas['idChale'])} registros encontrados")
+        return colunas
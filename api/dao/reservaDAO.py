@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+from datetime import date
 from api.modelo.reserva import Reserva
 from api.database.database import DatabaseConfig
+from api.dao.sqlExecutor import SqlExecutor
+from api.utils.metricas import Metricas
 
 """
 Representa o DAO (Data Access Object) de Reserva.
@@ -8,8 +11,53 @@ Representa o DAO (Data Access Object) de Reserva.
 Objetivo:
 - Encapsular operações de acesso a dados relacionadas à entidade Reserva.
 - Permitir injeção de dependência do MysqlDatabase (que fornece conexões do pool).
+
+Tabela quente e histórico (migrations/005_reserva_historico.sql):
+- reserva guarda as reservas em andamento, futuras e as encerradas há pouco;
+  o ArquivoReservas move as encerradas antigas para reserva_historico.
+- Sobreposição, disponibilidade e listagens sem filtro de data leem só a
+  tabela quente. findByFiltro inclui o histórico (UNION ALL) apenas quando há
+  filtro de data que pode alcançar reservas já encerradas; findById, o export
+  e os relatórios também o consultam.
 """
 class ReservaDAO:
+    # Colunas aceitas em findByField e em ?fields= (projeção do SELECT)
+    CAMPOS_PERMITIDOS = ("idReserva", "idInquilino", "idChale", "inicio", "fim", "criado_em")
+    # Colunas trazidas por ?expand= (JOIN com as tabelas relacionadas)
+    COLUNAS_EXPANSAO = {
+        "inquilino": ("inquilino", "idInquilino", ("idInquilino", "nome", "email", "telefone")),
+        "chale": ("chale", "idChale", ("idChale", "nome", "capacidade")),
+    }
+    MAX_IDS = 500
+    # Predicados aceitos por findByFiltro (combináveis com AND; cobertos pelos
+    # índices de api/database/migrations/001_indices_reserva.sql)
+    FILTROS = {
+        "idChale": "r.idChale = %s",
+        "idInquilino": "r.idInquilino = %s",
+        "inicio_de": "r.inicio >= %s",
+        "inicio_ate": "r.inicio <= %s",
+        "fim_de": "r.fim >= %s",
+        "fim_ate": "r.fim <= %s",
+    }
+    # Filtros de data: só eles levam findByFiltro a consultar reserva_historico
+    FILTROS_DATA = ("inicio_de", "inicio_ate", "fim_de", "fim_ate")
+    # Ordenações aceitas (idReserva desempata para a paginação ser estável)
+    ORDENACOES = {
+        "idReserva": "r.idReserva",
+        "-idReserva": "r.idReserva DESC",
+        "inicio": "r.inicio, r.idReserva",
+        "-inicio": "r.inicio DESC, r.idReserva DESC",
+        "fim": "r.fim, r.idReserva",
+        "-fim": "r.fim DESC, r.idReserva DESC",
+    }
+
+    # Colunas do export (GET /reservas/export): reserva + nomes do inquilino e do chalé
+    COLUNAS_EXPORT = (
+        "r.idReserva", "r.inicio", "r.fim",
+        "r.idInquilino", "i.nome AS inquilino", "i.email AS email_inquilino", "i.cpf AS cpf_inquilino",
+        "r.idChale", "c.nome AS chale",
+    )
+
     def __init__(self, database_dependency: DatabaseConfig):
         """
         Construtor do DAO, recebe o Database (pool de conexões) por injeção de dependência.
@@ -18,76 +66,319 @@ class ReservaDAO:
         """
         print("⬆️  ReservaDAO.__init__()")
         self.__database = database_dependency  
+        self.__sql = SqlExecutor(database_dependency)
 
+    @Metricas.medir_dao
     def create(self, objReserva: Reserva) -> int:
         SQL = "INSERT INTO reserva (idInquilino, idChale, inicio, fim) VALUES (%s, %s, %s, %s);"
         params = (objReserva.idInquilino, objReserva.idChale, objReserva.inicio, objReserva.fim)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                insert_id = cursor.lastrowid
+        insert_id = self.__sql.inserir(SQL, params)
 
         if not insert_id:
             raise Exception("Falha ao inserir Reserva")
         print("✅ ReservaDAO.create()")
         return insert_id
 
+    @Metricas.medir_dao
     def delete(self, reserva: Reserva) -> bool:
         SQL = "DELETE FROM reserva WHERE idReserva = %s;"
         params = (reserva.idReserva,)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                affected = cursor.rowcount
+        affected = self.__sql.executar(SQL, params)
 
         print("✅ ReservaDAO.delete()")
         return affected > 0
 
+    @Metricas.medir_dao
     def update(self, objReserva: Reserva) -> bool:
         SQL = "UPDATE reserva SET idInquilino = %s, idChale = %s, inicio = %s, fim = %s WHERE idReserva = %s;"
         params = (objReserva.idInquilino, objReserva.idChale, objReserva.inicio, objReserva.fim, objReserva.idReserva)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(SQL, params)
-                conn.commit()
-                affected = cursor.rowcount
+        affected = self.__sql.executar(SQL, params)
 
         print("✅ ReservaDAO.update()")
         return affected > 0
 
-    def findAll(self) -> list[dict]:
-        SQL = "SELECT * FROM reserva;"
+    @Metricas.medir_dao
+    def findAll(self, campos: tuple | None = None) -> list[dict]:
+        SQL = f"SELECT {self._colunas(campos)} FROM reserva;"
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                cursor.execute(SQL)
-                resultados = cursor.fetchall()
+        resultados = self.__sql.consultar(SQL)
 
         print(f"✅ ReservaDAO.findAll() -> {len(resultados)} registros encontrados")
         return resultados
 
-    def findById(self, idReserva: int) -> dict | None:
-        resultados = self.findByField("idReserva", idReserva)
+    @Metricas.medir_dao
+    def findById(self, idReserva: int, campos: tuple | None = None) -> dict | None:
+        """Busca na tabela quente e, se não achar, no histórico (reserva já arquivada)."""
+        resultados = self.findByField("idReserva", idReserva, campos)
+        if not resultados:
+            SQL = f"SELECT {self._colunas(campos or self.CAMPOS_PERMITIDOS)} FROM reserva_historico WHERE idReserva = %s;"
+            resultados = self.__sql.consultar(SQL, (idReserva,))
         print("✅ ReservaDAO.findById()")
         return resultados[0] if resultados else None
 
-    def findByField(self, field: str, value) -> list[dict]:
-        allowed_fields = ["idReserva", "idInquilino", "idChale", "inicio", "fim"]
-        if field not in allowed_fields:
+    @Metricas.medir_dao
+    def arquivada(self, idReserva: int) -> bool:
+        """True se a reserva está em reserva_historico (update/delete só alcançam a tabela quente)."""
+        SQL = "SELECT 1 AS arquivada FROM reserva_historico WHERE idReserva = %s;"
+
+        resultado = self.__sql.consultar_um(SQL, (idReserva,))
+
+        print("✅ ReservaDAO.arquivada()")
+        return resultado is not None
+
+    @Metricas.medir_dao
+    def findByField(self, field: str, value, campos: tuple | None = None) -> list[dict]:
+        if field not in self.CAMPOS_PERMITIDOS:
             raise ValueError(f"Campo inválido para busca: {field}")
 
-        SQL = f"SELECT * FROM reserva WHERE {field} = %s;"
+        SQL = f"SELECT {self._colunas(campos)} FROM reserva WHERE {field} = %s;"
         params = (value,)
 
-        with self.__database.get_connection() as conn:
-            with conn.cursor(dictionary=True) as cursor:
-                cursor.execute(SQL, params)
-                resultados = cursor.fetchall()
+        resultados = self.__sql.consultar(SQL, params)
 
         print("✅ ReservaDAO.findByField()")
-        return resultados
\ No newline at end of file
+        return resultados
+
+    def exportar(self, de=None, ate=None, tamanho_lote: int = 1000):
+        """
+        Reservas que ocupam algum dia entre 'de' e 'ate' (inclusive), com os nomes do
+        inquilino e do chalé, em lotes de 'tamanho_lote' linhas (gerador, cursor não bufferizado).
+
+        Sem @Metricas.medir_dao: o decorator mediria só a criação do gerador; o tempo
+        da query é medido pelo SqlExecutor ao fim da leitura.
+        """
+        condicoes, params = [], []
+        if de is not None:
+            condicoes.append("r.fim >= %s")
+            params.append(de)
+        if ate is not None:
+            condicoes.append("r.inicio <= %s")
+            params.append(ate)
+        where = f" WHERE {' AND '.join(condicoes)}" if condicoes else ""
+
+        # período que só alcança reservas de hoje em diante não precisa do histórico
+        tabelas = ["reserva"] if de is not None and de >= date.today() else ["reserva", "reserva_historico"]
+        selects = [
+            f"SELECT {', '.join(self.COLUNAS_EXPORT)} FROM {tabela} r "
+            "JOIN inquilino i ON i.idInquilino = r.idInquilino "
+            "JOIN chale c ON c.idChale = r.idChale"
+            f"{where}"
+            for tabela in tabelas
+        ]
+        if len(selects) == 1:
+            SQL = f"{selects[0]} ORDER BY r.inicio, r.idReserva;"
+        else:
+            SQL = f"SELECT * FROM ({' UNION ALL '.join(selects)}) r ORDER BY r.inicio, r.idReserva;"
+            params = params * 2
+        print("✅ ReservaDAO.exportar()")
+        return self.__sql.iterar(SQL, tuple(params), tamanho_lote)
+
+    @Metricas.medir_dao
+    def ocupacaoPorChale(self, de, ate, capacidade_minima: int = 1) -> list[dict]:
+        """
+        Chalés com capacidade >= capacidade_minima e as reservas de cada um que ocupam
+        alguma noite entre 'de' e 'ate' (fim > de e inicio < ate), ordenados por
+        (idChale, inicio). Chalé sem reserva na janela vem uma vez com inicio/fim NULL.
+
+        Uma query só (LEFT JOIN coberto por idx_reserva_chale_inicio).
+        """
+        SQL = (
+            "SELECT c.idChale, c.nome, c.capacidade, r.inicio, r.fim FROM chale c "
+            "LEFT JOIN reserva r ON r.idChale = c.idChale AND r.fim > %s AND r.inicio < %s "
+            "WHERE c.capacidade >= %s ORDER BY c.idChale, r.inicio;"
+        )
+        params = (de, ate, capacidade_minima)
+
+        resultados = self.__sql.consultar(SQL, params)
+
+        print(f"✅ ReservaDAO.ocupacaoPorChale() -> {len(resultados)} registros encontrados")
+        return resultados
+
+    @Metricas.medir_dao
+    def vizinhancaChales(self, ids: list[int], inicio, fim, horizonte_inicio, horizonte_fim) -> list[dict]:
+        """
+        Para cada chalé de 'ids' com reservas entre horizonte_inicio e horizonte_fim:
+        fim da reserva anterior a 'inicio', início da seguinte a 'fim' e quantas
+        reservas conflitam com [inicio, fim). Chalé sem nenhuma reserva no horizonte
+        não aparece no resultado.
+
+        Uma query (range em idx_reserva_chale_inicio para cada chalé).
+        """
+        if not ids:
+            return []
+        SQL = (
+            "SELECT idChale, "
+            "MAX(CASE WHEN fim <= %s THEN fim END) AS fim_anterior, "
+            "MIN(CASE WHEN inicio >= %s THEN inicio END) AS inicio_seguinte, "
+            "SUM(CASE WHEN inicio < %s AND fim > %s THEN 1 ELSE 0 END) AS conflitos "
+            f"FROM reserva WHERE idChale IN ({', '.join(['%s'] * len(ids))}) "
+            "AND fim > %s AND inicio < %s GROUP BY idChale;"
+        )
+        params = (inicio, fim, fim, inicio, *ids, horizonte_inicio, horizonte_fim)
+
+        resultados = self.__sql.consultar(SQL, params)
+
+        print(f"✅ ReservaDAO.vizinhancaChales() -> {len(resultados)} registros encontrados")
+        return resultados
+
+    @Metricas.medir_dao
+    def findMany(self, ids: list[int] | None = None, expand: tuple = (), campos: tuple | None = None,
+                 historico: bool = False) -> list[dict]:
+        """
+        Busca reservas em uma única query.
+
+        :param ids: se informado, apenas essas reservas (WHERE idReserva IN (...))
+        :param expand: relações a incluir via JOIN ("inquilino", "chale"); cada uma
+                       vira um objeto aninhado na reserva (ex.: reserva["inquilino"]["nome"])
+        :param campos: colunas de reserva a retornar (projeção); None = todas
+        :param historico: True para incluir reserva_historico (UNION ALL)
+        """
+        return self.findByFiltro({"ids": ids} if ids is not None else {}, expand=expand, campos=campos,
+                                 historico=historico)
+
+    @Metricas.medir_dao
+    def findByFiltro(self, filtro: dict, expand: tuple = (), campos: tuple | None = None,
+                     ordem: str = "idReserva", limite: int | None = None, offset: int = 0,
+                     historico: bool = False) -> list[dict]:
+        """
+        Busca reservas combinando predicados (AND), ordenação e paginação em uma query.
+
+        :param filtro: chaves de FILTROS (ex.: {"idChale": 1, "inicio_de": date(...)}) e/ou "ids"
+        :param ordem: chave de ORDENACOES (ex.: "inicio", "-inicio")
+        :param limite: máximo de linhas (None = sem limite)
+        :param offset: linhas a pular
+        :param historico: True para incluir reserva_historico mesmo sem filtro de data (ex.: busca por id)
+
+        Com filtro de data que pode alcançar reservas encerradas (ver _consulta_historico),
+        a mesma busca é feita em reserva e reserva_historico (UNION ALL), ordenada e paginada junta.
+        """
+        historico = historico or self._consulta_historico(filtro)
+        extras = ()
+        if historico:
+            # colunas explícitas (o histórico tem arquivado_em) e as da ordenação, removidas no final
+            ordenacao = ("idReserva", ordem.lstrip("-"))
+            extras = tuple(dict.fromkeys(c for c in ordenacao if campos and c not in campos))
+            campos = tuple(campos or self.CAMPOS_PERMITIDOS) + extras
+        colunas = [self._colunas(campos, "r")]
+        joins = []
+        for nome in expand:
+            tabela, chave, campos_relacao = self.COLUNAS_EXPANSAO[nome]
+            colunas.extend(f"{nome}.{campo} AS {nome}__{campo}" for campo in campos_relacao)
+            joins.append(f"LEFT JOIN {tabela} {nome} ON {nome}.{chave} = r.{chave}")
+
+        predicados = []
+        params = []
+        for chave, valor in filtro.items():
+            if valor is None:
+                continue
+            if chave == "ids":
+                if not valor:
+                    return []
+                predicados.append(f"r.idReserva IN ({', '.join(['%s'] * len(valor))})")
+                params.extend(valor)
+                continue
+            if chave not in self.FILTROS:
+                raise ValueError(f"Filtro inválido: {chave}")
+            predicados.append(self.FILTROS[chave])
+            params.append(valor)
+
+        if ordem not in self.ORDENACOES:
+            raise ValueError(f"Ordenação inválida: {ordem}")
+
+        where = " WHERE " + " AND ".join(predicados) if predicados else ""
+        if historico:
+            selects = [
+                f"SELECT {', '.join(colunas)} FROM {tabela} r {' '.join(joins)}{where}"
+                for tabela in ("reserva", "reserva_historico")
+            ]
+            SQL = f"SELECT * FROM ({' UNION ALL '.join(selects)}) r"
+            params = params * 2
+        else:
+            SQL = f"SELECT {', '.join(colunas)} FROM reserva r {' '.join(joins)}{where}"
+        SQL += f" ORDER BY {self.ORDENACOES[ordem]}"
+        if limite is not None:
+            SQL += " LIMIT %s OFFSET %s"
+            params.extend((limite, offset))
+
+        resultados = self.__sql.consultar(SQL + ";", tuple(params))
+        if expand:
+            resultados = [self.__aninhar(linha, expand) for linha in resultados]
+        for linha in resultados if extras else ():
+            for coluna in extras:
+                del linha[coluna]
+
+        print(f"✅ ReservaDAO.findByFiltro() -> {len(resultados)} registros encontrados")
+        return resultados
+
+    @Metricas.medir_dao
+    def idsParaArquivar(self, corte: date, limite: int) -> list[int]:
+        """Até 'limite' reservas encerradas antes de 'corte' (fim < corte), das mais antigas (idx_reserva_fim)."""
+        SQL = "SELECT idReserva FROM reserva WHERE fim < %s ORDER BY fim, idReserva LIMIT %s;"
+        params = (corte, limite)
+
+        resultados = self.__sql.consultar(SQL, params)
+
+        print(f"✅ ReservaDAO.idsParaArquivar() -> {len(resultados)} registros encontrados")
+        return [linha["idReserva"] for linha in resultados]
+
+    @Metricas.medir_dao
+    def arquivar(self, ids: list[int], corte: date) -> int:
+        """
+        Move as reservas de 'ids' para reserva_historico numa transação curta
+        (INSERT ... SELECT + DELETE pela chave primária: trava só essas linhas).
+
+        fim < corte é conferido de novo: uma reserva alterada depois de
+        idsParaArquivar continua na tabela quente.
+
+        :return: quantidade de reservas movidas
+        """
+        if not ids:
+            return 0
+        marcadores = ", ".join(["%s"] * len(ids))
+        colunas = ", ".join(self.CAMPOS_PERMITIDOS)
+        params = (*ids, corte)
+        _, removidas = self.__sql.executar_transacao([
+            (
+                f"INSERT INTO reserva_historico ({colunas}) SELECT {colunas} FROM reserva "
+                f"WHERE idReserva IN ({marcadores}) AND fim < %s;",
+                params,
+            ),
+            (f"DELETE FROM reserva WHERE idReserva IN ({marcadores}) AND fim < %s;", params),
+        ])
+        print(f"✅ ReservaDAO.arquivar() -> {removidas} reservas movidas para o histórico")
+        return removidas
+
+    def _consulta_historico(self, filtro: dict) -> bool:
+        """
+        True se o filtro tem data e pode alcançar reservas arquivadas.
+
+        O histórico só guarda reservas encerradas (fim < hoje, e inicio < fim):
+        fim_de ou inicio_de a partir de hoje já o exclui.
+        """
+        if not any(filtro.get(chave) is not None for chave in self.FILTROS_DATA):
+            return False
+        hoje = date.today()
+        return not any(
+            filtro.get(chave) is not None and filtro[chave] >= hoje for chave in ("fim_de", "inicio_de")
+        )
+
+    def __aninhar(self, linha: dict, expand: tuple) -> dict:
+        """Move as colunas "relacao__campo" para linha["relacao"] (None se a relação não existir)."""
+        for nome in expand:
+            campos = self.COLUNAS_EXPANSAO[nome][2]
+            objeto = {campo: linha.pop(f"{nome}__{campo}") for campo in campos}
+            linha[nome] = objeto if objeto[campos[0]] is not None else None
+        return linha
+
+    def _colunas(self, campos: tuple | None, alias: str = "") -> str:
+        """Lista de colunas do SELECT: apenas as pedidas (já validadas) ou todas."""
+        prefixo = f"{alias}." if alias else ""
+        if not campos:
+            return f"{prefixo}*"
+        invalidos = [campo for campo in campos if campo not in self.CAMPOS_PERMITIDOS]
+        if invalidos:
+            raise ValueError(f"Campos inválidos: {', '.join(invalidos)}")
+        return ", ".join(f"{prefixo}{campo}" for campo in campos)
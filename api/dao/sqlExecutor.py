@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+import time
+from contextlib import contextmanager
+from api.database.database import DatabaseConfig
+from api.utils.slowQueryLog import SlowQueryLog
+
+"""
+Executor de SQL compartilhado pelos DAOs.
+
+Objetivo:
+- Centralizar o ciclo conexão do pool -> cursor -> execute -> commit.
+- Medir cada statement e enviar os que passarem do limite para o SlowQueryLog,
+  com o EXPLAIN capturado uma vez por statement distinto.
+- Repassar ao DatabaseConfig as falhas de execute/commit: queda da conexão no
+  meio da query também conta no circuito e vira BancoIndisponivelError (503).
+- Traduzir violação de chave única (MySQL errno 1062 / SQLite "UNIQUE
+  constraint failed") em RegistroDuplicadoError, independente do backend.
+"""
+
+COMANDOS_EXPLICAVEIS = ("SELECT", "UPDATE", "DELETE", "WITH")
+ERRNO_CHAVE_DUPLICADA = 1062  # ER_DUP_ENTRY do MySQL
+
+
+class RegistroDuplicadoError(Exception):
+    """INSERT/UPDATE violou uma restrição UNIQUE (ex.: nome de chalé já existente)."""
+
+
+def _chave_duplicada(erro: Exception) -> bool:
+    if getattr(erro, "errno", None) == ERRNO_CHAVE_DUPLICADA:
+        return True
+    return isinstance(erro, sqlite3.IntegrityError) and "UNIQUE constraint failed" in str(erro)
+
+
+class SqlExecutor:
+    def __init__(self, database_dependency: DatabaseConfig):
+        """
+        :param database_dependency: DatabaseConfig ou SqliteDatabaseConfig (get_connection)
+        """
+        self.__database = database_dependency
+        # MySQL: "EXPLAIN ..."; SQLite: "EXPLAIN QUERY PLAN ..."
+        self.__prefixo_explain = getattr(database_dependency, "PREFIXO_EXPLAIN", "EXPLAIN ")
+
+    @contextmanager
+    def __conexao(self):
+        """Conexão do pool; falhas de conexão durante o uso passam por falha_de_conexao do backend."""
+        try:
+            with self.__database.get_connection() as conn:
+                yield conn
+        except Exception as e:
+            traduzir = getattr(self.__database, "falha_de_conexao", None)
+            falha = traduzir(e) if traduzir is not None else None
+            if falha is not None:
+                raise falha from e
+            raise
+
+    def consultar(self, sql: str, params=()) -> list[dict]:
+        """Executa um SELECT e devolve todas as linhas como dict."""
+        inicio = time.perf_counter()
+        with self.__conexao() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                cursor.execute(sql, params)
+                resultados = cursor.fetchall()
+        self.__medir(sql, params, len(resultados), inicio)
+        return resultados
+
+    def consultar_um(self, sql: str, params=()) -> dict | None:
+        """Executa um SELECT e devolve a primeira linha (ou None)."""
+        inicio = time.perf_counter()
+        with self.__conexao() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                cursor.execute(sql, params)
+                resultado = cursor.fetchone()
+                # descarta o restante para liberar a conexão limpa
+                cursor.fetchall()
+        self.__medir(sql, params, 1 if resultado else 0, inicio)
+        return resultado
+
+    def consultar_colunas(self, sql: str, params=()) -> dict[str, list]:
+        """
+        Executa um SELECT e devolve o resultado por coluna ({"coluna": [valores...]}).
+
+        Lê tuplas (sem montar um dict por linha) e transpõe no final: é o formato
+        que o pandas/numpy consomem direto em leituras grandes.
+        """
+        inicio = time.perf_counter()
+        with self.__conexao() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                linhas = cursor.fetchall()
+                nomes = cursor.column_names
+        self.__medir(sql, params, len(linhas), inicio)
+        valores = list(zip(*linhas)) if linhas else [()] * len(nomes)
+        return {nome: list(coluna) for nome, coluna in zip(nomes, valores)}
+
+    def iterar(self, sql: str, params=(), tamanho_lote: int = 1000):
+        """
+        Executa um SELECT com cursor não bufferizado e devolve as linhas em lotes (list[dict]).
+
+        A conexão fica emprestada até o gerador terminar ou ser fechado (close()),
+        e a memória usada é a de um lote, independente do total de linhas.
+        """
+        inicio = time.perf_counter()
+        total = 0
+        with self.__conexao() as conn:
+            with conn.cursor(dictionary=True, buffered=False) as cursor:
+                cursor.execute(sql, params)
+                try:
+                    while True:
+                        lote = cursor.fetchmany(tamanho_lote)
+                        if not lote:
+                            break
+                        total += len(lote)
+                        yield lote
+                except GeneratorExit:
+                    # leitor parou no meio (ex.: cliente desconectou): descarta o restante,
+                    # lote a lote, para a conexão voltar ao pool sem resultado pendente
+                    while cursor.fetchmany(tamanho_lote):
+                        pass
+                    raise
+        self.__medir(sql, params, total, inicio)
+
+    def executar(self, sql: str, params=()) -> int:
+        """
+        Executa INSERT/UPDATE/DELETE com commit e devolve as linhas afetadas.
+
+        :raises RegistroDuplicadoError: se o statement violar uma restrição UNIQUE
+        """
+        inicio = time.perf_counter()
+        with self.__conexao() as conn:
+            with conn.cursor() as cursor:
+                self.__executar_escrita(cursor, sql, params)
+                conn.commit()
+                afetadas = cursor.rowcount
+        self.__medir(sql, params, afetadas, inicio)
+        return afetadas
+
+    def executar_transacao(self, comandos: list[tuple[str, tuple]]) -> list[int]:
+        """
+        Executa vários INSERT/UPDATE/DELETE na mesma conexão com um único commit
+        (rollback se algum falhar) e devolve as linhas afetadas por cada um.
+
+        :param comandos: lista de (sql, params)
+        """
+        medidas = []  # (linhas afetadas, duração) de cada comando; medidos depois do commit
+        with self.__conexao() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    for sql, params in comandos:
+                        inicio = time.perf_counter()
+                        self.__executar_escrita(cursor, sql, params)
+                        medidas.append((cursor.rowcount, time.perf_counter() - inicio))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        for (sql, params), (linhas, duracao) in zip(comandos, medidas):
+            self.__medir(sql, params, linhas, time.perf_counter() - duracao)
+        return [linhas for linhas, _ in medidas]
+
+    def inserir(self, sql: str, params=()) -> int:
+        """
+        Executa um INSERT com commit e devolve o id gerado (lastrowid).
+
+        :raises RegistroDuplicadoError: se o INSERT violar uma restrição UNIQUE
+        """
+        inicio = time.perf_counter()
+        with self.__conexao() as conn:
+            with conn.cursor() as cursor:
+                self.__executar_escrita(cursor, sql, params)
+                conn.commit()
+                insert_id = cursor.lastrowid
+        self.__medir(sql, params, 1 if insert_id else 0, inicio)
+        return insert_id
+
+    def explicar(self, sql: str, params=()) -> list[dict]:
+        """Executa o EXPLAIN do statement e devolve o plano."""
+        if not sql.lstrip().upper().startswith(COMANDOS_EXPLICAVEIS):
+            return []
+        with self.__conexao() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                cursor.execute(self.__prefixo_explain + sql, params)
+                return cursor.fetchall()
+
+    @staticmethod
+    def __executar_escrita(cursor, sql: str, params):
+        try:
+            cursor.execute(sql, params)
+        except Exception as e:
+            if _chave_duplicada(e):
+                raise RegistroDuplicadoError(str(e)) from e
+            raise
+
+    def __medir(self, sql: str, params, linhas: int, inicio: float):
+        duracao = time.perf_counter() - inicio
+        if SlowQueryLog.lenta(duracao):
+            SlowQueryLog.registrar(sql, params, linhas, duracao, self.explicar)
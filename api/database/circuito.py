@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from api.utils.errorResponse import ErrorResponse
+
+"""
+Circuit breaker em volta da obtenção de conexões do banco.
+
+Estados:
+- fechado: conexões são pedidas normalmente; limite_falhas falhas seguidas
+  abrem o circuito.
+- aberto: durante tempo_aberto segundos nenhuma conexão é tentada; quem pede
+  recebe BancoIndisponivelError na hora (sem esperar timeout de rede).
+- meio-aberto: passado o tempo, UMA requisição testa o banco; sucesso fecha
+  o circuito, falha abre de novo. As demais continuam falhando rápido.
+
+O estado é por processo: cada worker percebe a queda pelas próprias falhas.
+"""
+
+
+class BancoIndisponivelError(ErrorResponse):
+    """Banco fora do ar ou circuito aberto: 503 com Retry-After (tratado pelo middleware de erros)."""
+
+    def __init__(self, detalhe: str, retry_after: int):
+        super().__init__(503, "Banco de dados indisponível", {"message": detalhe, "retry_after": retry_after})
+        self.retry_after = retry_after
+
+
+class Circuito:
+    FECHADO = "fechado"
+    ABERTO = "aberto"
+    MEIO_ABERTO = "meio_aberto"
+
+    def __init__(self, nome: str, limite_falhas: int | None = None, tempo_aberto: float | None = None):
+        """
+        :param nome: identificação nos logs (ex.: "mysql")
+        :param limite_falhas: falhas seguidas que abrem o circuito (padrão CIRCUITO_FALHAS ou 3)
+        :param tempo_aberto: segundos até testar o banco de novo (padrão CIRCUITO_ABERTO_S ou 15)
+        """
+        self.nome = nome
+        self.__limite_falhas = limite_falhas or int(os.environ.get("CIRCUITO_FALHAS", 3))
+        self.__tempo_aberto = tempo_aberto or float(os.environ.get("CIRCUITO_ABERTO_S", 15))
+        self.__trava = threading.Lock()
+        self.__estado = self.FECHADO
+        self.__falhas = 0
+        self.__aberto_ate = 0.0
+        self.__teste_desde = None  # início do teste em andamento no estado meio-aberto
+
+    @property
+    def estado(self) -> str:
+        return self.__estado
+
+    def permitir(self):
+        """
+        Chamado antes de pedir uma conexão.
+
+        :raises BancoIndisponivelError: circuito aberto (ou meio-aberto com o teste já em andamento)
+        """
+        if self.__estado == self.FECHADO:
+            return
+        with self.__trava:
+            agora = time.monotonic()
+            if self.__estado == self.ABERTO and agora >= self.__aberto_ate:
+                self.__estado = self.MEIO_ABERTO
+                self.__teste_desde = None
+            # teste sem resposta há mais de tempo_aberto (ex.: erro que não passou por aqui): novo teste
+            teste_livre = self.__teste_desde is None or agora - self.__teste_desde > self.__tempo_aberto
+            if self.__estado == self.MEIO_ABERTO and teste_livre:
+                self.__teste_desde = agora  # esta requisição é o teste
+                print(f"🟡 Circuito[{self.nome}] meio-aberto: testando o banco")
+                return
+            if self.__estado == self.FECHADO:
+                return
+            raise BancoIndisponivelError(
+                "Banco temporariamente indisponível; tente novamente em instantes.",
+                self.__segundos_restantes(agora),
+            )
+
+    def registrar_sucesso(self):
+        if self.__estado == self.FECHADO and self.__falhas == 0:
+            return
+        with self.__trava:
+            if self.__estado != self.FECHADO:
+                print(f"🟢 Circuito[{self.nome}] fechado: banco respondeu")
+            self.__estado = self.FECHADO
+            self.__falhas = 0
+            self.__teste_desde = None
+
+    def registrar_falha(self) -> int:
+        """Conta uma falha de conexão; devolve os segundos até o próximo teste (0 se continua fechado)."""
+        with self.__trava:
+            agora = time.monotonic()
+            self.__falhas += 1
+            if self.__estado == self.MEIO_ABERTO or self.__falhas >= self.__limite_falhas:
+                if self.__estado != self.ABERTO:
+                    print(f"🔴 Circuito[{self.nome}] aberto por {self.__tempo_aberto:.0f}s após {self.__falhas} falha(s)")
+                self.__estado = self.ABERTO
+                self.__aberto_ate = agora + self.__tempo_aberto
+                self.__teste_desde = None
+                return self.__segundos_restantes(agora)
+            return 0
+
+    def __segundos_restantes(self, agora: float) -> int:
+        return max(1, int(self.__aberto_ate - agora + 0.999))
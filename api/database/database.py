@@ -1,9 +1,14 @@
 import mysql.connector                # biblioteca mysql-connector-python
 from mysql.connector import pooling   # pooling serve para gerenciamento de conexões
-import sys                            # sys para manipulação de saída de erro
+import os                             # os para leitura das variáveis de ambiente
+import time                           # time para medir a espera por conexões do pool
+from api.utils.metricas import Metricas
+from api.database.circuito import Circuito, BancoIndisponivelError
 
 class DatabaseConfig:
         __pool = None
+        # prefixo usado pelo SqlExecutor para capturar planos de queries lentas
+        PREFIXO_EXPLAIN = "EXPLAIN "
 
         # cria o construtor com os parâmetros de conexão
         def __init__(
@@ -27,12 +32,51 @@ class DatabaseConfig:
                 self.password = password
                 self.database = database
                 self.port = port
+                # falhas seguidas de conexão abrem o circuito: as próximas requisições
+                # recebem 503 na hora em vez de esperar o timeout de rede
+                self.circuito = Circuito("mysql")
+                self.connection_timeout = int(os.environ.get('DB_CONNECT_TIMEOUT', 5))
         
+        @staticmethod
+        def from_env(pool_name="mypool", pool_size=10):
+                """
+                Cria a configuração de banco a partir das variáveis de ambiente.
+
+                DB_BACKEND=mysql (padrão) -> DatabaseConfig com DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT
+                DB_BACKEND=sqlite         -> SqliteDatabaseConfig com DB_SQLITE_PATH (padrão ":memory:")
+
+                Os dois expõem a mesma interface (connect/get_connection) usada pelos DAOs.
+                """
+                backend = os.environ.get('DB_BACKEND', 'mysql').lower()
+                if backend == 'sqlite':
+                        from api.database.sqliteDatabase import SqliteDatabaseConfig
+                        return SqliteDatabaseConfig(
+                                path=os.environ.get('DB_SQLITE_PATH', ':memory:'),
+                                pool_size=pool_size
+                        )
+
+                return DatabaseConfig(
+                        pool_name=pool_name,
+                        pool_size=pool_size,
+                        host=os.environ.get('DB_HOST', '127.0.0.1'),
+                        user=os.environ.get('DB_USER', 'root'),
+                        password=os.environ.get('DB_PASSWORD', '85252317b'),
+                        database=os.environ.get('DB_NAME', 'casa_branca'),
+                        port=int(os.environ.get('DB_PORT', 3306))
+                )
+
         # método para conectar ao banco de dados
         def connect(self):
+                """
+                Cria o pool na primeira chamada (e testa uma conexão).
+
+                Se o MySQL estiver fora do ar o servidor sobe mesmo assim: a falha é
+                contada no circuito, BancoIndisponivelError é lançado e a próxima
+                get_connection tenta criar o pool de novo.
+                """
                 if DatabaseConfig.__pool is None: # se ainda não for estabelecida uma conexão, cria uma nova
                         try:
-                            DatabaseConfig.__pool = mysql.connector.pooling.MySQLConnectionPool(
+                            pool = mysql.connector.pooling.MySQLConnectionPool(
                                 pool_name=self.pool_name,
                                 pool_size=self.pool_size,
                                 pool_reset_session=self.pool_reset_session,
@@ -41,16 +85,48 @@ class DatabaseConfig:
                                 password=self.password,
                                 database=self.database,
                                 port=self.port,
-                                auth_plugin='mysql_native_password'
+                                auth_plugin='mysql_native_password',
+                                connection_timeout=self.connection_timeout
                             )
-                            conn = DatabaseConfig.__pool.get_connection()  # testa a conexão
+                            conn = pool.get_connection()  # testa a conexão
                             print("⬆️  Conectado ao MySQL com sucesso!")
-                            conn.close()                                   # Libera a conexão de teste
+                            conn.close()                  # Libera a conexão de teste
+                            DatabaseConfig.__pool = pool
                         except mysql.connector.Error as err:
                             print(f"❌ Falha ao conectar ao MySQL: {err}")
-                            sys.exit(1)
+                            raise BancoIndisponivelError(str(err), self.circuito.registrar_falha() or 1) from err
                 return DatabaseConfig.__pool
             
         def get_connection(self):
+            # circuito aberto: falha na hora, sem tocar no pool nem na rede
+            self.circuito.permitir()
             pool = self.connect()
-            return pool.get_connection()
\ No newline at end of file
+            inicio = time.perf_counter()
+            try:
+                conexao = pool.get_connection()
+            except mysql.connector.errors.PoolError:
+                raise  # pool esgotado não é queda do banco
+            except mysql.connector.Error as err:
+                print(f"❌ Falha ao obter conexão do MySQL: {err}")
+                raise BancoIndisponivelError(str(err), self.circuito.registrar_falha() or 1) from err
+            Metricas.registrar_espera_pool(time.perf_counter() - inicio)
+            self.circuito.registrar_sucesso()
+            return conexao
+
+        def falha_de_conexao(self, erro: Exception) -> BancoIndisponivelError | None:
+            """
+            Chamado pelo SqlExecutor quando execute/commit falha: queda da conexão
+            (erros de cliente 2xxx, ex.: 2006 server gone away, 2013 lost connection)
+            conta no circuito e vira BancoIndisponivelError; erros de SQL, deadlock e
+            lock wait timeout devolvem None e seguem como estão.
+            """
+            if not isinstance(erro, mysql.connector.Error) or isinstance(erro, mysql.connector.errors.PoolError):
+                return None
+            errno = getattr(erro, "errno", None)
+            queda = (errno is not None and 2000 <= errno < 3000) or (
+                errno is None and isinstance(erro, mysql.connector.errors.InterfaceError)
+            )
+            if not queda:
+                return None
+            print(f"❌ Conexão com o MySQL perdida: {erro}")
+            return BancoIndisponivelError(str(erro), self.circuito.registrar_falha() or 1)
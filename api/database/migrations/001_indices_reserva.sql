@@ -0,0 +1,13 @@
+-- Migração 001: índices para os filtros de GET /api/v1/reservas (ReservaDAO.findByFiltro)
+-- e para a verificação de sobreposição (busca por idChale).
+-- Aplicar uma vez no MySQL: mysql casa_branca < api/database/migrations/001_indices_reserva.sql
+
+-- idChale = ? [AND inicio/fim em faixa]  (filtro por chalé e verificação de sobreposição)
+CREATE INDEX idx_reserva_chale_inicio ON reserva (idChale, inicio, fim);
+
+-- idInquilino = ? [AND inicio em faixa]
+CREATE INDEX idx_reserva_inquilino_inicio ON reserva (idInquilino, inicio);
+
+-- faixas de datas sem chalé/inquilino (inicio_de/inicio_ate, fim_de/fim_ate) e ordem=inicio|fim
+CREATE INDEX idx_reserva_inicio ON reserva (inicio);
+CREATE INDEX idx_reserva_fim ON reserva (fim);
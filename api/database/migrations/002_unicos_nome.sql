@@ -0,0 +1,11 @@
+-- Migração 002: nome único em chale e inquilino.
+-- Substitui a verificação "findByField + create" dos services: o próprio INSERT/UPDATE
+-- falha com chave duplicada (errno 1062), convertida em ErrorResponse(400) pelo service.
+-- Aplicar uma vez no MySQL: mysql casa_branca < api/database/migrations/002_unicos_nome.sql
+
+-- Antes de aplicar, conferir se já existem nomes repetidos (a migração falha se houver):
+--   SELECT nome, COUNT(*) FROM chale GROUP BY nome HAVING COUNT(*) > 1;
+--   SELECT nome, COUNT(*) FROM inquilino GROUP BY nome HAVING COUNT(*) > 1;
+
+ALTER TABLE chale ADD CONSTRAINT uq_chale_nome UNIQUE (nome);
+ALTER TABLE inquilino ADD CONSTRAINT uq_inquilino_nome UNIQUE (nome);
@@ -0,0 +1,7 @@
+-- Migração 003: data de criação da reserva (antecedência da reserva nos relatórios).
+-- Aplicar uma vez no MySQL: mysql casa_branca < api/database/migrations/003_reserva_criado_em.sql
+
+-- Reservas já existentes ficam com criado_em NULL (data real desconhecida) e são
+-- ignoradas no cálculo de antecedência; as novas recebem o horário do INSERT.
+ALTER TABLE reserva ADD COLUMN criado_em DATETIME NULL;
+ALTER TABLE reserva MODIFY COLUMN criado_em DATETIME NULL DEFAULT CURRENT_TIMESTAMP;
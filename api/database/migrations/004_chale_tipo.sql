@@ -0,0 +1,15 @@
+-- Migração 004: tipo do chalé (romantico, familiar, premium...) para a alocação automática
+-- das reservas públicas (CatalogoChales + ReservaPublicaService).
+-- Aplicar uma vez no MySQL: mysql casa_branca < api/database/migrations/004_chale_tipo.sql
+
+ALTER TABLE chale ADD COLUMN tipo VARCHAR(30) NULL;
+
+-- tipo = ? AND capacidade >= ?  (candidatos de um tipo, do menor para o maior)
+CREATE INDEX idx_chale_tipo_capacidade ON chale (tipo, capacidade);
+
+-- Backfill pelo nome do chalé (sem depender de ids de um ambiente específico);
+-- chalés que não casam com nenhum padrão ficam sem tipo e recebem o tipo pelo
+-- PUT /api/v1/chales/<id>. Conferir depois com: SELECT idChale, nome, tipo FROM chale;
+UPDATE chale SET tipo = 'romantico' WHERE tipo IS NULL AND LOWER(nome) LIKE '%rom_ntic%';
+UPDATE chale SET tipo = 'familiar' WHERE tipo IS NULL AND LOWER(nome) LIKE '%famil%';
+UPDATE chale SET tipo = 'premium' WHERE tipo IS NULL AND (LOWER(nome) LIKE '%premium%' OR LOWER(nome) LIKE '%su_te%');
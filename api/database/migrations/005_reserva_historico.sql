@@ -0,0 +1,23 @@
+-- Migração 005: tabela fria de reservas encerradas (ArquivoReservas).
+-- Aplicar uma vez no MySQL: mysql casa_branca < api/database/migrations/005_reserva_historico.sql
+
+-- Mesmas colunas de reserva; o idReserva original é mantido (sem AUTO_INCREMENT),
+-- então GET /reservas/<id> e os relatórios continuam encontrando a reserva arquivada.
+-- A tabela quente (reserva) fica só com as reservas em andamento, futuras e as
+-- encerradas há menos de ARQUIVO_IDADE_DIAS: verificação de sobreposição,
+-- disponibilidade e listagens sem filtro de data não leem o histórico.
+CREATE TABLE reserva_historico (
+    idReserva    INT NOT NULL PRIMARY KEY,
+    idInquilino  INT NOT NULL,
+    idChale      INT NOT NULL,
+    inicio       DATE NOT NULL,
+    fim          DATE NOT NULL,
+    criado_em    DATETIME NULL,
+    arquivado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- mesmos filtros de GET /api/v1/reservas (ReservaDAO.findByFiltro com filtro de data)
+CREATE INDEX idx_reserva_historico_chale_inicio ON reserva_historico (idChale, inicio, fim);
+CREATE INDEX idx_reserva_historico_inquilino_inicio ON reserva_historico (idInquilino, inicio);
+CREATE INDEX idx_reserva_historico_inicio ON reserva_historico (inicio);
+CREATE INDEX idx_reserva_historico_fim ON reserva_historico (fim);
@@ -0,0 +1,79 @@
+-- Esquema do banco casa_branca para o backend SQLite (testes, benchmarks e desenvolvimento local).
+-- Espelha as tabelas do MySQL usadas pelos DAOs. Aplicado por SqliteDatabaseConfig.connect().
+
+CREATE TABLE IF NOT EXISTS chale (
+    idChale     INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome        VARCHAR(100) NOT NULL,
+    capacidade  INTEGER NOT NULL,
+    tipo        VARCHAR(30)  -- migrations/004_chale_tipo.sql
+);
+
+CREATE TABLE IF NOT EXISTS inquilino (
+    idInquilino INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome        VARCHAR(100) NOT NULL,
+    email       VARCHAR(100),
+    telefone    VARCHAR(20),
+    requisicao  TEXT,
+    cpf         VARCHAR(14)
+);
+
+CREATE TABLE IF NOT EXISTS reserva (
+    idReserva   INTEGER PRIMARY KEY AUTOINCREMENT,
+    idInquilino INTEGER NOT NULL REFERENCES inquilino (idInquilino),
+    idChale     INTEGER NOT NULL REFERENCES chale (idChale),
+    inicio      DATE NOT NULL,
+    fim         DATE NOT NULL,
+    criado_em   DATETIME DEFAULT CURRENT_TIMESTAMP  -- migrations/003_reserva_criado_em.sql
+);
+
+-- Índices da migração migrations/001_indices_reserva.sql
+CREATE INDEX IF NOT EXISTS idx_reserva_chale_inicio ON reserva (idChale, inicio, fim);
+CREATE INDEX IF NOT EXISTS idx_reserva_inquilino_inicio ON reserva (idInquilino, inicio);
+CREATE INDEX IF NOT EXISTS idx_reserva_inicio ON reserva (inicio);
+CREATE INDEX IF NOT EXISTS idx_reserva_fim ON reserva (fim);
+
+-- Tabela fria da migração migrations/005_reserva_historico.sql
+CREATE TABLE IF NOT EXISTS reserva_historico (
+    idReserva    INTEGER PRIMARY KEY,
+    idInquilino  INTEGER NOT NULL,
+    idChale      INTEGER NOT NULL,
+    inicio       DATE NOT NULL,
+    fim          DATE NOT NULL,
+    criado_em    DATETIME,
+    arquivado_em DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_reserva_historico_chale_inicio ON reserva_historico (idChale, inicio, fim);
+CREATE INDEX IF NOT EXISTS idx_reserva_historico_inquilino_inicio ON reserva_historico (idInquilino, inicio);
+CREATE INDEX IF NOT EXISTS idx_reserva_historico_inicio ON reserva_historico (inicio);
+CREATE INDEX IF NOT EXISTS idx_reserva_historico_fim ON reserva_historico (fim);
+
+-- Restrições da migração migrations/002_unicos_nome.sql
+CREATE UNIQUE INDEX IF NOT EXISTS uq_chale_nome ON chale (nome);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_inquilino_nome ON inquilino (nome);
+
+-- Índice da migração migrations/004_chale_tipo.sql
+CREATE INDEX IF NOT EXISTS idx_chale_tipo_capacidade ON chale (tipo, capacidade);
+
+CREATE TABLE IF NOT EXISTS usuarios (
+    idUsuario   INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome        VARCHAR(100) NOT NULL,
+    email       VARCHAR(100) NOT NULL UNIQUE,
+    senha       VARCHAR(255) NOT NULL,
+    role        VARCHAR(20) NOT NULL,
+    ativo       BOOLEAN NOT NULL DEFAULT 1
+);
+
+-- Usuário de desenvolvimento (mesmas credenciais do fallback de AuthRoteador).
+-- Existe apenas no banco SQLite local, nunca no MySQL.
+INSERT OR IGNORE INTO usuarios (idUsuario, nome, email, senha, role, ativo)
+VALUES (1, 'Administrador', 'admin@casabranca.com', 'admin123', 'admin', 1);
+
+-- Inquilino usado pelas reservas do site (ReservaPublicaService.ID_INQUILINO_PUBLICO)
+-- e um chalé de cada tipo oferecido no formulário (alocação por CatalogoChales).
+-- Também apenas no SQLite local: no MySQL esses registros já existem.
+INSERT OR IGNORE INTO inquilino (idInquilino, nome, email, telefone, requisicao, cpf)
+VALUES (999, 'Reserva pelo site', 'reservas@casabranca.com', NULL, 'Inquilino genérico das reservas públicas', NULL);
+INSERT OR IGNORE INTO chale (nome, capacidade, tipo) VALUES
+    ('Chalé Romântico', 2, 'romantico'),
+    ('Chalé Familiar', 6, 'familiar'),
+    ('Suíte Premium', 4, 'premium');
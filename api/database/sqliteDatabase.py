@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from api.utils.metricas import Metricas
+
+"""
+Backend SQLite com a mesma interface de DatabaseConfig.
+
+Objetivo:
+- Permitir que ChaleDAO, InquilinoDAO, ReservaDAO e UsuarioDAO rodem sem um
+  MySQL (testes herméticos, benchmarks e desenvolvimento local).
+- Os DAOs continuam os mesmos: get_connection() devolve uma conexão que aceita
+  "with", cursor(dictionary=True), placeholders %s, commit(), lastrowid e rowcount,
+  exatamente como as conexões do pool do mysql-connector.
+
+Seleção via ambiente (ver DatabaseConfig.from_env):
+    DB_BACKEND=sqlite
+    DB_SQLITE_PATH=:memory:        (ou caminho de arquivo, ex.: api/system/casa_branca.db)
+"""
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "schema_sqlite.sql")
+
+# Datas voltam como date/datetime, como no mysql-connector
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda valor: valor.isoformat(sep=" "))
+sqlite3.register_converter("DATE", lambda valor: date.fromisoformat(valor.decode()))
+sqlite3.register_converter("DATETIME", lambda valor: datetime.fromisoformat(valor.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda valor: datetime.fromisoformat(valor.decode()))
+
+
+@lru_cache(maxsize=512)
+def traduzir_sql(sql: str) -> str:
+    """Converte os placeholders do MySQL (%s) para os do SQLite (?)."""
+    return sql.replace("%s", "?")
+
+
+class SqliteCursor:
+    """Cursor compatível com o uso feito pelos DAOs (dictionary=True, with, lastrowid)."""
+
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False):
+        self.__cursor = cursor
+        self.__dictionary = dictionary
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def execute(self, sql: str, params=()):
+        self.__cursor.execute(traduzir_sql(sql), params or ())
+        return self
+
+    def executemany(self, sql: str, seq_params):
+        self.__cursor.executemany(traduzir_sql(sql), seq_params)
+        return self
+
+    def __linha(self, linha):
+        if linha is None or not self.__dictionary:
+            return linha
+        return dict(zip(self.column_names, linha))
+
+    def fetchone(self):
+        return self.__linha(self.__cursor.fetchone())
+
+    def fetchmany(self, size: int = 1):
+        return [self.__linha(linha) for linha in self.__cursor.fetchmany(size)]
+
+    def fetchall(self):
+        linhas = self.__cursor.fetchall()
+        if not self.__dictionary:
+            return linhas
+        colunas = self.column_names
+        return [dict(zip(colunas, linha)) for linha in linhas]
+
+    def __iter__(self):
+        return (self.__linha(linha) for linha in self.__cursor)
+
+    @property
+    def column_names(self) -> tuple:
+        descricao = self.__cursor.description or ()
+        return tuple(coluna[0] for coluna in descricao)
+
+    @property
+    def lastrowid(self):
+        return self.__cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self.__cursor.rowcount
+
+    def close(self):
+        self.__cursor.close()
+
+
+class SqliteConnection:
+    """
+    Conexão emprestada do SqliteDatabaseConfig.
+
+    Como no pool do MySQL, sair do bloco "with" (ou chamar close) devolve a
+    conexão ao pool; transações não confirmadas são desfeitas.
+    """
+
+    def __init__(self, conexao: sqlite3.Connection, devolver):
+        self.__conexao = conexao
+        self.__devolver = devolver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def cursor(self, dictionary: bool = False, **kwargs) -> SqliteCursor:
+        # kwargs aceita opções do mysql-connector sem efeito no SQLite (ex.: buffered)
+        return SqliteCursor(self.__conexao.cursor(), dictionary)
+
+    def commit(self):
+        self.__conexao.commit()
+
+    def rollback(self):
+        self.__conexao.rollback()
+
+    def close(self):
+        if self.__devolver is None:
+            return
+        devolver, self.__devolver = self.__devolver, None
+        if self.__conexao.in_transaction:
+            self.__conexao.rollback()
+        devolver(self.__conexao)
+
+
+class SqliteDatabaseConfig:
+    """
+    Pool de conexões SQLite com a interface de DatabaseConfig (connect/get_connection).
+
+    - ":memory:" usa uma única conexão compartilhada, serializada por uma trava
+      (cada conexão :memory: seria um banco diferente).
+    - Arquivo usa um pool de até pool_size conexões em modo WAL.
+    """
+
+    # prefixo usado pelo SqlExecutor para capturar planos de queries lentas
+    PREFIXO_EXPLAIN = "EXPLAIN QUERY PLAN "
+
+    def __init__(self, path: str = ":memory:", pool_size: int = 10, schema_path: str = SCHEMA_PATH):
+        self.path = path
+        self.pool_size = pool_size
+        self.schema_path = schema_path
+        self.__memoria = path == ":memory:"
+        self.__pool = queue.LifoQueue(maxsize=pool_size)
+        self.__criadas = 0
+        self.__trava = threading.Lock()
+        self.__conexao_memoria = None
+        self.__trava_memoria = threading.RLock()
+        self.__pronto = False
+
+    def __nova_conexao(self) -> sqlite3.Connection:
+        conexao = sqlite3.connect(
+            self.path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            timeout=30,
+        )
+        conexao.execute("PRAGMA foreign_keys = ON")
+        if not self.__memoria:
+            conexao.execute("PRAGMA journal_mode = WAL")
+            conexao.execute("PRAGMA synchronous = NORMAL")
+        return conexao
+
+    # método para conectar ao banco de dados (cria o esquema na primeira vez)
+    def connect(self):
+        with self.__trava:
+            if self.__pronto:
+                return self
+
+            conexao = self.__nova_conexao()
+            with open(self.schema_path, encoding="utf-8") as f:
+                conexao.executescript(f.read())
+            conexao.commit()
+
+            if self.__memoria:
+                self.__conexao_memoria = conexao
+            else:
+                self.__pool.put(conexao)
+                self.__criadas = 1
+
+            self.__pronto = True
+            print(f"⬆️  Conectado ao SQLite ({self.path}) com sucesso!")
+        return self
+
+    def get_connection(self) -> SqliteConnection:
+        self.connect()
+        inicio = time.perf_counter()
+
+        if self.__memoria:
+            self.__trava_memoria.acquire()
+            Metricas.registrar_espera_pool(time.perf_counter() - inicio)
+            return SqliteConnection(self.__conexao_memoria, lambda _c: self.__trava_memoria.release())
+
+        try:
+            conexao = self.__pool.get_nowait()
+        except queue.Empty:
+            with self.__trava:
+                criar = self.__criadas < self.pool_size
+                if criar:
+                    self.__criadas += 1
+            conexao = self.__nova_conexao() if criar else self.__pool.get()
+
+        Metricas.registrar_espera_pool(time.perf_counter() - inicio)
+        return SqliteConnection(conexao, self.__pool.put)
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import os
 import jwt
 import time
 import secrets
@@ -14,6 +15,8 @@ class MeuTokenJWT:
         self._aud = "http://localhost"
         self._sub = "acesso_sistema"
         self._duracao_token = 3600  # 1 hora (recomendado ao invés de 60 dias!)
+        self._sub_ticket_eventos = "eventos_reservas"
+        self._duracao_ticket_eventos = int(os.environ.get("SSE_TICKET_DURACAO", 60))  # segundos
         self._payload = None
         self._error_message = None
 
@@ -45,11 +48,44 @@ class MeuTokenJWT:
         token = jwt.encode(payload, self._key, algorithm=self._alg)
         return token
 
-    def validar_token(self, token: str) -> bool:
+    def gerar_ticket_eventos(self, claims: dict) -> str:
+        """
+        Gera um ticket de curta duração que só serve para abrir o stream SSE de reservas
+        
+        :param claims: dict - Dados do usuário (os mesmos do token de acesso)
+        :return: str - Token JWT com sub próprio, recusado nas demais rotas
+        """
+        payload = {
+            "iss": self._iss,
+            "aud": self._aud,
+            "sub": self._sub_ticket_eventos,
+            "iat": int(time.time()),
+            "exp": int(time.time()) + self._duracao_ticket_eventos,
+            "nbf": int(time.time()),
+            "jti": secrets.token_hex(16),
+            **{chave: valor for chave, valor in claims.items() if chave in ("user_id", "email", "role", "name")}
+        }
+        return jwt.encode(payload, self._key, algorithm=self._alg)
+
+    @property
+    def duracao_ticket_eventos(self) -> int:
+        return self._duracao_ticket_eventos
+
+    def validar_ticket_eventos(self, ticket: str) -> bool:
+        """
+        Valida um ticket gerado por gerar_ticket_eventos
+        
+        :param ticket: str - Ticket recebido em ?ticket=
+        :return: bool - True se válido, False caso contrário
+        """
+        return self.validar_token(ticket, self._sub_ticket_eventos)
+
+    def validar_token(self, token: str, sub: str | None = None) -> bool:
         """
         Valida um token JWT
         
         :param token: str - Token JWT (pode incluir "Bearer ")
+        :param sub: str - Finalidade esperada (padrão: token de acesso)
         :return: bool - True se válido, False caso contrário
         """
         if not token:
@@ -68,6 +104,11 @@ class MeuTokenJWT:
                 audience=self._aud, 
                 issuer=self._iss
             )
+            if decoded.get("sub") != (sub or self._sub):
+                # ticket do SSE não vale como token de acesso (e vice-versa)
+                print("❌ Finalidade do token inválida")
+                self._error_message = "Token inválido - finalidade incorreta"
+                return False
             self._payload = decoded
             self._error_message = None
             print("✅ Token válido")
@@ -1,4 +1,17 @@
+from api.modelo import validadores
+
 class Chale:
+    # __slots__ evita o __dict__ por instância (objetos menores e acesso mais rápido)
+    __slots__ = ("__idChale", "__nome", "__capacidade", "__tipo")
+
+    # (atributo, chaves aceitas no dict, obrigatório) -> usado por validate_many()
+    CAMPOS_LOTE = (
+        ("idChale", ("idChale",), False),
+        ("nome", ("nome",), True),
+        ("capacidade", ("capacidade",), True),
+        ("tipo", ("tipo",), False),
+    )
+
     def __init__(self):
         """
         Inicializa todos os atributos como atributos de instância.
@@ -7,7 +20,28 @@ class Chale:
         self.__idChale = None
         self.__nome = None
         self.__capacidade = None
-    
+        self.__tipo = None
+
+    @classmethod
+    def validate_many(cls, linhas: list[dict]) -> tuple[list, list[dict]]:
+        """
+        Valida várias linhas de uma vez, coletando os erros por linha.
+
+        :param linhas: list[dict] - Dados de chalés {"idChale", "nome", "capacidade", "tipo"}
+        :return: (list[Chale] válidos, [{"linha": i, "erros": [...]}])
+        """
+        return validadores.validar_lote(cls, linhas)
+
+    @classmethod
+    def from_dict(cls, dados: dict) -> tuple["Chale", list[str]]:
+        """
+        Valida um único dict em uma passada, coletando todos os erros.
+
+        :param dados: dict - Dados {"idChale", "nome", "capacidade", "tipo"}
+        :return: (Chale validado ou None, lista de erros)
+        """
+        return validadores.validar_objeto(cls, dados)
+
     @property
     def idChale(self):
         """
@@ -16,16 +50,8 @@ class Chale:
         """
         return self.__idChale
     @idChale.setter
-    def idChale(self, valor):   
-        try:
-            parsed = int(valor)
-        except (ValueError, TypeError):
-            raise ValueError("idInquilino deve ser um número inteiro.")
-
-        if parsed <= 0:
-            raise ValueError("idInquilino deve ser um número inteiro positivo.")
-
-        self.__idChale = parsed
+    def idChale(self, valor):
+        self.__idChale = validadores.inteiro_positivo(valor, "idChale")
 
     @property
     def nome(self):
@@ -36,27 +62,24 @@ class Chale:
         return self.__nome
     @nome.setter
     def nome(self, value):
-        if not isinstance(value, str):
-            raise ValueError("nomeInquilino deve ser uma string.")
-
-        nome = value.strip()
-
-        if len(nome) < 3:
-            raise ValueError("nomeInquilino deve ter pelo menos 3 caracteres.")
-        self.__nome = nome
+        self.__nome = validadores.texto_minimo(value, "nome")
 
     @property
     def capacidade(self):
         return self.__capacidade
-    
+
     @capacidade.setter
     def capacidade(self, valor):
-        try:
-            capacidade = int(valor)
-        except (ValueError, TypeError):
-            raise ValueError("capacidade deve ser um número inteiro.")
+        self.__capacidade = validadores.inteiro_positivo(valor, "capacidade")
 
-        if capacidade <= 0:
-            raise ValueError("capacidade deve ser um número inteiro positivo.")
+    @property
+    def tipo(self):
+        """
+        Getter para tipo
+        :return: str | None - Tipo do chalé em minúsculas (ex.: "romantico"); usado na alocação das reservas públicas
+        """
+        return self.__tipo
 
-        self.__capacidade = capacidade
\ No newline at end of file
+    @tipo.setter
+    def tipo(self, valor):
+        self.__tipo = None if valor is None else validadores.texto_minimo(valor, "tipo").lower()
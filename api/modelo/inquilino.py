@@ -1,12 +1,27 @@
-import re
+from api.modelo import validadores
 """
 Representa a entidade Inquilino do sistema.
 
 Objetivo:
 - Encapsular os dados de um inquilino.
 - Garantir integridade dos atributos via getters e setters.
+- Validar lotes de inquilinos de uma vez via validate_many().
 """
 class Inquilino:
+    # __slots__ evita o __dict__ por instância (objetos menores e acesso mais rápido)
+    __slots__ = ("__idInquilino", "__nomeInquilino", "__email", "__telefone", "__requisicao", "__cpf")
+
+    # (atributo, chaves aceitas no dict, obrigatório) -> usado por validate_many()
+    # "nome" é aceito como alternativa a "nomeInquilino" (nome da coluna no banco)
+    CAMPOS_LOTE = (
+        ("idInquilino", ("idInquilino",), False),
+        ("nomeInquilino", ("nomeInquilino", "nome"), True),
+        ("email", ("email",), True),
+        ("telefone", ("telefone",), True),
+        ("requisicao", ("requisicao",), False),
+        ("cpf", ("cpf",), True),
+    )
+
     def __init__(self):
         """
         Inicializa todos os atributos como atributos de instância.
@@ -19,6 +34,31 @@ class Inquilino:
         self.__requisicao = None
         self.__cpf = None
 
+    @classmethod
+    def validate_many(cls, linhas: list[dict]) -> tuple[list, list[dict]]:
+        """
+        Valida várias linhas de uma vez, coletando os erros por linha.
+
+        :param linhas: list[dict] - Dados de inquilinos {"nomeInquilino", "email", "telefone", "requisicao", "cpf"}
+        :return: (list[Inquilino] válidos, [{"linha": i, "erros": [...]}])
+
+        Exemplo:
+        >>> validos, erros = Inquilino.validate_many([{"nomeInquilino": "Jo"}])
+        >>> erros[0]["linha"]
+        0
+        """
+        return validadores.validar_lote(cls, linhas)
+
+    @classmethod
+    def from_dict(cls, dados: dict) -> tuple["Inquilino", list[str]]:
+        """
+        Valida um único dict em uma passada, coletando todos os erros.
+
+        :param dados: dict - Dados {"nomeInquilino", "email", "telefone", "requisicao", "cpf"}
+        :return: (Inquilino validado ou None, lista de erros)
+        """
+        return validadores.validar_objeto(cls, dados)
+
     @property
     def idInquilino(self):
         """
@@ -42,15 +82,7 @@ class Inquilino:
         >>> f.idInquilino = 10   # ✅ válido
         >>> f.idInquilino = -5   # ❌ lança erro
         """
-        try:
-            parsed = int(valor)
-        except (ValueError, TypeError):
-            raise ValueError("idInquilino deve ser um número inteiro.")
-
-        if parsed <= 0:
-            raise ValueError("idInquilino deve ser um número inteiro positivo.")
-
-        self.__idInquilino = parsed
+        self.__idInquilino = validadores.inteiro_positivo(valor, "idInquilino")
 
     @property
     def nomeInquilino(self):
@@ -74,15 +106,7 @@ class Inquilino:
         >>> f = Inquilino()
         >>> f.nomeInquilino = "João Silva"  # ✅ válido
         """
-        if not isinstance(value, str):
-            raise ValueError("nomeInquilino deve ser uma string.")
-
-        nome = value.strip()
-
-        if len(nome) < 3:
-            raise ValueError("nomeInquilino deve ter pelo menos 3 caracteres.")
-
-        self.__nomeInquilino = nome
+        self.__nomeInquilino = validadores.texto_minimo(value, "nomeInquilino")
 
     @property
     def email(self):
@@ -102,20 +126,7 @@ class Inquilino:
         :param value: str - Email do funcionário.
         :raises ValueError: se inválido.
         """
-        if not isinstance(value, str):
-            raise ValueError("email deve ser uma string.")
-
-        email_trimmed = value.strip()
-
-        if email_trimmed == "":
-            raise ValueError("email não pode ser vazio.")
-
-        import re
-        email_regex = r"^[^\s@]+@[^\s@]+\.[^\s@]+$"
-        if not re.match(email_regex, email_trimmed):
-            raise ValueError("email em formato inválido.")
-
-        self.__email = email_trimmed
+        self.__email = validadores.email(value)
 
     @property
     def telefone(self):
@@ -127,31 +138,11 @@ class Inquilino:
 
     @telefone.setter
     def telefone(self, value):
-        def validar_telefone(telefone):
-            # Remove caracteres especiais e espaços
-            numero = re.sub(r'[^0-9]', '', telefone)
-            
-            # Verifica o comprimento
-            if len(numero) not in [10, 11]:
-                return False
-                
-            # Verifica DDD (11-99)
-            ddd = int(numero[:2])
-            if ddd < 11 or ddd > 99:
-                return False
-                
-            # Se for celular (11 dígitos), verifica se começa com 9
-            if len(numero) == 11 and numero[2] != '9':
-                return False
-                
-            return True
-        
-        if not validar_telefone(value):
-            raise ValueError("telefone em formato inválido.")
-
         if not isinstance(value, str):
             raise ValueError("telefone deve ser uma string.")
 
+        if not validadores.telefone_valido(value):
+            raise ValueError("telefone em formato inválido.")
 
         self.__telefone = value
 
@@ -165,30 +156,16 @@ class Inquilino:
 
     @requisicao.setter
     def requisicao(self, value):
-    
+
         self.__requisicao = value
 
     @property
     def cpf(self):
         return self.__cpf
-    
+
     @cpf.setter
     def cpf(self, value):
-        def validar_cpf(cpf):
-            cpf = re.sub(r'[^0-9]', '', cpf)
-
-            if len(cpf) != 11 or cpf == cpf[0] * 11:
-                return False
-
-            for i in range(9, 11):
-                soma = sum(int(cpf[j]) * (i + 1 - j) for j in range(0, i))
-                digito = (soma * 10 % 11) % 10
-                if digito != int(cpf[i]):
-                    return False
-
-            return True
-
-        if not validar_cpf(value):
+        if not validadores.cpf_valido(value):
             raise ValueError("CPF em formato inválido.")
 
-        self.__cpf = value
\ No newline at end of file
+        self.__cpf = value
@@ -1,8 +1,22 @@
 from api.modelo.inquilino import Inquilino
 from api.modelo.chale import Chale
-from datetime import datetime, date
+from api.modelo import validadores
+from datetime import date
 
 class Reserva:
+    # __slots__ evita o __dict__ por instância (objetos menores e acesso mais rápido)
+    __slots__ = ("__idReserva", "__idInquilino", "__idChale", "__inicio", "__fim")
+
+    # (atributo, chaves aceitas no dict, obrigatório) -> usado por validate_many()
+    # A ordem importa: "inicio" é definido antes de "fim" (regra de ordem cronológica)
+    CAMPOS_LOTE = (
+        ("idReserva", ("idReserva",), False),
+        ("idInquilino", ("idInquilino",), True),
+        ("idChale", ("idChale",), True),
+        ("inicio", ("inicio",), True),
+        ("fim", ("fim",), True),
+    )
+
     def __init__(self):
         self.__idReserva = None
         self.__idInquilino = None
@@ -10,21 +24,33 @@ class Reserva:
         self.__inicio = None
         self.__fim = None
 
+    @classmethod
+    def validate_many(cls, linhas: list[dict]) -> tuple[list, list[dict]]:
+        """
+        Valida várias linhas de uma vez, coletando os erros por linha.
+
+        :param linhas: list[dict] - Dados de reservas {"idInquilino", "idChale", "inicio", "fim"}
+        :return: (list[Reserva] válidas, [{"linha": i, "erros": [...]}])
+        """
+        return validadores.validar_lote(cls, linhas)
+
+    @classmethod
+    def from_dict(cls, dados: dict) -> tuple["Reserva", list[str]]:
+        """
+        Valida um único dict em uma passada, coletando todos os erros.
+
+        :param dados: dict - Dados {"idInquilino", "idChale", "inicio", "fim"}
+        :return: (Reserva validado ou None, lista de erros)
+        """
+        return validadores.validar_objeto(cls, dados)
+
     @property
     def idReserva(self):
         return self.__idReserva
 
     @idReserva.setter
     def idReserva(self, value):
-        try:
-            id_val = int(value)
-        except (ValueError, TypeError):
-            raise ValueError("idReserva deve ser um número inteiro.")
-
-        if id_val <= 0:
-            raise ValueError("idReserva deve ser um número inteiro positivo.")
-
-        self.__idReserva = id_val
+        self.__idReserva = validadores.inteiro_positivo(value, "idReserva")
 
     @property
     def idInquilino(self):
@@ -32,15 +58,7 @@ class Reserva:
 
     @idInquilino.setter
     def idInquilino(self, value):
-        try:
-            id_val = int(value)
-        except (ValueError, TypeError):
-            raise ValueError("idInquilino deve ser um número inteiro.")
-
-        if id_val <= 0:
-            raise ValueError("idInquilino deve ser um número inteiro positivo.")
-
-        self.__idInquilino = id_val
+        self.__idInquilino = validadores.inteiro_positivo(value, "idInquilino")
 
     @property
     def idChale(self):
@@ -48,15 +66,7 @@ class Reserva:
 
     @idChale.setter
     def idChale(self, value):
-        try:
-            id_val = int(value)
-        except (ValueError, TypeError):
-            raise ValueError("idChale deve ser um número inteiro.")
-
-        if id_val <= 0:
-            raise ValueError("idChale deve ser um número inteiro positivo.")
-
-        self.__idChale = id_val
+        self.__idChale = validadores.inteiro_positivo(value, "idChale")
 
     @property
     def inicio(self):
@@ -123,31 +133,13 @@ class Reserva:
     def __converter_para_date(self, valor):
         """
         Método auxiliar para converter string para date
-        
+
         Aceita:
         - Objeto date (retorna diretamente)
         - String no formato YYYY-MM-DD
         - String no formato DD/MM/YYYY
         """
-        if isinstance(valor, date):
-            return valor
-        
-        if not isinstance(valor, str):
-            return None
-        
-        # Tenta formato YYYY-MM-DD (padrão ISO/banco de dados)
-        try:
-            return datetime.strptime(valor, '%Y-%m-%d').date()
-        except ValueError:
-            pass
-        
-        # Tenta formato DD/MM/YYYY (comum no Brasil)
-        try:
-            return datetime.strptime(valor, '%d/%m/%Y').date()
-        except ValueError:
-            pass
-        
-        return None
+        return validadores.para_date(valor)
 
     def validar_periodo_reserva(self):
         """
@@ -1,7 +1,22 @@
-import re
+from api.modelo import validadores
 
 class Usuario:
-    def init(self):
+    # __slots__ evita o __dict__ por instância (objetos menores e acesso mais rápido)
+    __slots__ = ("__idUsuario", "__nome", "__email", "__senha", "__role", "__ativo")
+
+    ROLES_VALIDAS = ('admin', 'funcionario', 'gerente')
+
+    # (atributo, chaves aceitas no dict, obrigatório) -> usado por validate_many()
+    CAMPOS_LOTE = (
+        ("idUsuario", ("idUsuario",), False),
+        ("nome", ("nome",), True),
+        ("email", ("email",), True),
+        ("senha", ("senha",), True),
+        ("role", ("role",), True),
+        ("ativo", ("ativo",), False),
+    )
+
+    def __init__(self):
         """
         Inicializa todos os atributos como atributos de instância.
         """
@@ -13,21 +28,33 @@ class Usuario:
         self.__role = None
         self.__ativo = True
 
+    @classmethod
+    def validate_many(cls, linhas: list[dict]) -> tuple[list, list[dict]]:
+        """
+        Valida várias linhas de uma vez, coletando os erros por linha.
+
+        :param linhas: list[dict] - Dados de usuários {"nome", "email", "senha", "role", "ativo"}
+        :return: (list[Usuario] válidos, [{"linha": i, "erros": [...]}])
+        """
+        return validadores.validar_lote(cls, linhas)
+
+    @classmethod
+    def from_dict(cls, dados: dict) -> tuple["Usuario", list[str]]:
+        """
+        Valida um único dict em uma passada, coletando todos os erros.
+
+        :param dados: dict - Dados {"nome", "email", "senha", "role", "ativo"}
+        :return: (Usuario validado ou None, lista de erros)
+        """
+        return validadores.validar_objeto(cls, dados)
+
     @property
     def idUsuario(self):
         return self.__idUsuario
 
     @idUsuario.setter
     def idUsuario(self, value):
-        try:
-            id_val = int(value)
-        except (ValueError, TypeError):
-            raise ValueError("idUsuario deve ser um número inteiro.")
-        
-        if id_val <= 0:
-            raise ValueError("idUsuario deve ser positivo.")
-        
-        self.__idUsuario = id_val
+        self.__idUsuario = validadores.inteiro_positivo(value, "idUsuario")
 
     @property
     def nome(self):
@@ -35,14 +62,7 @@ class Usuario:
 
     @nome.setter
     def nome(self, value):
-        if not isinstance(value, str):
-            raise ValueError("nome deve ser uma string.")
-        
-        nome = value.strip()
-        if len(nome) < 3:
-            raise ValueError("nome deve ter pelo menos 3 caracteres.")
-        
-        self.__nome = nome
+        self.__nome = validadores.texto_minimo(value, "nome")
 
     @property
     def email(self):
@@ -50,14 +70,7 @@ class Usuario:
 
     @email.setter
     def email(self, value):
-        if not isinstance(value, str):
-            raise ValueError("email deve ser uma string.")
-        
-        email = value.strip()
-        if not re.match(r'^[^\s@]+@[^\s@]+\.[^\s@]+$', email):
-            raise ValueError("email inválido.")
-        
-        self.__email = email
+        self.__email = validadores.email(value, "email inválido.")
 
     @property
     def senha(self):
@@ -79,9 +92,8 @@ class Usuario:
 
     @role.setter
     def role(self, value):
-        roles_validas = ['admin', 'funcionario', 'gerente']
-        if value not in roles_validas:
-            raise ValueError(f"role deve ser uma das seguintes: {', '.join(roles_validas)}")
+        if value not in Usuario.ROLES_VALIDAS:
+            raise ValueError(f"role deve ser uma das seguintes: {', '.join(Usuario.ROLES_VALIDAS)}")
         
         self.__role = value
 
@@ -92,6 +104,3 @@ class Usuario:
     @ativo.setter
     def ativo(self, value):
         self.__ativo = bool(value)
-
-    
-
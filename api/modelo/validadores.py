@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+import re
+from datetime import date
+
+"""
+Validadores compartilhados pelas entidades do domínio.
+
+Objetivo:
+- Centralizar as regras de validação usadas pelos setters dos modelos.
+- Manter as expressões regulares pré-compiladas (uma única vez por processo).
+- Oferecer a validação em lote (validar_lote) usada por Model.validate_many().
+"""
+
+REGEX_EMAIL = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+REGEX_NAO_DIGITO = re.compile(r"[^0-9]")
+# dia e mês com 1 ou 2 dígitos, como o strptime aceitava; usados com fullmatch (sem "\n" final)
+REGEX_DATA_ISO = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+REGEX_DATA_BR = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
+def inteiro_positivo(valor, campo: str) -> int:
+    """
+    Converte o valor para int e garante que seja positivo.
+
+    :raises ValueError: se não for número inteiro positivo.
+    """
+    try:
+        parsed = int(valor)
+    except (ValueError, TypeError):
+        raise ValueError(f"{campo} deve ser um número inteiro.")
+
+    if parsed <= 0:
+        raise ValueError(f"{campo} deve ser um número inteiro positivo.")
+
+    return parsed
+
+
+def texto_minimo(valor, campo: str, minimo: int = 3) -> str:
+    """
+    Garante string (sem espaços nas bordas) com tamanho mínimo.
+
+    :raises ValueError: se não for string ou se for curta demais.
+    """
+    if not isinstance(valor, str):
+        raise ValueError(f"{campo} deve ser uma string.")
+
+    texto = valor.strip()
+    if len(texto) < minimo:
+        raise ValueError(f"{campo} deve ter pelo menos {minimo} caracteres.")
+
+    return texto
+
+
+def email(valor, mensagem_invalido: str = "email em formato inválido.") -> str:
+    """Valida o formato do email e retorna o valor sem espaços nas bordas."""
+    if not isinstance(valor, str):
+        raise ValueError("email deve ser uma string.")
+
+    email_trimmed = valor.strip()
+    if email_trimmed == "":
+        raise ValueError("email não pode ser vazio.")
+
+    if not REGEX_EMAIL.match(email_trimmed):
+        raise ValueError(mensagem_invalido)
+
+    return email_trimmed
+
+
+def telefone_valido(valor) -> bool:
+    """
+    Telefone brasileiro: 10 ou 11 dígitos, DDD entre 11 e 99
+    e celular (11 dígitos) iniciando com 9.
+    """
+    if not isinstance(valor, str):
+        return False
+
+    numero = REGEX_NAO_DIGITO.sub("", valor)
+    if len(numero) not in (10, 11):
+        return False
+
+    if not 11 <= int(numero[:2]) <= 99:
+        return False
+
+    if len(numero) == 11 and numero[2] != "9":
+        return False
+
+    return True
+
+
+def cpf_valido(valor) -> bool:
+    """Valida os dígitos verificadores do CPF (aceita máscara)."""
+    if not isinstance(valor, str):
+        return False
+
+    cpf = REGEX_NAO_DIGITO.sub("", valor)
+    if len(cpf) != 11 or cpf == cpf[0] * 11:
+        return False
+
+    digitos = [int(c) for c in cpf]
+    for i in (9, 10):
+        soma = sum(digitos[j] * (i + 1 - j) for j in range(i))
+        if (soma * 10 % 11) % 10 != digitos[i]:
+            return False
+
+    return True
+
+
+def para_date(valor) -> date | None:
+    """
+    Converte o valor para date.
+
+    Aceita:
+    - Objeto date (retorna diretamente)
+    - String no formato YYYY-MM-DD
+    - String no formato DD/MM/YYYY
+
+    :return: date ou None se não for possível converter.
+    """
+    if isinstance(valor, date):
+        return valor
+
+    if not isinstance(valor, str):
+        return None
+
+    try:
+        m = REGEX_DATA_ISO.fullmatch(valor)
+        if m:
+            return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+        m = REGEX_DATA_BR.fullmatch(valor)
+        if m:
+            return date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+    except ValueError:
+        return None
+
+    return None
+
+
+_AUSENTE = object()
+
+
+def validar_lote(cls, linhas: list[dict]) -> tuple[list, list[dict]]:
+    """
+    Valida várias linhas (dicts) em uma única passada.
+
+    Cada classe de modelo declara CAMPOS_LOTE como tuplas
+    (atributo, chaves aceitas no dict, obrigatório). Os setters das
+    propriedades são resolvidos uma única vez para o lote inteiro e os erros
+    de cada linha são coletados (não param na primeira falha).
+
+    :param cls: Classe do modelo (Chale, Inquilino, Reserva, Usuario)
+    :param linhas: list[dict] - Linhas a validar
+    :return: (objetos válidos, erros) onde erros = [{"linha": i, "erros": [...]}]
+    """
+    campos = [
+        (getattr(cls, atributo).fset, chaves[0], chaves[1:], obrigatorio)
+        for atributo, chaves, obrigatorio in cls.CAMPOS_LOTE
+    ]
+    objetos = []
+    erros = []
+
+    for indice, linha in enumerate(linhas):
+        if not isinstance(linha, dict):
+            erros.append({"linha": indice, "erros": ["Linha deve ser um objeto JSON."]})
+            continue
+
+        obj = cls()
+        erros_linha = None
+
+        for setter, chave, alternativas, obrigatorio in campos:
+            valor = linha.get(chave, _AUSENTE)
+            if valor is _AUSENTE:
+                for alternativa in alternativas:
+                    valor = linha.get(alternativa, _AUSENTE)
+                    if valor is not _AUSENTE:
+                        break
+                else:
+                    if obrigatorio:
+                        erros_linha = erros_linha or []
+                        erros_linha.append(f"O campo '{chave}' é obrigatório.")
+                    continue
+
+            try:
+                setter(obj, valor)
+            except ValueError as e:
+                erros_linha = erros_linha or []
+                erros_linha.append(str(e))
+
+        if erros_linha:
+            erros.append({"linha": indice, "erros": erros_linha})
+        else:
+            objetos.append(obj)
+
+    return objetos, erros
+
+
+def validar_objeto(cls, dados: dict) -> tuple[object | None, list[str]]:
+    """
+    Valida um único dict e devolve o objeto do modelo já preenchido.
+
+    :param cls: Classe do modelo (Chale, Inquilino, Reserva, Usuario)
+    :param dados: dict - Dados da entidade
+    :return: (objeto ou None, lista de mensagens de erro)
+    """
+    objetos, erros = validar_lote(cls, [dados])
+    if erros:
+        return None, erros[0]["erros"]
+    return objetos[0], []
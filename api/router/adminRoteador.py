@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from flask import Blueprint, request, jsonify, g
+from api.Middleware.jwt_middleware import JwtMiddleware
+from api.utils.slowQueryLog import SlowQueryLog
+
+class AdminRoteador:
+    """
+    Rotas administrativas (diagnóstico). Exigem token JWT de um usuário com role "admin".
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware):
+        print("⬆️  AdminRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__blueprint = Blueprint('admin', __name__)
+
+    def __somente_admin(self):
+        payload = getattr(g, "jwt_payload", None) or {}
+        if payload.get("role") != "admin":
+            return jsonify({
+                "success": False,
+                "error": {"message": "Acesso restrito a administradores", "code": "FORBIDDEN"}
+            }), 403
+        return None
+
+    def create_routes(self):
+        """
+        Configura e retorna as rotas administrativas.
+        """
+
+        # GET /slow-queries -> statements mais lentos registrados pelo SqlExecutor
+        @self.__blueprint.route('/slow-queries', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def slow_queries():
+            """
+            Query string:
+            - limite: quantidade de statements (padrão 20, máximo 100)
+            - ordem: total_ms (padrão), max_ms ou ocorrencias
+            """
+            negado = self.__somente_admin()
+            if negado:
+                return negado
+
+            limite = min(max(request.args.get("limite", 20, type=int) or 20, 1), 100)
+            ordem = request.args.get("ordem", "total_ms")
+
+            return jsonify({
+                "success": True,
+                "message": "Queries lentas",
+                "data": {
+                    "limite_ms": SlowQueryLog.LIMITE_MS,
+                    "queries": SlowQueryLog.top(limite, ordem)
+                }
+            }), 200
+
+        print("✅ Blueprint 'admin' criado com rotas: /slow-queries")
+        return self.__blueprint
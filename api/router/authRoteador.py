@@ -2,18 +2,21 @@
 from flask import Blueprint, request, jsonify
 from api.http.meu_token_jwt import MeuTokenJWT
 from api.dao.usuariosDAO import UsuarioDAO
+from api.Middleware.rateLimitMiddleware import RateLimitMiddleware
 import bcrypt
 
 class AuthRoteador:
-    def __init__(self, database):
+    def __init__(self, database, rate_limit_middleware: RateLimitMiddleware):
         print("⬆️  AuthRoteador.__init__()")
         self.__database = database
+        self.__rate_limit_middleware = rate_limit_middleware
         self.__usuario_dao = UsuarioDAO(database)
         self.__blueprint = Blueprint('auth', __name__)
     
     def create_routes(self):
         
         @self.__blueprint.route('/login', methods=['POST', 'OPTIONS'])
+        @self.__rate_limit_middleware.limitar("login")  # limita tentativas (bcrypt) por IP e no total
         def login():
             print("🔵 AuthRoteador.login()")
             
@@ -2,6 +2,7 @@
 from flask import Blueprint, request
 from api.Middleware.jwt_middleware import JwtMiddleware
 from api.Middleware.chaleMiddleware import ChaleMiddleware
+from api.Middleware.cacheRespostaMiddleware import CacheRespostaMiddleware
 from api.controle.chaleControl import ChaleControl
 
 class ChaleRoteador:
@@ -14,13 +15,15 @@ class ChaleRoteador:
     - Aplicar autenticação JWT e validações antes de chamar o controlador.
     """
 
-    def __init__(self, jwt_middleware: JwtMiddleware, Chale_middleware: ChaleMiddleware, Chale_control: ChaleControl):
+    def __init__(self, jwt_middleware: JwtMiddleware, Chale_middleware: ChaleMiddleware, Chale_control: ChaleControl,
+                 cache_middleware: CacheRespostaMiddleware):
         """
         Construtor do roteador.
 
         :param jwt_middleware: Middleware responsável por validar token JWT.
         :param Chale_middleware: Middleware com validações específicas para Chale (ex.: validação de corpo, id).
         :param Chale_control: Controlador que implementa a lógica de negócio (store, index, update, delete, show).
+        :param cache_middleware: Cache das respostas serializadas dos GETs (invalidado pelas escritas do ChaleService).
 
         Observações:
         - Blueprint é criado para permitir o registro isolado de rotas.
@@ -30,6 +33,7 @@ class ChaleRoteador:
         self.__jwt_middleware = jwt_middleware
         self.__Chale_middleware = Chale_middleware
         self.__Chale_control = Chale_control
+        self.__cache_middleware = cache_middleware
 
         # Blueprint é a coleção de rotas da entidade Chale
         self.__blueprint = Blueprint('Chale', __name__)
@@ -65,6 +69,7 @@ class ChaleRoteador:
         # GET / -> lista todos os Chales
         @self.__blueprint.route('/', methods=['GET'])
         @self.__jwt_middleware.validate_token  # valida token JWT
+        @self.__cache_middleware.cacheado  # resposta pronta (bytes + ETag) enquanto não houver escrita
         def index():
             """
             Rota responsável por listar todos os Chales cadastrados no sistema.
@@ -75,6 +80,7 @@ class ChaleRoteador:
         @self.__blueprint.route('/<int:idChale>', methods=['GET'])
         @self.__jwt_middleware.validate_token
         @self.__Chale_middleware.validate_id_param  # valida se o ID é válido
+        @self.__cache_middleware.cacheado
         def show(idChale):
             """
             Rota que retorna um Chale específico pelo seu ID.
@@ -41,6 +41,7 @@ class InquilinoRoteador:
         Rotas implementadas:
         - POST /        -> Cria um novo Inquilino
         - GET /         -> Lista todos os Inquilinos
+        - GET /busca    -> Busca typeahead (?q=) por nome, email, telefone ou cpf
         - GET /<id>     -> Retorna um Inquilino por ID
         - PUT /<id>     -> Atualiza um Inquilino por ID
         - DELETE /<id>  -> Remove um Inquilino por ID
@@ -72,6 +73,15 @@ class InquilinoRoteador:
             """
             return self.__Inquilino_control.index()
 
+        # GET /busca?q= -> busca typeahead
+        @self.__blueprint.route('/busca', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def busca():
+            """
+            Rota de busca rápida (sem acento, por prefixo/substring) usada no autocompletar.
+            """
+            return self.__Inquilino_control.busca()
+
         # GET /<idInquilino> -> retorna um Inquilino específico
         @self.__blueprint.route('/<int:idInquilino>', methods=['GET'])
         @self.__jwt_middleware.validate_token
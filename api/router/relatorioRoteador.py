@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from flask import Blueprint
+from api.Middleware.jwt_middleware import JwtMiddleware
+from api.controle.relatorioControl import RelatorioControl
+
+class RelatorioRoteador:
+    """
+    Classe responsável por configurar as rotas de relatórios gerenciais no Flask.
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware, Relatorio_control: RelatorioControl):
+        print("⬆️  RelatorioRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__Relatorio_control = Relatorio_control
+
+        # Blueprint é a coleção de rotas de relatórios
+        self.__blueprint = Blueprint('Relatorio', __name__)
+
+    def create_routes(self):
+        """
+        Configura e retorna as rotas de relatórios.
+        """
+
+        # GET /ocupacao -> ocupação, estadia, antecedência e retorno de hóspedes no período
+        @self.__blueprint.route('/ocupacao', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def ocupacao():
+            """
+            Query string: de=YYYY-MM-DD, ate=YYYY-MM-DD (padrão: últimos 12 meses), idChale (opcional)
+            """
+            return self.__Relatorio_control.ocupacao()
+
+        print("✅ Blueprint 'Relatorio' criado com rotas: /ocupacao")
+        return self.__blueprint
@@ -3,17 +3,25 @@ from flask import Blueprint, request
 from api.Middleware.jwt_middleware import JwtMiddleware
 from api.Middleware.reservaMiddleware import ReservaMiddleware
 from api.controle.reservaControl import ReservaControl
+from api.controle.reservaPublicaControl import ReservaPublicaControl
+from api.controle.reservaEventosControl import ReservaEventosControl
+from api.Middleware.idempotenciaMiddleware import IdempotenciaMiddleware
+from api.Middleware.rateLimitMiddleware import RateLimitMiddleware
 
 class ReservaRoteador:
     """
     Classe responsável por configurar todas as rotas da entidade Reserva no Flask.
     """
 
-    def __init__(self, jwt_middleware: JwtMiddleware, Reserva_middleware: ReservaMiddleware, Reserva_control: ReservaControl):
+    def __init__(self, jwt_middleware: JwtMiddleware, Reserva_middleware: ReservaMiddleware, Reserva_control: ReservaControl, Reserva_publica_control: ReservaPublicaControl, idempotencia_middleware: IdempotenciaMiddleware, rate_limit_middleware: RateLimitMiddleware, Reserva_eventos_control: ReservaEventosControl):
         print("⬆️  ReservaRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__Reserva_middleware = Reserva_middleware
         self.__Reserva_control = Reserva_control
+        self.__Reserva_publica_control = Reserva_publica_control
+        self.__idempotencia_middleware = idempotencia_middleware
+        self.__rate_limit_middleware = rate_limit_middleware
+        self.__Reserva_eventos_control = Reserva_eventos_control
 
         # Blueprint é a coleção de rotas da entidade Reserva
         self.__blueprint = Blueprint('Reserva', __name__)
@@ -25,6 +33,7 @@ class ReservaRoteador:
 
         # POST / -> cria um Reserva
         @self.__blueprint.route('/', methods=['POST'])
+        @self.__idempotencia_middleware.idempotente  # repetições com a mesma Idempotency-Key reaproveitam a resposta
         #@self.__jwt_middleware.validate_token  # valida token JWT antes de executar
         @self.__Reserva_middleware.validate_body  # valida corpo da requisição
         def store():
@@ -43,6 +52,42 @@ class ReservaRoteador:
             """
             return self.__Reserva_control.index()
 
+        # GET /export -> CSV/Parquet das reservas do período (download em streaming)
+        @self.__blueprint.route('/export', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def export():
+            """
+            Rota de export para o financeiro: ?formato=csv|parquet&de=YYYY-MM-DD&ate=YYYY-MM-DD
+            """
+            return self.__Reserva_control.export()
+
+        # GET /disponibilidade -> datas livres (chalé, check-in) para uma estadia flexível
+        @self.__blueprint.route('/disponibilidade', methods=['GET'])
+        @self.__rate_limit_middleware.limitar("disponibilidade")  # rota pública: limita por IP e no total
+        def disponibilidade():
+            """
+            Rota PÚBLICA usada pelo site: ?de=&ate=&noites=&pessoas=&modo=primeira|todas&limite=
+            """
+            return self.__Reserva_control.disponibilidade()
+
+        # POST /eventos/ticket -> ticket de curta duração para abrir o stream
+        @self.__blueprint.route('/eventos/ticket', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        def eventos_ticket():
+            """
+            Rota que troca o token de acesso por um ticket que só abre GET /eventos.
+            """
+            return self.__Reserva_eventos_control.ticket()
+
+        # GET /eventos -> stream (SSE) de reservas criadas/atualizadas/excluídas
+        @self.__blueprint.route('/eventos', methods=['GET'])
+        @self.__jwt_middleware.validate_ticket_eventos  # EventSource não envia Authorization: aceita ?ticket=
+        def eventos():
+            """
+            Rota de Server-Sent Events; retoma a partir do header Last-Event-ID.
+            """
+            return self.__Reserva_eventos_control.stream()
+
         # GET /<idReserva> -> retorna um Reserva específico
         @self.__blueprint.route('/<int:idReserva>', methods=['GET'])
         @self.__jwt_middleware.validate_token
@@ -86,43 +131,25 @@ class ReservaRoteador:
         # 🆕 NOVA ROTA: RESERVA PÚBLICA (SEM AUTENTICAÇÃO)
         # ===================================================
         @self.__blueprint.route('/publica', methods=['POST'])
+        @self.__idempotencia_middleware.idempotente  # repetição respondida antes do rate limit (não consome tokens)
+        @self.__rate_limit_middleware.limitar("reserva_publica")  # limita por IP e no total
         def reserva_publica():
             """
             Rota PÚBLICA para reservas via site.
             Qualquer pessoa pode acessar sem token.
             """
-            print("✅ ROTA /publica CHAMADA VIA POST")
             print("🌐 ROTA /publica ACESSADA (SEM JWT)")
-            
-            try:
-                # Importar aqui para evitar import circular
-                from api.controle.reservaPublicaControl import ReservaPublicaControl
-                
-                # Obter o serviço de reserva do controlador existente
-                reserva_service = self.__Reserva_control._ReservaControl__Reserva_service
-                
-                # Criar controlador público
-                control_publico = ReservaPublicaControl(reserva_service)
-                
-                # Executar
-                return control_publico.store_publica()
-                
-            except ImportError as e:
-                print(f"❌ Erro de importação: {e}")
-                from flask import jsonify
-                return jsonify({
-                    "success": False,
-                    "error": "Módulo reservaPublicaControl não encontrado"
-                }), 500
-            except Exception as e:
-                print(f"❌ Erro na rota /publica: {e}")
-                from flask import jsonify
-                return jsonify({
-                    "success": False,
-                    "error": f"Erro interno: {str(e)}"
-                }), 500
-
-        print(f"✅ Blueprint 'Reserva' criado com rotas: /, /<idReserva>, /publica")
+            return self.__Reserva_publica_control.store_publica()
+
+        # GET /publica/<tracking> -> andamento de um pedido público enfileirado
+        @self.__blueprint.route('/publica/<string:tracking>', methods=['GET'])
+        def reserva_publica_status(tracking):
+            """
+            Rota PÚBLICA de acompanhamento (o tracking é um UUID aleatório).
+            """
+            return self.__Reserva_publica_control.status_publica(tracking)
+
+        print(f"✅ Blueprint 'Reserva' criado com rotas: /, /<idReserva>, /export, /disponibilidade, /eventos, /eventos/ticket, /publica, /publica/<tracking>")
         return self.__blueprint
 
     
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from datetime import date, timedelta
+from api.dao.reservaDAO import ReservaDAO
+from api.utils.cacheSWR import CacheSWR
+
+"""
+Arquivamento das reservas encerradas (tabela quente -> reserva_historico).
+
+- Reservas com fim anterior a hoje - idade_dias saem de reserva e vão para
+  reserva_historico, mantendo o idReserva.
+- Cada lote é uma transação curta (ReservaDAO.arquivar: INSERT ... SELECT +
+  DELETE pela chave primária); entre lotes há uma pausa para não disputar a
+  tabela quente com as requisições.
+- Uma thread repete o ciclo a cada 'intervalo' segundos. Vários processos
+  podendo rodar ao mesmo tempo: um lote já movido por outro não copia nada.
+"""
+
+
+class ArquivoReservas:
+    def __init__(self, reserva_dao: ReservaDAO, idade_dias: int = 180, tamanho_lote: int = 500,
+                 intervalo: float = 3600, pausa: float = 0.2, cache_listas: CacheSWR | None = None):
+        """
+        :param reserva_dao: ReservaDAO - seleção e movimentação dos lotes
+        :param idade_dias: dias depois do check-out para a reserva ir para o histórico (mínimo 1)
+        :param tamanho_lote: reservas movidas por transação
+        :param intervalo: segundos entre dois ciclos de arquivamento
+        :param pausa: segundos entre dois lotes do mesmo ciclo
+        :param cache_listas: CacheSWR das listagens de reservas (invalidado quando algo é movido)
+        """
+        print("⬆️  ArquivoReservas.__init__()")
+        self.__reserva_dao = reserva_dao
+        self.__idade = timedelta(days=max(1, idade_dias))
+        self.__tamanho_lote = max(1, tamanho_lote)
+        self.__intervalo = intervalo
+        self.__pausa = pausa
+        self.__cache_listas = cache_listas
+        self.__parar = threading.Event()
+        self.__thread = None
+
+    @staticmethod
+    def from_env(reserva_dao: ReservaDAO, cache_listas: CacheSWR | None = None) -> "ArquivoReservas":
+        return ArquivoReservas(
+            reserva_dao,
+            idade_dias=int(os.environ.get("ARQUIVO_IDADE_DIAS", 180)),
+            tamanho_lote=int(os.environ.get("ARQUIVO_LOTE", 500)),
+            intervalo=float(os.environ.get("ARQUIVO_INTERVALO", 3600)),
+            pausa=float(os.environ.get("ARQUIVO_PAUSA", 0.2)),
+            cache_listas=cache_listas,
+        )
+
+    def corte(self) -> date:
+        """Reservas com fim anterior a esta data vão para o histórico."""
+        return date.today() - self.__idade
+
+    def arquivar(self) -> int:
+        """Executa um ciclo completo (lote a lote) e devolve quantas reservas foram movidas."""
+        corte = self.corte()
+        total = 0
+        inicio = time.perf_counter()
+        while not self.__parar.is_set():
+            ids = self.__reserva_dao.idsParaArquivar(corte, self.__tamanho_lote)
+            if not ids:
+                break
+            total += self.__reserva_dao.arquivar(ids, corte)
+            if len(ids) < self.__tamanho_lote:
+                break
+            self.__parar.wait(self.__pausa)
+
+        if total:
+            if self.__cache_listas is not None:
+                self.__cache_listas.invalidar()
+            print(f"🗄️  ArquivoReservas: {total} reservas (fim < {corte}) arquivadas em {time.perf_counter() - inicio:.1f}s")
+        return total
+
+    # ---------------- thread ----------------
+    def iniciar(self):
+        if self.__thread is not None:
+            return
+        self.__parar.clear()
+        self.__thread = threading.Thread(target=self.__executar, name="arquivo-reservas", daemon=True)
+        self.__thread.start()
+        print(f"✅ ArquivoReservas iniciado (a cada {self.__intervalo:.0f}s, reservas encerradas há {self.__idade.days}+ dias)")
+
+    def parar(self, timeout: float = 5):
+        self.__parar.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+        self.__thread = None
+
+    def __executar(self):
+        while not self.__parar.is_set():
+            try:
+                self.arquivar()
+            except Exception as e:
+                # banco fora do ar, lote com conflito...: tenta de novo no próximo ciclo
+                print(f"❌ ArquivoReservas: {e}")
+            self.__parar.wait(self.__intervalo)
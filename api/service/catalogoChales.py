@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from api.dao.chaleDAO import ChaleDAO
+from api.utils.cacheCompartilhado import CacheCompartilhado
+from api.utils.geracaoCompartilhada import GeracaoCompartilhada
+
+"""
+Catálogo de chalés por tipo, em memória, usado na alocação das reservas públicas.
+
+- Carregado do banco (ChaleDAO.findCatalogo) já em ordem de (tipo, capacidade).
+- Cada tipo guarda as capacidades ordenadas: os candidatos para N pessoas são
+  um bisect, sem acesso ao banco.
+- Vale enquanto a geração "chales" do GeracaoCompartilhada não mudar (toda
+  escrita do ChaleService a incrementa, em qualquer worker) e no máximo
+  CATALOGO_CHALES_TTL segundos.
+- Com um CacheCompartilhado, o catálogo lido do banco por um worker é gravado
+  no mapa do host (com a geração e o instante de expiração) e os demais
+  workers o aproveitam sem consultar o banco.
+"""
+
+
+class CatalogoChales:
+    CHAVE_COMPARTILHADA = "catalogo_chales"
+
+    def __init__(self, chale_dao: ChaleDAO, geracoes: GeracaoCompartilhada, nome_geracao: str = "chales",
+                 ttl: float | None = None, compartilhado: CacheCompartilhado | None = None):
+        """
+        :param chale_dao: ChaleDAO - leitura do catálogo
+        :param geracoes: contadores de geração compartilhados (os mesmos do cache de chalés)
+        :param nome_geracao: geração incrementada pelas escritas de chalés
+        :param ttl: segundos de validade do catálogo (padrão CATALOGO_CHALES_TTL ou 300)
+        :param compartilhado: CacheCompartilhado opcional (catálogo lido uma vez por host)
+        """
+        print("⬆️  CatalogoChales.__init__()")
+        self.__chale_dao = chale_dao
+        self.__geracoes = geracoes
+        self.__nome_geracao = nome_geracao
+        self.__ttl = ttl if ttl is not None else float(os.environ.get("CATALOGO_CHALES_TTL", 300))
+        self.__compartilhado = compartilhado
+        self.__trava = threading.Lock()
+        self.__estado = None  # (geracao, expira_em, {tipo: (capacidades, chales)})
+
+    def tipos(self) -> dict[str, list[dict]]:
+        """{tipo: [chalés em ordem crescente de capacidade]}"""
+        return {tipo: list(chales) for tipo, (_, chales) in self.__por_tipo().items()}
+
+    def possui_tipo(self, tipo: str) -> bool:
+        return tipo in self.__por_tipo()
+
+    def candidatos(self, tipo: str, pessoas: int) -> list[dict]:
+        """Chalés do tipo que comportam 'pessoas', do menor para o maior."""
+        capacidades, chales = self.__por_tipo().get(tipo, ((), ()))
+        return list(chales[bisect_left(capacidades, pessoas):])
+
+    def __por_tipo(self) -> dict:
+        geracao = self.__geracoes.atual(self.__nome_geracao)
+        estado = self.__estado
+        if estado and estado[0] == geracao and estado[1] > time.monotonic():
+            return estado[2]
+        with self.__trava:
+            estado = self.__estado
+            if estado and estado[0] == geracao and estado[1] > time.monotonic():
+                return estado[2]
+
+            chales_catalogo, expira_em = self.__carregar(geracao)
+            por_tipo = {}
+            for chale in chales_catalogo:
+                capacidades, chales = por_tipo.setdefault(chale["tipo"], ([], []))
+                capacidades.append(chale["capacidade"])
+                chales.append(chale)
+
+            self.__estado = (geracao, time.monotonic() + max(expira_em - time.time(), 0), por_tipo)
+            print(f"📚 CatalogoChales: {sum(len(c) for _, c in por_tipo.values())} chalés em {len(por_tipo)} tipos")
+            return por_tipo
+
+    def __carregar(self, geracao: int) -> tuple[list[dict], float]:
+        """Chalés do catálogo e o instante (epoch) em que deixam de valer: do mapa do host ou do banco."""
+        if self.__compartilhado is not None:
+            valor = self.__compartilhado.obter(self.CHAVE_COMPARTILHADA, geracao)
+            if valor is not None:
+                dados = json.loads(valor)
+                if dados["expira_em"] > time.time():
+                    return dados["chales"], dados["expira_em"]
+
+        chales = self.__chale_dao.findCatalogo()
+        expira_em = time.time() + self.__ttl
+        if self.__compartilhado is not None:
+            valor = json.dumps({"expira_em": expira_em, "chales": chales}, ensure_ascii=False).encode()
+            self.__compartilhado.guardar(self.CHAVE_COMPARTILHADA, valor, geracao)
+        return chales, expira_em
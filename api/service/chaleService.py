@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from api.dao.chaleDAO import ChaleDAO
+from api.dao.sqlExecutor import RegistroDuplicadoError
 from api.modelo.chale import Chale
+from api.utils.cacheRespostas import CacheRespostas
 from api.utils.errorResponse import ErrorResponse
+from api.utils.validacao import validar_entidade, parse_campos
 
 """
 Classe responsável pela camada de serviço para a entidade Chale.
@@ -10,59 +13,64 @@ Observações sobre injeção de dependência:
 - O ChaleService recebe uma instância de ChaleDAO via construtor.
 - Isso segue o padrão de injeção de dependência, tornando o serviço desacoplado
   do DAO concreto, facilitando testes unitários e substituição por mocks.
+- O CacheRespostas (opcional) guarda as respostas dos GETs de chalés; toda
+  escrita bem-sucedida deste service o invalida.
 """
 class ChaleService:
-    def __init__(self, Chale_dao_dependency: ChaleDAO):
+    def __init__(self, Chale_dao_dependency: ChaleDAO, cache_respostas: CacheRespostas | None = None):
         """
         Construtor da classe ChaleService
 
         :param Chale_dao_dependency: ChaleDAO - Instância de ChaleDAO
+        :param cache_respostas: CacheRespostas - cache dos GETs de chalés, invalidado nas escritas
         """
         print("⬆️  ChaleService.__init__()")
         self.__ChaleDAO = Chale_dao_dependency  # injeção de dependência
+        self.__cache = cache_respostas
 
-    def createChale(self, ChaleBodyRequest: dict) -> int:
+    def createChale(self, ChaleBodyRequest: Chale | dict) -> int:
         """
         Cria um novo Chale.
 
-        :param ChaleBodyRequest: dict - Dados do Chale {"nomeChale"}
+        :param ChaleBodyRequest: Chale já validado (g.chale) ou dict {"nome", "capacidade"}
         :return: int - ID do novo Chale criado
 
         🔹 Validações:
         - nomeChale não pode estar vazio
-        - Não pode existir outro Chale com mesmo nome
+        - Não pode existir outro Chale com mesmo nome (restrição UNIQUE do banco,
+          verificada no próprio INSERT: um único round trip e sem corrida entre workers)
         """
         print("🟣 ChaleService.createChale()")
 
-        chale = Chale()
-        chale.nome = ChaleBodyRequest.get("nome")
-        chale.capacidade = ChaleBodyRequest.get("capacidade")
-
+        chale = validar_entidade(Chale, ChaleBodyRequest, "Erro na validação de dados")
 
-        # valida regra de negócio: Chale duplicado
-        resultado = self.__ChaleDAO.findByField("nome", chale.nome)
-        if resultado and len(resultado) > 0:
-            raise ErrorResponse(
-                400,
-                "Chale já existe",
-                {"message": f"O Chale {chale.nome} já existe"}
-            )
+        try:
+            novo_id = self.__ChaleDAO.create(chale)
+        except RegistroDuplicadoError:
+            raise self.__erro_duplicado(chale.nome) from None
 
-        return self.__ChaleDAO.create(chale)
+        self.__invalidar_cache()
+        return novo_id
 
-    def findAll(self) -> list[dict]:
+    def findAll(self, campos: tuple | None = None) -> list[dict]:
         """
         Retorna todos os Chales
+        :param campos: colunas a retornar (?fields=); None = todas
         :return: list[dict]
         """
         print("🟣 ChaleService.findAll()")
-        return self.__ChaleDAO.findAll()
+        return self.__ChaleDAO.findAll(campos)
+
+    def parse_fields(self, valor: str | None) -> tuple | None:
+        """Valida ?fields= contra as colunas permitidas de ChaleDAO."""
+        return parse_campos(valor, ChaleDAO.CAMPOS_PERMITIDOS)
 
-    def findById(self, idChale: int) -> dict | None:
+    def findById(self, idChale: int, campos: tuple | None = None) -> dict | None:
         """
         Retorna um Chale por ID.
 
         :param idChale: int
+        :param campos: colunas a retornar (?fields=); None = todas
         :return: dict | None
         """
         print("🟣 ChaleService.findById()")
@@ -70,28 +78,32 @@ class ChaleService:
         chale = Chale()
         chale.idChale = idChale  # passa pela validação de domínio
 
-        return self.__ChaleDAO.findById(chale.idChale)
+        return self.__ChaleDAO.findById(chale.idChale, campos)
 
-    def updateChale(self, idChale: int, jsonChale: dict) -> bool:
-        print (jsonChale)
+    def updateChale(self, idChale: int, jsonChale: Chale | dict) -> bool:
         """
         Atualiza um Chale existente.
 
         🔹 Regra de domínio: o idChale deve ser um número inteiro positivo.
 
         :param idChale: int - Identificador do Chale a ser atualizado
-        :param jsonChale: dict - Dados do Chale {"nomeChale", "email", "telefone", "requisicao", "cpf"}
+        :param jsonChale: Chale já validado (g.chale) ou dict {"nome", "capacidade"}
         :return: bool - True se atualizado com sucesso
         :raises ValueError: se idChale ou nomeChale não atenderem às regras de domínio
         """
         print("🟣 ChaleService.updateChale()")
 
-        chale = Chale()
+        chale = validar_entidade(Chale, jsonChale, "Erro na validação de dados")
         chale.idChale = idChale
-        chale.nome = jsonChale.get("nome")
-        chale.capacidade = jsonChale.get("capacidade")
 
-        return self.__ChaleDAO.update(chale)
+        try:
+            atualizado = self.__ChaleDAO.update(chale)
+        except RegistroDuplicadoError:
+            raise self.__erro_duplicado(chale.nome) from None
+
+        if atualizado:
+            self.__invalidar_cache()
+        return atualizado
 
     def deleteChale(self, idChale: int) -> bool:
         """
@@ -105,4 +117,19 @@ class ChaleService:
         chale = Chale()
         chale.idChale = idChale  # validação de regra de domínio
 
-        return self.__ChaleDAO.delete(chale)
\ No newline at end of file
+        excluiu = self.__ChaleDAO.delete(chale)
+        if excluiu:
+            self.__invalidar_cache()
+        return excluiu
+
+    def __invalidar_cache(self):
+        if self.__cache is not None:
+            self.__cache.invalidar()
+
+    @staticmethod
+    def __erro_duplicado(nome: str) -> ErrorResponse:
+        return ErrorResponse(
+            400,
+            "Chale já existe",
+            {"message": f"O Chale {nome} já existe"}
+        )
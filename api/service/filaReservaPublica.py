@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+import time
+import uuid
+from api.utils.armazenamentoLocal import ArmazenamentoLocal
+from api.utils.errorResponse import ErrorResponse
+from api.database.circuito import BancoIndisponivelError
+
+"""
+Fila de entrada (outbox) para POST /api/v1/reservas/publica.
+
+Fluxo:
+1. A rota valida o formulário (sem acessar o banco), grava o pedido na tabela
+   fila_reserva_publica do ArmazenamentoLocal e responde 202 com um tracking.
+2. Um pool de threads retira os pedidos em ordem de chegada, a uma taxa
+   controlada, e chama ReservaPublicaService.criar_reserva_simples.
+3. GET /api/v1/reservas/publica/<tracking> consulta o andamento.
+
+A retirada é atômica (BEGIN IMMEDIATE), então vários processos podem
+drenar a mesma fila. Pedidos presos em "processando" (processo morto)
+voltam para a fila quando o prazo de reserva expira.
+
+Status: pendente -> processando -> concluida | rejeitada | falhou
+
+Banco fora do ar (BancoIndisponivelError) não rejeita o pedido: ele volta para
+a fila e é tentado de novo depois do Retry-After do circuito, sem gastar tentativa.
+Erros de validação (ErrorResponse, ValueError/TypeError/KeyError) rejeitam na
+primeira tentativa; só os demais são repetidos, com backoff, até MAX_TENTATIVAS.
+"""
+
+DDL_FILA = """
+CREATE TABLE IF NOT EXISTS fila_reserva_publica (
+    tracking      TEXT PRIMARY KEY,
+    status        TEXT NOT NULL,
+    payload       TEXT NOT NULL,
+    tentativas    INTEGER NOT NULL DEFAULT 0,
+    reserva_id    INTEGER,
+    erro          TEXT,
+    criado_em     REAL NOT NULL,
+    atualizado_em REAL NOT NULL,
+    disponivel_em REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fila_reserva_publica_status
+    ON fila_reserva_publica (status, disponivel_em, criado_em);
+"""
+
+
+class FilaReservaPublica:
+    MAX_TENTATIVAS = 5
+    PRAZO_PROCESSAMENTO = 60  # segundos até um pedido "processando" voltar para a fila
+    INTERVALO_OCIOSO = 1.0    # espera máxima entre verificações com a fila vazia
+
+    def __init__(self, armazenamento: ArmazenamentoLocal, publica_service, workers: int = 2, taxa_por_segundo: float = 5):
+        """
+        :param armazenamento: ArmazenamentoLocal onde fica a tabela da fila
+        :param publica_service: ReservaPublicaService que efetiva o pedido
+        :param workers: quantidade de threads que drenam a fila
+        :param taxa_por_segundo: máximo de pedidos processados por segundo (por processo)
+        """
+        print("⬆️  FilaReservaPublica.__init__()")
+        self.__armazenamento = armazenamento
+        self.__publica_service = publica_service
+        self.__workers = max(1, workers)
+        self.__intervalo = 1.0 / taxa_por_segundo if taxa_por_segundo > 0 else 0.0
+        self.__proximo_slot = 0.0
+        self.__trava_taxa = threading.Lock()
+        self.__novo_pedido = threading.Event()
+        self.__parar = threading.Event()
+        self.__threads = []
+        self.__armazenamento.garantir_esquema("fila_reserva_publica", DDL_FILA)
+
+    @staticmethod
+    def from_env(armazenamento: ArmazenamentoLocal, publica_service) -> "FilaReservaPublica":
+        return FilaReservaPublica(
+            armazenamento,
+            publica_service,
+            workers=int(os.environ.get("RESERVA_PUBLICA_WORKERS", 2)),
+            taxa_por_segundo=float(os.environ.get("RESERVA_PUBLICA_TAXA", 5)),
+        )
+
+    # ---------------- entrada ----------------
+    def enfileirar(self, dados_formulario: dict) -> str:
+        """Grava o pedido e devolve o tracking ID."""
+        tracking = uuid.uuid4().hex
+        agora = time.time()
+        self.__armazenamento.executar(
+            "INSERT INTO fila_reserva_publica (tracking, status, payload, criado_em, atualizado_em, disponivel_em) "
+            "VALUES (?, 'pendente', ?, ?, ?, ?)",
+            (tracking, json.dumps(dados_formulario, ensure_ascii=False, default=str), agora, agora, agora),
+        )
+        self.__novo_pedido.set()
+        print(f"📥 FilaReservaPublica.enfileirar() -> {tracking}")
+        return tracking
+
+    def status(self, tracking: str) -> dict | None:
+        linha = self.__armazenamento.consultar_um(
+            "SELECT tracking, status, tentativas, reserva_id, erro, criado_em, atualizado_em "
+            "FROM fila_reserva_publica WHERE tracking = ?",
+            (tracking,),
+        )
+        if linha is None:
+            return None
+        if linha["status"] == "pendente":
+            linha["posicao"] = self.__armazenamento.consultar_um(
+                "SELECT COUNT(*) AS posicao FROM fila_reserva_publica WHERE status = 'pendente' AND criado_em <= ?",
+                (linha["criado_em"],),
+            )["posicao"]
+        return linha
+
+    # ---------------- workers ----------------
+    def iniciar(self):
+        if self.__threads:
+            return
+        self.__parar.clear()
+        for i in range(self.__workers):
+            thread = threading.Thread(target=self.__executar, name=f"fila-reserva-publica-{i}", daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+        print(f"✅ FilaReservaPublica iniciada com {self.__workers} worker(s)")
+
+    def parar(self, timeout: float = 5):
+        self.__parar.set()
+        self.__novo_pedido.set()
+        for thread in self.__threads:
+            thread.join(timeout)
+        self.__threads = []
+
+    def processar_um(self) -> bool:
+        """Retira e processa um pedido. Devolve False se a fila estava vazia."""
+        pedido = self.__retirar()
+        if pedido is None:
+            return False
+
+        tracking = pedido["tracking"]
+        try:
+            reserva_id = self.__publica_service.criar_reserva_simples(json.loads(pedido["payload"]))
+        except BancoIndisponivelError as e:
+            # queda do banco: aguarda o circuito e não conta como tentativa
+            self.__reagendar(tracking, e.getMessage(), e.retry_after, devolver_tentativa=True)
+        except ErrorResponse as e:
+            # erro de negócio (conflito, chalé inexistente, formulário inválido...): repetir não adianta
+            self.__finalizar(tracking, "rejeitada", erro=e.getMessage())
+        except (ValueError, TypeError, KeyError) as e:
+            # payload malformado: falha igual em toda tentativa
+            self.__finalizar(tracking, "rejeitada", erro=str(e))
+        except Exception as e:
+            # demais erros (infraestrutura): nova tentativa com backoff
+            if pedido["tentativas"] >= self.MAX_TENTATIVAS:
+                self.__finalizar(tracking, "falhou", erro=str(e))
+            else:
+                self.__reagendar(tracking, str(e), min(2 ** pedido["tentativas"], 60))
+        else:
+            self.__finalizar(tracking, "concluida", reserva_id=reserva_id)
+        return True
+
+    def __executar(self):
+        while not self.__parar.is_set():
+            self.__aguardar_taxa()
+            try:
+                processou = self.processar_um()
+            except Exception as e:
+                print(f"❌ FilaReservaPublica worker: {e}")
+                processou = False
+            if not processou:
+                self.__novo_pedido.wait(self.INTERVALO_OCIOSO)
+                self.__novo_pedido.clear()
+
+    def __aguardar_taxa(self):
+        # slots espaçados de 1/taxa segundos, compartilhados pelas threads do processo
+        if not self.__intervalo:
+            return
+        with self.__trava_taxa:
+            agora = time.monotonic()
+            slot = max(agora, self.__proximo_slot)
+            self.__proximo_slot = slot + self.__intervalo
+        if slot > agora:
+            time.sleep(slot - agora)
+
+    def __retirar(self) -> dict | None:
+        agora = time.time()
+        with self.__armazenamento.transacao() as conexao:
+            linha = conexao.execute(
+                "SELECT tracking, payload, tentativas FROM fila_reserva_publica "
+                "WHERE (status = 'pendente' AND disponivel_em <= ?) "
+                "   OR (status = 'processando' AND disponivel_em <= ?) "
+                "ORDER BY criado_em LIMIT 1",
+                (agora, agora),
+            ).fetchone()
+            if linha is None:
+                return None
+            conexao.execute(
+                "UPDATE fila_reserva_publica SET status = 'processando', tentativas = tentativas + 1, "
+                "atualizado_em = ?, disponivel_em = ? WHERE tracking = ?",
+                (agora, agora + self.PRAZO_PROCESSAMENTO, linha["tracking"]),
+            )
+        return {"tracking": linha["tracking"], "payload": linha["payload"], "tentativas": linha["tentativas"] + 1}
+
+    def __reagendar(self, tracking: str, erro: str, espera: float, devolver_tentativa: bool = False):
+        agora = time.time()
+        self.__armazenamento.executar(
+            "UPDATE fila_reserva_publica SET status = 'pendente', erro = ?, atualizado_em = ?, disponivel_em = ?, "
+            "tentativas = tentativas - ? WHERE tracking = ?",
+            (erro, agora, agora + espera, 1 if devolver_tentativa else 0, tracking),
+        )
+
+    def __finalizar(self, tracking: str, status: str, reserva_id: int | None = None, erro: str | None = None):
+        self.__armazenamento.executar(
+            "UPDATE fila_reserva_publica SET status = ?, reserva_id = ?, erro = ?, atualizado_em = ? WHERE tracking = ?",
+            (status, reserva_id, erro, time.time(), tracking),
+        )
+        print(f"✅ FilaReservaPublica: {tracking} -> {status}")
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+import threading
 from api.dao.inquilinoDAO import InquilinoDAO
+from api.dao.sqlExecutor import RegistroDuplicadoError
 from api.modelo.inquilino import Inquilino
 from api.utils.errorResponse import ErrorResponse
+from api.utils.indiceBusca import IndiceBusca
+from api.utils.validacao import validar_entidade, parse_campos
 
 """
 Classe responsável pela camada de serviço para a entidade Inquilino.
@@ -10,61 +14,69 @@ Observações sobre injeção de dependência:
 - O InquilinoService recebe uma instância de InquilinoDAO via construtor.
 - Isso segue o padrão de injeção de dependência, tornando o serviço desacoplado
   do DAO concreto, facilitando testes unitários e substituição por mocks.
+- O IndiceBusca (opcional) atende GET /inquilinos/busca sem ir ao banco;
+  as escritas deste service o mantêm sincronizado.
 """
 class InquilinoService:
-    def __init__(self, Inquilino_dao_dependency: InquilinoDAO):
+    LIMITE_BUSCA_MAXIMO = 100
+
+    def __init__(self, Inquilino_dao_dependency: InquilinoDAO, indice_busca: IndiceBusca | None = None):
         """
         Construtor da classe InquilinoService
 
         :param Inquilino_dao_dependency: InquilinoDAO - Instância de InquilinoDAO
+        :param indice_busca: IndiceBusca - índice de typeahead (None = criado com os padrões)
         """
         print("⬆️  InquilinoService.__init__()")
         self.__InquilinoDAO = Inquilino_dao_dependency  # injeção de dependência
+        self.__indice = indice_busca or IndiceBusca(
+            campos=("nome", "email", "telefone", "cpf"),
+            chave="idInquilino",
+            campos_numericos=("telefone", "cpf"),
+        )
 
-    def createInquilino(self, InquilinoBodyRequest: dict) -> int:
+    def createInquilino(self, InquilinoBodyRequest: Inquilino | dict) -> int:
         """
         Cria um novo Inquilino.
 
-        :param InquilinoBodyRequest: dict - Dados do Inquilino {"nomeInquilino"}
+        :param InquilinoBodyRequest: Inquilino já validado (g.inquilino) ou dict {"nomeInquilino", ...}
         :return: int - ID do novo Inquilino criado
 
         🔹 Validações:
         - nomeInquilino não pode estar vazio
-        - Não pode existir outro Inquilino com mesmo nome
+        - Não pode existir outro Inquilino com mesmo nome (restrição UNIQUE do banco,
+          verificada no próprio INSERT: um único round trip e sem corrida entre workers)
         """
         print("🟣 InquilinoService.createInquilino()")
 
-        inquilino = Inquilino()
-        inquilino.nomeInquilino = InquilinoBodyRequest.get("nomeInquilino")
-        inquilino.email = InquilinoBodyRequest.get("email")
-        inquilino.telefone = InquilinoBodyRequest.get("telefone")
-        inquilino.requisicao = InquilinoBodyRequest.get("requisicao")
-        inquilino.cpf = InquilinoBodyRequest.get("cpf")
-
-        # valida regra de negócio: Inquilino duplicado
-        resultado = self.__InquilinoDAO.findByField("nome", inquilino.nomeInquilino)
-        if resultado and len(resultado) > 0:
-            raise ErrorResponse(
-                400,
-                "Inquilino já existe",
-                {"message": f"O Inquilino {inquilino.nomeInquilino} já existe"}
-            )
-
-        return self.__InquilinoDAO.create(inquilino)
-
-    def findAll(self) -> list[dict]:
+        inquilino = validar_entidade(Inquilino, InquilinoBodyRequest, "Erro na validação de dados")
+
+        try:
+            novo_id = self.__InquilinoDAO.create(inquilino)
+        except RegistroDuplicadoError:
+            raise self.__erro_duplicado(inquilino.nomeInquilino) from None
+        self.__indexar(novo_id, inquilino)
+        return novo_id
+
+    def findAll(self, campos: tuple | None = None) -> list[dict]:
         """
         Retorna todos os Inquilinos
+        :param campos: colunas a retornar (?fields=); None = todas
         :return: list[dict]
         """
         print("🟣 InquilinoService.findAll()")
-        return self.__InquilinoDAO.findAll()
+        return self.__InquilinoDAO.findAll(campos)
+
+    def parse_fields(self, valor: str | None) -> tuple | None:
+        """Valida ?fields= contra as colunas permitidas de InquilinoDAO."""
+        return parse_campos(valor, InquilinoDAO.CAMPOS_PERMITIDOS)
 
-    def findById(self, idInquilino: int) -> dict | None:
+    def findById(self, idInquilino: int, campos: tuple | None = None) -> dict | None:
         """
         Retorna um Inquilino por ID.
 
         :param idInquilino: int
+        :param campos: colunas a retornar (?fields=); None = todas
         :return: dict | None
         """
         print("🟣 InquilinoService.findById()")
@@ -72,31 +84,31 @@ class InquilinoService:
         inquilino = Inquilino()
         inquilino.idInquilino = idInquilino  # passa pela validação de domínio
 
-        return self.__InquilinoDAO.findById(inquilino.idInquilino)
+        return self.__InquilinoDAO.findById(inquilino.idInquilino, campos)
 
-    def updateInquilino(self, idInquilino: int, jsonInquilino: dict) -> bool:
-        print (jsonInquilino)
+    def updateInquilino(self, idInquilino: int, jsonInquilino: Inquilino | dict) -> bool:
         """
         Atualiza um Inquilino existente.
 
         🔹 Regra de domínio: o idInquilino deve ser um número inteiro positivo.
 
         :param idInquilino: int - Identificador do Inquilino a ser atualizado
-        :param jsonInquilino: dict - Dados do Inquilino {"nomeInquilino", "email", "telefone", "requisicao", "cpf"}
+        :param jsonInquilino: Inquilino já validado (g.inquilino) ou dict {"nomeInquilino", "email", "telefone", "requisicao", "cpf"}
         :return: bool - True se atualizado com sucesso
         :raises ValueError: se idInquilino ou nomeInquilino não atenderem às regras de domínio
         """
         print("🟣 InquilinoService.updateInquilino()")
 
-        inquilino = Inquilino()
+        inquilino = validar_entidade(Inquilino, jsonInquilino, "Erro na validação de dados")
         inquilino.idInquilino = idInquilino
-        inquilino.nomeInquilino = jsonInquilino.get("nomeInquilino")
-        inquilino.email = jsonInquilino.get("email")
-        inquilino.telefone = jsonInquilino.get("telefone")
-        inquilino.requisicao = jsonInquilino.get("requisicao")
-        inquilino.cpf = jsonInquilino.get("cpf")
 
-        return self.__InquilinoDAO.update(inquilino)
+        try:
+            atualizado = self.__InquilinoDAO.update(inquilino)
+        except RegistroDuplicadoError:
+            raise self.__erro_duplicado(inquilino.nomeInquilino) from None
+        if atualizado:
+            self.__indexar(inquilino.idInquilino, inquilino)
+        return atualizado
 
     def deleteInquilino(self, idInquilino: int) -> bool:
         """
@@ -110,4 +122,70 @@ class InquilinoService:
         inquilino = Inquilino()
         inquilino.idInquilino = idInquilino  # validação de regra de domínio
 
-        return self.__InquilinoDAO.delete(inquilino)
\ No newline at end of file
+        excluiu = self.__InquilinoDAO.delete(inquilino)
+        if excluiu:
+            self.__indice.remover(inquilino.idInquilino)
+        return excluiu
+
+    def buscar(self, consulta: str | None, limite: str | int | None = None) -> list[dict]:
+        """
+        Busca typeahead por nome, email, telefone ou cpf (sem acento, prefixo/substring).
+
+        :param consulta: texto digitado (?q=)
+        :param limite: máximo de resultados (?limite=, padrão 20, máximo 100)
+        :return: list[dict] com idInquilino, nome, email, telefone e cpf
+        """
+        print("🟣 InquilinoService.buscar()")
+
+        if consulta is None or not consulta.strip():
+            raise ErrorResponse(400, "Parâmetro q é obrigatório", {"message": "Informe o texto a buscar em ?q="})
+        try:
+            limite = int(limite) if limite not in (None, "") else 20
+        except (TypeError, ValueError):
+            raise ErrorResponse(400, "Parâmetro limite inválido", {"message": "limite deve ser um número inteiro"})
+        if not 1 <= limite <= self.LIMITE_BUSCA_MAXIMO:
+            raise ErrorResponse(400, "Parâmetro limite inválido", {"message": f"limite deve estar entre 1 e {self.LIMITE_BUSCA_MAXIMO}"})
+
+        self.__atualizar_indice()
+        return self.__indice.buscar(consulta, limite)
+
+    def __atualizar_indice(self):
+        """Constrói o índice na primeira busca; depois do TTL, reconstrói em segundo plano."""
+        if not self.__indice.precisa_reconstruir() or not self.__indice.marcar_reconstrucao():
+            return
+        if not self.__indice.construido():
+            try:
+                self.__reconstruir_indice()
+            finally:
+                self.__indice.liberar_reconstrucao()
+            return
+        # o índice antigo continua atendendo enquanto o novo é montado
+        threading.Thread(target=self.__reconstruir_em_segundo_plano, name="indice-inquilinos", daemon=True).start()
+
+    def __reconstruir_em_segundo_plano(self):
+        try:
+            self.__reconstruir_indice()
+        except Exception as e:
+            print(f"❌ InquilinoService: falha ao reconstruir índice de busca: {e}")
+        finally:
+            self.__indice.liberar_reconstrucao()
+
+    def __reconstruir_indice(self):
+        self.__indice.reconstruir(lambda: self.__InquilinoDAO.findAll(self.__indice.campos + (self.__indice.chave,)))
+
+    def __indexar(self, idInquilino: int, inquilino: Inquilino):
+        self.__indice.adicionar({
+            "idInquilino": int(idInquilino),
+            "nome": inquilino.nomeInquilino,
+            "email": inquilino.email,
+            "telefone": inquilino.telefone,
+            "cpf": inquilino.cpf,
+        })
+
+    @staticmethod
+    def __erro_duplicado(nome: str) -> ErrorResponse:
+        return ErrorResponse(
+            400,
+            "Inquilino já existe",
+            {"message": f"O Inquilino {nome} já existe"}
+        )
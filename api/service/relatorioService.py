@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from api.dao.relatorioDAO import RelatorioDAO
+from api.modelo.validadores import para_date
+from api.utils.errorResponse import ErrorResponse
+from api.utils.logEventos import LogEventos
+from api.utils.cacheSWR import CacheSWR
+
+"""
+Camada de serviço dos relatórios gerenciais (ocupação, estadia, antecedência e retorno).
+
+- As tabelas reserva e chale são lidas de uma vez (RelatorioDAO, por coluna) e
+  viram DataFrames tipados: ids int64 e datas datetime64. Os cálculos são
+  operações vetorizadas sobre essas colunas, sem laço por reserva.
+- Os DataFrames ficam em memória até RELATORIOS_TTL segundos ou até surgir um
+  evento novo no log de reservas (qualquer worker que criar/alterar/excluir uma
+  reserva publica em eventos_reserva).
+- O resultado de cada período, guardado por (de, ate, idChale), também depende
+  do log de reservas; passado RELATORIOS_TTL ele continua sendo servido por até
+  RELATORIOS_STALE segundos enquanto uma única thread o recalcula (CacheSWR).
+- Não há preço/tarifa no banco: "receita" aparece como noites vendidas.
+"""
+class RelatorioService:
+    MESES_PADRAO = 12  # período padrão: últimos 12 meses, incluindo o atual
+    MAX_DIAS_PERIODO = 366 * 5
+
+    def __init__(self, relatorio_dao: RelatorioDAO, eventos: LogEventos | None = None,
+                 ttl: float | None = None, max_resultados: int | None = None, janela_stale: float | None = None):
+        """
+        :param relatorio_dao: RelatorioDAO - leitura em massa de reservas e chalés
+        :param eventos: LogEventos das reservas; um id novo invalida os dados carregados
+        :param ttl: segundos de validade dos dados carregados (padrão RELATORIOS_TTL ou 300)
+        :param max_resultados: períodos guardados em cache (padrão RELATORIOS_CACHE_MAX ou 64)
+        :param janela_stale: segundos em que um resultado vencido ainda é servido (padrão RELATORIOS_STALE ou 600)
+        """
+        print("⬆️  RelatorioService.__init__()")
+        self.__RelatorioDAO = relatorio_dao
+        self.__eventos = eventos
+        self.__ttl = ttl if ttl is not None else float(os.environ.get("RELATORIOS_TTL", 300))
+        self.__dados = None  # (versao, expira_em, reservas, chales)
+        self.__resultados = CacheSWR(
+            "relatorios",
+            self.__ttl,
+            janela_stale if janela_stale is not None else float(os.environ.get("RELATORIOS_STALE", 600)),
+            max_resultados or int(os.environ.get("RELATORIOS_CACHE_MAX", 64)),
+            versao=self.__versao,
+        )
+        self.__trava_carga = threading.Lock()
+
+    def ocupacao(self, args) -> dict:
+        """
+        Relatório de ocupação (?de=&ate=&idChale=).
+
+        :return: dict com periodo, resumo (todos os chalés filtrados) e chales
+                 (ocupação total e por mês de cada chalé)
+        """
+        print("🟣 RelatorioService.ocupacao()")
+
+        de, ate = self.__parse_periodo(args)
+        id_chale = self.__parse_id_chale(args.get("idChale"))
+        return self.__resultados.obter((de, ate, id_chale), lambda: self.__ocupacao(de, ate, id_chale))
+
+    def __ocupacao(self, de: date, ate: date, id_chale: int | None) -> dict:
+        _, _, reservas, chales = self.__carregar(self.__versao())
+        if id_chale is not None:
+            chales = chales[chales["idChale"] == id_chale]
+            if chales.empty:
+                raise ErrorResponse(404, "Chalé não encontrado", {"message": f"idChale {id_chale} não existe"})
+        return self.__calcular(reservas, chales, de, ate, id_chale)
+
+    def __versao(self) -> int:
+        return self.__eventos.ultimo_id() if self.__eventos else 0
+
+    def __carregar(self, versao: int):
+        """DataFrames de reservas e chalés da versão atual (uma carga por vez; as outras esperam e reaproveitam)."""
+        dados = self.__dados
+        if dados and dados[0] == versao and dados[1] > time.monotonic():
+            return dados
+        with self.__trava_carga:
+            dados = self.__dados
+            if dados and dados[0] == versao and dados[1] > time.monotonic():
+                return dados
+
+            inicio = time.perf_counter()
+            colunas = self.__RelatorioDAO.reservas()
+            reservas = pd.DataFrame({
+                "idReserva": np.asarray(colunas["idReserva"], dtype=np.int64),
+                "idInquilino": np.asarray(colunas["idInquilino"], dtype=np.int64),
+                "idChale": np.asarray(colunas["idChale"], dtype=np.int64),
+                "inicio": self._datas(colunas["inicio"]),
+                "fim": self._datas(colunas["fim"]),
+                "criado_em": self._datas(colunas["criado_em"]),
+            })
+            colunas = self.__RelatorioDAO.chales()
+            chales = pd.DataFrame({
+                "idChale": np.asarray(colunas["idChale"], dtype=np.int64),
+                "nome": pd.Series(colunas["nome"], dtype=object),
+                "capacidade": np.asarray(colunas["capacidade"], dtype=np.int64),
+            })
+
+            dados = (versao, time.monotonic() + self.__ttl, reservas, chales)
+            self.__dados = dados
+            print(f"📊 RelatorioService: {len(reservas)} reservas carregadas em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+            return dados
+
+    @staticmethod
+    def _datas(valores: list) -> np.ndarray:
+        """date/datetime (MySQL) ou texto ISO (SQLite) -> datetime64[D]; inválidos/NULL viram NaT."""
+        serie = pd.to_datetime(pd.Series(valores, dtype=object), format="ISO8601", errors="coerce")
+        return serie.to_numpy(dtype="datetime64[D]")
+
+    def __calcular(self, reservas: pd.DataFrame, chales: pd.DataFrame, de: date, ate: date, id_chale: int | None) -> dict:
+        inicio_periodo = np.datetime64(de, "D")
+        fim_periodo = np.datetime64(ate, "D") + 1  # exclusivo: a noite de 'ate' conta
+
+        # reservas com ao menos uma noite no período (noites: de inicio até fim - 1)
+        todas = reservas
+        if id_chale is not None:
+            reservas = reservas[reservas["idChale"] == id_chale]
+        no_periodo = reservas[(reservas["fim"] > inicio_periodo) & (reservas["inicio"] < fim_periodo)]
+
+        # uma linha por noite vendida dentro do período -> contagem por (chalé, mês)
+        # (o pandas guarda as datas em datetime64[s]; a conta de noites é em dias)
+        ini = np.maximum(no_periodo["inicio"].to_numpy(dtype="datetime64[D]"), inicio_periodo)
+        fim = np.minimum(no_periodo["fim"].to_numpy(dtype="datetime64[D]"), fim_periodo)
+        noites = (fim - ini).astype(np.int64)
+        posicao = np.repeat(np.arange(len(noites)), noites)
+        deslocamento = np.arange(noites.sum()) - np.repeat(np.cumsum(noites) - noites, noites)
+        meses_noite = (ini[posicao] + deslocamento.astype("timedelta64[D]")).astype("datetime64[M]")
+
+        meses = np.arange(inicio_periodo.astype("datetime64[M]"), (fim_periodo - 1).astype("datetime64[M]") + 1)
+        dias_mes = (
+            np.minimum((meses + 1).astype("datetime64[D]"), fim_periodo)
+            - np.maximum(meses.astype("datetime64[D]"), inicio_periodo)
+        ).astype(np.int64)
+
+        ids_chales = chales["idChale"].to_numpy()
+        noites_chale_mes = (
+            pd.DataFrame({"idChale": no_periodo["idChale"].to_numpy()[posicao], "mes": meses_noite})
+            .groupby(["idChale", "mes"]).size()
+            .reindex(pd.MultiIndex.from_product([ids_chales, meses]), fill_value=0)
+            .to_numpy().reshape(len(ids_chales), len(meses))
+        )
+        dias_periodo = int(dias_mes.sum())
+        noites_chale = noites_chale_mes.sum(axis=1)
+        rotulos_meses = [str(mes) for mes in meses]
+
+        lista_chales = []
+        for i, (id_c, nome) in enumerate(zip(ids_chales, chales["nome"])):
+            lista_chales.append({
+                "idChale": int(id_c),
+                "nome": nome,
+                "noites": int(noites_chale[i]),
+                "dias": dias_periodo,
+                "ocupacao": self.__taxa(noites_chale[i], dias_periodo),
+                "meses": [
+                    {"mes": rotulo, "noites": int(n), "dias": int(d), "ocupacao": self.__taxa(n, d)}
+                    for rotulo, n, d in zip(rotulos_meses, noites_chale_mes[i], dias_mes)
+                ],
+            })
+
+        # estadia: duração total das reservas com noites no período
+        estadias = (no_periodo["fim"] - no_periodo["inicio"]).dt.days
+
+        # antecedência: dias entre a criação e o check-in, para check-ins no período
+        chegadas = no_periodo[(no_periodo["inicio"] >= inicio_periodo) & no_periodo["criado_em"].notna()]
+        antecedencia = (chegadas["inicio"] - chegadas["criado_em"]).dt.days.clip(lower=0)
+
+        # retorno: hóspedes do período com 2+ reservas (em qualquer chalé) iniciadas até 'ate'
+        hospedes = no_periodo["idInquilino"].unique()
+        reservas_por_hospede = todas.loc[todas["inicio"] < fim_periodo, "idInquilino"].value_counts()
+        recorrentes = int((reservas_por_hospede.reindex(hospedes, fill_value=0) >= 2).sum())
+
+        total_noites = int(noites_chale.sum())
+        return {
+            "periodo": {"de": de.isoformat(), "ate": ate.isoformat(), "dias": dias_periodo, "idChale": id_chale},
+            "resumo": {
+                "chales": len(ids_chales),
+                "reservas": int(len(no_periodo)),
+                "noites_vendidas": total_noites,
+                "noites_disponiveis": dias_periodo * len(ids_chales),
+                "ocupacao": self.__taxa(total_noites, dias_periodo * len(ids_chales)),
+                "estadia_media": self.__media(estadias),
+                "estadia_mediana": self.__mediana(estadias),
+                "antecedencia_media": self.__media(antecedencia),
+                "antecedencia_mediana": self.__mediana(antecedencia),
+                "antecedencia_amostras": int(len(antecedencia)),
+                "hospedes": int(len(hospedes)),
+                "hospedes_recorrentes": recorrentes,
+                "taxa_retorno": self.__taxa(recorrentes, len(hospedes)),
+            },
+            "chales": lista_chales,
+        }
+
+    @staticmethod
+    def __taxa(parte, total) -> float | None:
+        return round(float(parte) / float(total), 4) if total else None
+
+    @staticmethod
+    def __media(serie: pd.Series) -> float | None:
+        return round(float(serie.mean()), 2) if len(serie) else None
+
+    @staticmethod
+    def __mediana(serie: pd.Series) -> float | None:
+        return round(float(serie.median()), 2) if len(serie) else None
+
+    def __parse_periodo(self, args) -> tuple[date, date]:
+        """?de=&ate= (YYYY-MM-DD ou DD/MM/YYYY); padrão: do 1º dia de 11 meses atrás ao fim do mês atual."""
+        mes_atual = np.datetime64(date.today(), "M")
+        padrao = {
+            "de": (mes_atual - (self.MESES_PADRAO - 1)).astype("datetime64[D]").item(),
+            "ate": ((mes_atual + 1).astype("datetime64[D]") - 1).item(),
+        }
+        periodo = {}
+        for chave in ("de", "ate"):
+            valor = args.get(chave)
+            if not valor:
+                periodo[chave] = padrao[chave]
+                continue
+            periodo[chave] = para_date(valor)
+            if periodo[chave] is None:
+                raise ErrorResponse(400, "Período inválido", {"message": f"{chave} deve estar no formato YYYY-MM-DD ou DD/MM/YYYY."})
+
+        if periodo["de"] > periodo["ate"]:
+            raise ErrorResponse(400, "Período inválido", {"message": "de deve ser anterior ou igual a ate."})
+        if (periodo["ate"] - periodo["de"]).days >= self.MAX_DIAS_PERIODO:
+            raise ErrorResponse(400, "Período inválido", {"message": f"O período pode ter no máximo {self.MAX_DIAS_PERIODO} dias."})
+        return periodo["de"], periodo["ate"]
+
+    @staticmethod
+    def __parse_id_chale(valor: str | None) -> int | None:
+        if not valor:
+            return None
+        if not valor.isdigit() or int(valor) <= 0:
+            raise ErrorResponse(400, "Parâmetro idChale inválido", {"message": "idChale deve ser um inteiro positivo."})
+        return int(valor)
@@ -1,31 +1,43 @@
 # -*- coding: utf-8 -*-
+from api.utils.errorResponse import ErrorResponse
+from api.modelo.validadores import para_date
+
 """
 Serviço SIMPLIFICADO para reservas públicas.
-NÃO cria inquilino, NÃO verifica disponibilidade.
-Usa ID fixo e mapeamento simples.
+NÃO cria inquilino. Usa ID fixo de inquilino.
+
+O chalé é escolhido automaticamente entre os do tipo pedido (CatalogoChales):
+o menor que comporta o grupo e, entre esses, o que deixa menos noites soltas
+no calendário. Sem catálogo (ou sem chalés daquele tipo cadastrados) vale o
+mapeamento fixo MAPEAMENTO_CHALES.
 """
 
 class ReservaPublicaService:
     """
     Serviço para reservas públicas via site.
-    Versão SIMPLES: usa IDs fixos pré-configurados.
+    Versão SIMPLES: inquilino fixo pré-configurado; chalé alocado pelo tipo.
     """
     
     
     ID_INQUILINO_PUBLICO = 999  # Deve existir na tabela inquilinos
     
-    # Mapeamento: código do site -> ID real no banco
+    # Mapeamento: código do site -> ID real no banco (fallback quando o tipo não está no catálogo)
     MAPEAMENTO_CHALES = {
         "romantico": 13,   # Chalé Romântico
         "familiar": 14,    # Chalé Familiar
         "premium": 26      # Suíte Premium
     }
     
-    def __init__(self, reserva_service):
+    # Candidatos livres tentados quando outro pedido ocupa o chalé escolhido antes do INSERT
+    MAX_TENTATIVAS_ALOCACAO = 3
+    
+    def __init__(self, reserva_service, catalogo=None):
         """
         :param reserva_service: Instância do ReservaService existente
+        :param catalogo: CatalogoChales opcional (chalés por tipo e capacidade)
         """
         self.reserva_service = reserva_service
+        self.catalogo = catalogo
     
     def criar_reserva_simples(self, dados_formulario):
         """
@@ -38,32 +50,93 @@ class ReservaPublicaService:
             int: ID da reserva criada
         
         Raises:
-            Exception: Se dados inválidos
+            ErrorResponse: 400 se dados inválidos, 409 se nenhum chalé do tipo estiver livre
         """
         print("🔵 ReservaPublicaService.criar_reserva_simples()")
         
-        # 1. VALIDAR DADOS BÁSICOS
-        self._validar_dados_obrigatorios(dados_formulario)
-        
-        # 2. MAPEAR CHALÉ DESEJADO PARA ID REAL
-        chale_id = self._mapear_chale(dados_formulario["chale_desejado"])
-        
-        # 3. PREPARAR DADOS PARA O SERVICE DE RESERVA EXISTENTE
-        dados_reserva = {
-            "idInquilino": self.ID_INQUILINO_PUBLICO,
-            "idChale": chale_id,
-            "inicio": dados_formulario["data_inicio"],
-            "fim": dados_formulario["data_fim"],
-            "observacoes": self._gerar_observacoes(dados_formulario)
-        }
+        # 1. VALIDAR DADOS BÁSICOS E NORMALIZAR O TIPO DE CHALÉ DESEJADO
+        tipo = self.validar_formulario(dados_formulario)
+        
+        # 2. ESCOLHER O CHALÉ (catálogo por tipo/capacidade ou mapeamento fixo)
+        candidatos = self.alocar_chales(
+            tipo, int(dados_formulario["numero_pessoas"]),
+            dados_formulario["data_inicio"], dados_formulario["data_fim"]
+        )
+        
+        for tentativa, chale_id in enumerate(candidatos[:self.MAX_TENTATIVAS_ALOCACAO], start=1):
+            # 3. PREPARAR DADOS PARA O SERVICE DE RESERVA EXISTENTE
+            dados_reserva = {
+                "idInquilino": self.ID_INQUILINO_PUBLICO,
+                "idChale": chale_id,
+                "inicio": dados_formulario["data_inicio"],
+                "fim": dados_formulario["data_fim"],
+                "observacoes": self._gerar_observacoes(dados_formulario)
+            }
+            
+            print(f"📤 Dados preparados para reserva_service: {dados_reserva}")
+            
+            # 4. CHAMAR SERVIÇO EXISTENTE (valida de novo a sobreposição antes do INSERT)
+            try:
+                reserva_id = self.reserva_service.createReserva(dados_reserva)
+            except ErrorResponse as e:
+                ultima = tentativa == min(len(candidatos), self.MAX_TENTATIVAS_ALOCACAO)
+                if e.getMessage() != self.reserva_service.ERRO_CONFLITO or ultima:
+                    raise
+                print(f"⚠️  Chalé {chale_id} ocupado por outro pedido; tentando o próximo")
+                continue
+            
+            print(f"✅ Reserva pública criada: ID {reserva_id} (chalé {chale_id})")
+            return reserva_id
+    
+    def alocar_chales(self, tipo, pessoas, inicio, fim):
+        """
+        Chalés livres do tipo para o período, do melhor para o pior.
         
-        print(f"📤 Dados preparados para reserva_service: {dados_reserva}")
+        Ordem: menor folga de capacidade (capacidade - pessoas), depois menos noites
+        sobrando entre a estadia e as reservas vizinhas (encaixa a estadia nos buracos
+        pequenos e preserva os períodos longos livres), depois menos sobras (um lado
+        colado numa reserva é melhor que dois buracos).
         
-        # 4. CHAMAR SERVIÇO EXISTENTE (já testado e funciona)
-        reserva_id = self.reserva_service.createReserva(dados_reserva)
+        Returns:
+            list[int]: IDs dos chalés
         
-        print(f"✅ Reserva pública criada: ID {reserva_id}")
-        return reserva_id
+        Raises:
+            ErrorResponse: 409 se nenhum chalé do tipo comporta o grupo ou está livre
+        """
+        if self.catalogo is None or not self.catalogo.possui_tipo(tipo):
+            return [self._mapear_chale(tipo)]
+        
+        chales = {chale["idChale"]: chale for chale in self.catalogo.candidatos(tipo, pessoas)}
+        if not chales:
+            raise ErrorResponse(409, "Nenhum chalé disponível", {
+                "message": f"Nenhum chalé '{tipo}' comporta {pessoas} pessoas."
+            })
+        
+        livres = self.reserva_service.chalesLivres(list(chales), inicio, fim)
+        if not livres:
+            raise ErrorResponse(409, "Nenhum chalé disponível", {
+                "message": f"Todos os chalés '{tipo}' estão ocupados neste período."
+            })
+        
+        def prioridade(livre):
+            sobras = (livre["sobra_antes"], livre["sobra_depois"])
+            folga = chales[livre["idChale"]]["capacidade"] - pessoas
+            return folga, sum(sobras), sum(1 for sobra in sobras if sobra), livre["idChale"]
+        
+        return [livre["idChale"] for livre in sorted(livres, key=prioridade)]
+    
+    def validar_formulario(self, dados_formulario):
+        """
+        Validação barata (sem acesso ao banco) usada antes de enfileirar o pedido.
+
+        Returns:
+            str: tipo de chalé desejado, em minúsculas
+        """
+        self._validar_dados_obrigatorios(dados_formulario)
+        tipo = str(dados_formulario["chale_desejado"]).strip().lower()
+        if self.catalogo is None or not self.catalogo.possui_tipo(tipo):
+            self._mapear_chale(tipo)  # fora do catálogo: precisa estar no mapeamento fixo
+        return tipo
     
     def _validar_dados_obrigatorios(self, dados):
         """Valida campos obrigatórios"""
@@ -75,11 +148,29 @@ class ReservaPublicaService:
         faltantes = [campo for campo in obrigatorios if not dados.get(campo)]
         
         if faltantes:
-            raise Exception(f"Campos obrigatórios faltando: {', '.join(faltantes)}")
-        
-        # Validar formato das datas (básico)
-        if dados["data_fim"] <= dados["data_inicio"]:
-            raise Exception("Data de check-out deve ser posterior ao check-in")
+            raise ErrorResponse(400, "Campos obrigatórios faltando", {
+                "message": f"Campos obrigatórios faltando: {', '.join(faltantes)}"
+            })
+        
+        # Datas impossíveis (ex.: 2027-13-01) param aqui, antes da alocação
+        inicio, fim = para_date(dados["data_inicio"]), para_date(dados["data_fim"])
+        if inicio is None or fim is None:
+            raise ErrorResponse(400, "Data inválida", {
+                "message": "data_inicio e data_fim devem ser datas válidas (YYYY-MM-DD ou DD/MM/YYYY)"
+            })
+        if fim <= inicio:
+            raise ErrorResponse(400, "Período inválido", {
+                "message": "Data de check-out deve ser posterior ao check-in"
+            })
+        
+        try:
+            pessoas = int(dados["numero_pessoas"])
+        except (TypeError, ValueError):
+            pessoas = 0
+        if pessoas < 1:
+            raise ErrorResponse(400, "Número de pessoas inválido", {
+                "message": "numero_pessoas deve ser um número inteiro positivo"
+            })
     
     def _mapear_chale(self, chale_desejado):
         """Converte 'romantico' para ID 1, etc."""
@@ -87,10 +178,10 @@ class ReservaPublicaService:
         
         if not chale_id:
             chal_disponiveis = list(self.MAPEAMENTO_CHALES.keys())
-            raise Exception(
-                f"Chalé '{chale_desejado}' não encontrado. "
-                f"Opções: {', '.join(chal_disponiveis)}"
-            )
+            raise ErrorResponse(400, "Chalé não encontrado", {
+                "message": f"Chalé '{chale_desejado}' não encontrado. "
+                           f"Opções: {', '.join(chal_disponiveis)}"
+            })
         
         return chale_id
     
@@ -4,65 +4,73 @@ from api.dao.inquilinoDAO import InquilinoDAO
 from api.dao.chaleDAO import ChaleDAO
 from api.modelo.reserva import Reserva
 from api.utils.errorResponse import ErrorResponse
-from datetime import datetime, date
+from api.database.circuito import BancoIndisponivelError
+from api.utils.logEventos import LogEventos
+from api.utils.cacheSWR import CacheSWR
+from api.utils import exportador
+from api.utils.janelasLivres import janelas_livres
+from api.utils.validacao import validar_entidade, parse_campos
+from api.modelo.validadores import para_date
+from datetime import datetime, date, timedelta
+from itertools import groupby
 
 class ReservaService:
-	def __init__(self, reserva_dao: ReservaDAO, inquilino_dao: InquilinoDAO, chale_dao: ChaleDAO):
+	# Colunas do export (ordem do arquivo) e tipos usados no esquema Parquet
+	COLUNAS_EXPORT = {
+		"idReserva": int, "inicio": date, "fim": date, "noites": int,
+		"idInquilino": int, "inquilino": str, "email_inquilino": str, "cpf_inquilino": str,
+		"idChale": int, "chale": str,
+	}
+	TAMANHO_LOTE_EXPORT = 5000  # linhas por lote lido do banco (e por row group no Parquet)
+	# Busca de datas livres (GET /reservas/disponibilidade)
+	MODOS_DISPONIBILIDADE = ("primeira", "todas")
+	MAX_DIAS_DISPONIBILIDADE = 366
+	MAX_OPCOES_DISPONIBILIDADE = 500
+	# Alocação automática: dias antes/depois da estadia considerados no cálculo de fragmentação
+	HORIZONTE_ALOCACAO = 30
+	ERRO_CONFLITO = "Conflito de reserva"
+
+	def __init__(self, reserva_dao: ReservaDAO, inquilino_dao: InquilinoDAO, chale_dao: ChaleDAO, eventos: LogEventos | None = None,
+				 cache_listas: CacheSWR | None = None):
+		"""
+		:param eventos: LogEventos opcional; recebe reserva.criada/atualizada/excluida (GET /reservas/eventos)
+		:param cache_listas: CacheSWR opcional para as listagens (findByFiltro); invalidado pelas escritas
+		"""
 		print("⬆️  ReservaService.__init__()")
 		self.__ReservaDAO = reserva_dao
 		self.__InquilinoDAO = inquilino_dao
 		self.__ChaleDAO = chale_dao
+		self.__eventos = eventos
+		self.__cache_listas = cache_listas
+
+	def createReserva(self, reservaBodyRequest: Reserva | dict) -> int:
+		"""
+		Cria uma nova Reserva.
+
+		:param reservaBodyRequest: Reserva já validada (g.reserva) ou dict {"idInquilino", "idChale", "inicio", "fim"}
+		:return: int - ID da nova reserva
 
-	def createReserva(self, reservaBodyRequest: dict) -> int:
+		As regras de domínio (ids, formato e ordem das datas, início não anterior
+		a hoje) são aplicadas uma única vez pelo modelo Reserva; aqui restam as
+		validações que dependem do banco.
+		"""
 		print("🟣 ReservaService.createReserva()")
 
-		# Validação de campos obrigatórios
-		idInquilino = reservaBodyRequest.get("idInquilino")
-		idChale = reservaBodyRequest.get("idChale")
-		inicio = reservaBodyRequest.get("inicio")
-		fim = reservaBodyRequest.get("fim")
+		reserva = validar_entidade(Reserva, reservaBodyRequest, "Erro de validação de dados da Reserva")
 
 		# Validação de chaves estrangeiras
-		if not idInquilino or not self.__InquilinoDAO.findById(idInquilino):
-			raise ErrorResponse(400, "Inquilino não encontrado", {"message": f"idInquilino {idInquilino} não existe"})
-		if not idChale or not self.__ChaleDAO.findById(idChale):
-			raise ErrorResponse(400, "Chalé não encontrado", {"message": f"idChale {idChale} não existe"})
-
-		# Validação de datas
-		valid, errors = self._validar_datas(inicio, fim)
-		if not valid:
-			raise ErrorResponse(400, "Erro de validação de datas", {"errors": errors})
+		if not self.__InquilinoDAO.findById(reserva.idInquilino):
+			raise ErrorResponse(400, "Inquilino não encontrado", {"message": f"idInquilino {reserva.idInquilino} não existe"})
+		if not self.__ChaleDAO.findById(reserva.idChale):
+			raise ErrorResponse(400, "Chalé não encontrado", {"message": f"idChale {reserva.idChale} não existe"})
 
 		# Impedir sobreposição de reservas para o mesmo chalé
-		if self._existe_sobreposicao(idChale, inicio, fim):
-			raise ErrorResponse(400, "Conflito de reserva", {"message": "Já existe uma reserva para este chalé neste período."})
-
-		reserva = Reserva()
-		reserva.idInquilino = idInquilino
-		reserva.idChale = idChale
-		reserva.inicio = inicio
-		reserva.fim = fim
-
-		return self.__ReservaDAO.create(reserva)
+		if self._existe_sobreposicao(reserva.idChale, reserva.inicio, reserva.fim):
+			raise ErrorResponse(400, self.ERRO_CONFLITO, {"message": "Já existe uma reserva para este chalé neste período."})
 
-	def _validar_datas(self, inicio, fim):
-		errors = []
-		try:
-			di = datetime.strptime(str(inicio), "%Y-%m-%d").date()
-		except Exception:
-			errors.append("Data de início inválida ou formato incorreto (esperado YYYY-MM-DD).")
-			di = None
-		try:
-			df = datetime.strptime(str(fim), "%Y-%m-%d").date()
-		except Exception:
-			errors.append("Data de fim inválida ou formato incorreto (esperado YYYY-MM-DD).")
-			df = None
-		if di and df:
-			if df <= di:
-				errors.append("Data de fim deve ser posterior à data de início.")
-			if di < date.today():
-				errors.append("Data de início não pode ser anterior a hoje.")
-		return (len(errors) == 0), errors
+		novo_id = self.__ReservaDAO.create(reserva)
+		self.__publicar("reserva.criada", novo_id, reserva)
+		return novo_id
 
 	def _normalizar_data(self, data_input):
 		"""
@@ -111,6 +119,9 @@ class ReservaService:
 		try:
 			reservas = self.__ReservaDAO.findByField("idChale", idChale)
 			print(f"   Encontradas {len(reservas)} reservas para este chalé")
+		except BancoIndisponivelError:
+			# banco fora do ar não significa "sem sobreposição": a escrita falha com 503
+			raise
 		except Exception as e:
 			print(f"⚠️  Erro ao buscar reservas: {e}")
 			return False
@@ -139,28 +150,100 @@ class ReservaService:
 		print("   ✅ Nenhuma sobreposição encontrada")
 		return False
 
-	def findAll(self) -> list[dict]:
+	def findAll(self, expand: tuple = (), ids: list[int] | None = None, campos: tuple | None = None) -> list[dict]:
+		"""
+		Lista reservas.
+
+		:param expand: relações a incluir ("inquilino", "chale") na mesma query (JOIN)
+		:param ids: busca em lote por idReserva (IN)
+		:param campos: colunas de reserva a retornar (?fields=); None = todas
+		"""
 		print("🟣 ReservaService.findAll()")
-		return self.__ReservaDAO.findAll()
+		if not expand and ids is None:
+			return self.__ReservaDAO.findAll(campos)
+		return self.__ReservaDAO.findMany(ids=ids, expand=expand, campos=campos)
+
+	def findByFiltro(self, filtro: dict, expand: tuple = (), campos: tuple | None = None,
+					 ordem: str = "idReserva", paginacao: dict | None = None) -> tuple[list[dict], dict | None]:
+		"""
+		Lista reservas filtradas/ordenadas/paginadas em uma única query.
+
+		:param filtro: resultado de parse_filtro (predicados combinados com AND)
+		:param paginacao: resultado de parse_paginacao ou None (sem paginação)
+		:return: (reservas, metadados da paginação ou None)
+
+		Com cache_listas, o resultado é compartilhado pelas requisições iguais: vencido,
+		ainda é devolvido enquanto uma única thread o recalcula em segundo plano.
+		"""
+		print("🟣 ReservaService.findByFiltro()")
+		if self.__cache_listas is None:
+			return self.__buscar(filtro, expand, campos, ordem, paginacao)
+		chave = (
+			tuple((nome, tuple(valor) if isinstance(valor, list) else valor) for nome, valor in sorted(filtro.items())),
+			expand, campos, ordem,
+			tuple(sorted(paginacao.items())) if paginacao is not None else None,
+		)
+		return self.__cache_listas.obter(chave, lambda: self.__buscar(filtro, expand, campos, ordem, paginacao))
 
-	def findById(self, idReserva: int) -> dict | None:
+	def __buscar(self, filtro: dict, expand: tuple, campos: tuple | None, ordem: str,
+				 paginacao: dict | None) -> tuple[list[dict], dict | None]:
+		if not filtro and not expand and ordem == "idReserva" and paginacao is None:
+			return self.__ReservaDAO.findAll(campos), None
+
+		if paginacao is None:
+			return self.__ReservaDAO.findByFiltro(filtro, expand, campos, ordem), None
+
+		# busca uma linha a mais para saber se existe próxima página sem um COUNT(*)
+		limite = paginacao["por_pagina"]
+		reservas = self.__ReservaDAO.findByFiltro(filtro, expand, campos, ordem, limite + 1, paginacao["offset"])
+		meta = dict(paginacao, tem_proxima=len(reservas) > limite)
+		return reservas[:limite], meta
+
+	def findById(self, idReserva: int, expand: tuple = (), campos: tuple | None = None) -> dict | None:
 		print("🟣 ReservaService.findById()")
-		return self.__ReservaDAO.findById(idReserva)
+		if not expand:
+			return self.__ReservaDAO.findById(idReserva, campos)
+		# mesma fonte (reserva + reserva_historico) da busca sem expand: reserva arquivada também é encontrada
+		resultados = self.__ReservaDAO.findMany(ids=[idReserva], expand=expand, campos=campos, historico=True)
+		return resultados[0] if resultados else None
 
-	def updateReserva(self, idReserva: int, jsonReserva: dict) -> bool:
+	def parse_fields(self, valor: str | None) -> tuple | None:
+		"""Valida ?fields= contra as colunas permitidas de ReservaDAO."""
+		return parse_campos(valor, ReservaDAO.CAMPOS_PERMITIDOS)
+
+	def parse_expand(self, valor: str | None) -> tuple:
+		"""Converte "inquilino,chale" em ("inquilino", "chale"), validando as relações."""
+		if not valor:
+			return ()
+		nomes = tuple(dict.fromkeys(nome.strip().lower() for nome in valor.split(",") if nome.strip()))
+		invalidos = [nome for nome in nomes if nome not in ReservaDAO.COLUNAS_EXPANSAO]
+		if invalidos:
+			raise ErrorResponse(400, "Parâmetro expand inválido", {
+				"message": f"Relações inválidas: {', '.join(invalidos)}. Use: {', '.join(ReservaDAO.COLUNAS_EXPANSAO)}"
+			})
+		return nomes
+
+	def parse_ids(self, valor: str | None) -> list[int] | None:
+		"""Converte "1,2,3" em [1, 2, 3] (inteiros positivos, sem repetição)."""
+		if valor is None:
+			return None
+		try:
+			ids = list(dict.fromkeys(int(parte) for parte in valor.split(",") if parte.strip()))
+		except ValueError:
+			raise ErrorResponse(400, "Parâmetro ids inválido", {"message": "ids deve ser uma lista de inteiros separados por vírgula."})
+		if any(i <= 0 for i in ids):
+			raise ErrorResponse(400, "Parâmetro ids inválido", {"message": "ids deve conter apenas inteiros positivos."})
+		if len(ids) > ReservaDAO.MAX_IDS:
+			raise ErrorResponse(400, "Parâmetro ids inválido", {"message": f"Máximo de {ReservaDAO.MAX_IDS} ids por requisição."})
+		return ids
+
+	def updateReserva(self, idReserva: int, jsonReserva: Reserva | dict) -> bool:
 		print("🟣 ReservaService.updateReserva()")
 		print(f"   idReserva: {idReserva}")
-		print(f"   jsonReserva: {jsonReserva}")
 		
 		try:
-			reserva = Reserva()
+			reserva = validar_entidade(Reserva, jsonReserva, "Erro de validação de dados da Reserva")
 			reserva.idReserva = idReserva
-			reserva.idInquilino = jsonReserva.get("idInquilino")
-			reserva.idChale = jsonReserva.get("idChale")
-			reserva.inicio = jsonReserva.get("inicio")
-			reserva.fim = jsonReserva.get("fim")
-			
-			print(f"   Objeto Reserva criado com sucesso")
 
 			# Validações de chaves estrangeiras
 			print(f"   Validando idInquilino: {reserva.idInquilino}")
@@ -171,20 +254,18 @@ class ReservaService:
 			if not self.__ChaleDAO.findById(reserva.idChale):
 				raise ErrorResponse(400, "Chalé não encontrado", {"message": f"idChale {reserva.idChale} não existe"})
 			
-			# Validação de datas
-			print(f"   Validando datas: {reserva.inicio} até {reserva.fim}")
-			valid, errors = self._validar_datas(reserva.inicio, reserva.fim)
-			if not valid:
-				raise ErrorResponse(400, "Erro de validação de datas", {"errors": errors})
-			
 			# Verificar sobreposição (ignorando a própria reserva)
 			print(f"   Verificando sobreposição...")
-			if self._existe_sobreposicao(reserva.idChale, reserva.inicio, reserva.fim, idReserva):
+			if self._existe_sobreposicao(reserva.idChale, reserva.inicio, reserva.fim, reserva.idReserva):
 				raise ErrorResponse(400, "Conflito de reserva", {"message": "Já existe uma reserva para este chalé neste período."})
 
 			print(f"   Atualizando no banco de dados...")
 			resultado = self.__ReservaDAO.update(reserva)
 			print(f"   ✅ Atualização concluída: {resultado}")
+			if resultado:
+				self.__publicar("reserva.atualizada", idReserva, reserva)
+			else:
+				self.__rejeitar_arquivada(idReserva, "alterada")
 			return resultado
 			
 		except ErrorResponse as er:
@@ -200,4 +281,272 @@ class ReservaService:
 		print("🟣 ReservaService.deleteReserva()")
 		reserva = Reserva()
 		reserva.idReserva = idReserva
-		return self.__ReservaDAO.delete(reserva)
\ No newline at end of file
+		excluiu = self.__ReservaDAO.delete(reserva)
+		if excluiu:
+			self.__publicar("reserva.excluida", idReserva)
+		else:
+			self.__rejeitar_arquivada(idReserva, "excluída")
+		return excluiu
+
+	def __rejeitar_arquivada(self, idReserva: int, acao: str):
+		"""
+		UPDATE/DELETE sem linhas afetadas: se a reserva foi para o histórico (findById
+		ainda a encontra lá), responde 409 em vez de um "não encontrada" sem explicação.
+		"""
+		if self.__ReservaDAO.arquivada(idReserva):
+			raise ErrorResponse(409, "Reserva arquivada", {
+				"message": f"A reserva {idReserva} já foi encerrada e movida para o histórico; não pode ser {acao}."
+			})
+
+	def __publicar(self, tipo: str, idReserva: int, reserva: Reserva | None = None):
+		"""Envia o evento para o feed (e invalida as listagens); falha no feed não desfaz a escrita já confirmada."""
+		if self.__cache_listas is not None:
+			self.__cache_listas.invalidar()
+		if self.__eventos is None:
+			return
+		dados = {"idReserva": int(idReserva)}
+		if reserva is not None:
+			dados.update({
+				"idInquilino": reserva.idInquilino,
+				"idChale": reserva.idChale,
+				"inicio": reserva.inicio.isoformat(),
+				"fim": reserva.fim.isoformat(),
+			})
+		try:
+			self.__eventos.publicar(tipo, dados)
+		except Exception as e:
+			print(f"❌ ReservaService: falha ao publicar {tipo}: {e}")
+
+	def parse_filtro(self, args) -> dict:
+		"""
+		Converte a query string em filtros de ReservaDAO.findByFiltro.
+
+		Aceita idChale, idInquilino (inteiros positivos), inicio_de, inicio_ate,
+		fim_de, fim_ate (YYYY-MM-DD ou DD/MM/YYYY) e ids (1,2,3).
+		Ex.: reservas que se sobrepõem a março -> inicio_ate=2030-03-31&fim_de=2030-03-01
+		"""
+		filtro = {}
+		erros = []
+		for chave in ("idChale", "idInquilino"):
+			valor = args.get(chave)
+			if valor is None:
+				continue
+			try:
+				filtro[chave] = int(valor)
+				if filtro[chave] <= 0:
+					raise ValueError
+			except ValueError:
+				erros.append(f"{chave} deve ser um inteiro positivo.")
+		for chave in ("inicio_de", "inicio_ate", "fim_de", "fim_ate"):
+			valor = args.get(chave)
+			if valor is None:
+				continue
+			data = para_date(valor)
+			if data is None:
+				erros.append(f"{chave} deve estar no formato YYYY-MM-DD ou DD/MM/YYYY.")
+			filtro[chave] = data
+		if erros:
+			raise ErrorResponse(400, "Filtro inválido", {"errors": erros})
+
+		ids = self.parse_ids(args.get("ids"))
+		if ids is not None:
+			filtro["ids"] = ids
+		return filtro
+
+	def exportar(self, args) -> dict:
+		"""
+		Prepara o export de reservas (?formato=csv|parquet&de=&ate=).
+
+		Valida os parâmetros antes de abrir o stream (erros viram 400 normais) e devolve
+		{"mimetype", "nome_arquivo", "corpo"}, onde corpo é um gerador de bytes que lê o
+		banco em lotes de TAMANHO_LOTE_EXPORT linhas.
+
+		de/ate: reservas que ocupam algum dia do período (fim >= de e inicio <= ate).
+		"""
+		print("🟣 ReservaService.exportar()")
+
+		formato = (args.get("formato") or "csv").lower()
+		if formato not in exportador.FORMATOS:
+			raise ErrorResponse(400, "Formato inválido", {"message": f"Use: {', '.join(exportador.FORMATOS)}"})
+		if formato == "parquet" and not exportador.parquet_disponivel():
+			raise ErrorResponse(501, "Formato parquet indisponível", {"message": "pyarrow não está instalado no servidor"})
+
+		periodo = {}
+		for chave in ("de", "ate"):
+			valor = args.get(chave)
+			if valor:
+				periodo[chave] = para_date(valor)
+				if periodo[chave] is None:
+					raise ErrorResponse(400, "Período inválido", {"message": f"{chave} deve estar no formato YYYY-MM-DD ou DD/MM/YYYY."})
+		if periodo.get("de") and periodo.get("ate") and periodo["de"] > periodo["ate"]:
+			raise ErrorResponse(400, "Período inválido", {"message": "de deve ser anterior ou igual a ate."})
+
+		lotes = self.__lotes_export(periodo.get("de"), periodo.get("ate"))
+		if formato == "csv":
+			corpo = exportador.gerar_csv(lotes, list(self.COLUNAS_EXPORT))
+		else:
+			corpo = exportador.gerar_parquet(lotes, exportador.esquema_parquet(self.COLUNAS_EXPORT))
+
+		mimetype, extensao = exportador.FORMATOS[formato]
+		sufixo = "_".join(periodo[chave].isoformat() for chave in ("de", "ate") if chave in periodo)
+		return {
+			"mimetype": mimetype,
+			"nome_arquivo": f"reservas{'_' + sufixo if sufixo else ''}.{extensao}",
+			"corpo": corpo,
+		}
+
+	def __lotes_export(self, de, ate):
+		for lote in self.__ReservaDAO.exportar(de, ate, self.TAMANHO_LOTE_EXPORT):
+			for linha in lote:
+				inicio, fim = para_date(linha["inicio"]), para_date(linha["fim"])
+				linha["inicio"], linha["fim"] = inicio, fim
+				linha["noites"] = (fim - inicio).days
+			yield lote
+
+	def disponibilidade(self, args) -> dict:
+		"""
+		Datas livres para uma estadia flexível (?de=&ate=&noites=&pessoas=&modo=&limite=).
+
+		de: primeiro check-in aceito; ate: último check-out aceito; noites: duração da estadia;
+		pessoas: capacidade mínima do chalé. Cada opção é uma faixa contínua de check-ins
+		possíveis num chalé (todos os pares (chalé, data) entre primeiro_checkin e
+		ultimo_checkin servem).
+
+		- modo=primeira (padrão): apenas a opção com o check-in mais cedo (empate: menor
+		  chalé que comporta o grupo).
+		- modo=todas: todas as faixas, ordenadas por check-in, até 'limite' (padrão 50).
+
+		Uma query traz as reservas dos chalés elegíveis já ordenadas por (chalé, início)
+		e cada chalé é varrido uma vez (janelas_livres).
+		"""
+		print("🟣 ReservaService.disponibilidade()")
+
+		de, ate, noites, pessoas, modo, limite = self.__parse_disponibilidade(args)
+		linhas = self.__ReservaDAO.ocupacaoPorChale(de, ate, pessoas)
+
+		opcoes = []
+		for idChale, grupo in groupby(linhas, key=lambda linha: linha["idChale"]):
+			reservas_chale = list(grupo)
+			primeira = reservas_chale[0]
+			ocupados = [(para_date(r["inicio"]), para_date(r["fim"])) for r in reservas_chale if r["inicio"] is not None]
+			for primeiro, ultimo in janelas_livres(ocupados, de, ate, noites):
+				opcoes.append({
+					"idChale": idChale,
+					"nome": primeira["nome"],
+					"capacidade": primeira["capacidade"],
+					"primeiro_checkin": primeiro,
+					"ultimo_checkin": ultimo,
+				})
+				if modo == "primeira":
+					break
+
+		opcoes.sort(key=lambda opcao: (opcao["primeiro_checkin"], opcao["capacidade"], opcao["idChale"]))
+		opcoes = opcoes[:1 if modo == "primeira" else limite]
+		for opcao in opcoes:
+			opcao["checkouts"] = {
+				"primeiro": (opcao["primeiro_checkin"] + timedelta(days=noites)).isoformat(),
+				"ultimo": (opcao["ultimo_checkin"] + timedelta(days=noites)).isoformat(),
+			}
+			opcao["primeiro_checkin"] = opcao["primeiro_checkin"].isoformat()
+			opcao["ultimo_checkin"] = opcao["ultimo_checkin"].isoformat()
+
+		return {
+			"de": de.isoformat(),
+			"ate": ate.isoformat(),
+			"noites": noites,
+			"pessoas": pessoas,
+			"modo": modo,
+			"opcoes": opcoes,
+		}
+
+	def chalesLivres(self, ids: list[int], inicio, fim) -> list[dict]:
+		"""
+		Dentre 'ids', os chalés livres em [inicio, fim), na ordem de 'ids', com as noites
+		que ficariam sobrando antes e depois da estadia até a reserva vizinha
+		(limitadas a HORIZONTE_ALOCACAO; sem vizinha no horizonte = HORIZONTE_ALOCACAO).
+
+		:return: [{"idChale", "sobra_antes", "sobra_depois"}]
+		"""
+		print("🟣 ReservaService.chalesLivres()")
+
+		inicio, fim = para_date(inicio), para_date(fim)
+		horizonte = timedelta(days=self.HORIZONTE_ALOCACAO)
+		vizinhanca = {
+			linha["idChale"]: linha
+			for linha in self.__ReservaDAO.vizinhancaChales(ids, inicio, fim, inicio - horizonte, fim + horizonte)
+		}
+
+		livres = []
+		for idChale in ids:
+			linha = vizinhanca.get(idChale)
+			if linha and linha["conflitos"]:
+				continue
+			fim_anterior = para_date(linha["fim_anterior"]) if linha and linha["fim_anterior"] else None
+			inicio_seguinte = para_date(linha["inicio_seguinte"]) if linha and linha["inicio_seguinte"] else None
+			livres.append({
+				"idChale": idChale,
+				"sobra_antes": (inicio - fim_anterior).days if fim_anterior else self.HORIZONTE_ALOCACAO,
+				"sobra_depois": (inicio_seguinte - fim).days if inicio_seguinte else self.HORIZONTE_ALOCACAO,
+			})
+		return livres
+
+	def __parse_disponibilidade(self, args) -> tuple:
+		periodo = {}
+		for chave in ("de", "ate"):
+			periodo[chave] = para_date(args.get(chave) or "")
+			if periodo[chave] is None:
+				raise ErrorResponse(400, "Período inválido", {"message": f"{chave} é obrigatório, no formato YYYY-MM-DD ou DD/MM/YYYY."})
+		# check-in no passado não é aceito pelo modelo Reserva: a busca começa hoje
+		de, ate = max(periodo["de"], date.today()), periodo["ate"]
+
+		try:
+			noites = int(args.get("noites", 1))
+			pessoas = int(args.get("pessoas", 1))
+			limite = int(args.get("limite", 50))
+		except ValueError:
+			raise ErrorResponse(400, "Parâmetros inválidos", {"message": "noites, pessoas e limite devem ser inteiros."})
+		if noites < 1 or pessoas < 1 or not 1 <= limite <= self.MAX_OPCOES_DISPONIBILIDADE:
+			raise ErrorResponse(400, "Parâmetros inválidos", {
+				"message": f"noites >= 1, pessoas >= 1 e limite entre 1 e {self.MAX_OPCOES_DISPONIBILIDADE}."
+			})
+
+		modo = args.get("modo") or "primeira"
+		if modo not in self.MODOS_DISPONIBILIDADE:
+			raise ErrorResponse(400, "Parâmetro modo inválido", {"message": f"Use: {', '.join(self.MODOS_DISPONIBILIDADE)}"})
+
+		if (ate - de).days < noites:
+			raise ErrorResponse(400, "Período inválido", {"message": "O período (a partir de hoje) é menor que o número de noites."})
+		if (ate - de).days > self.MAX_DIAS_DISPONIBILIDADE:
+			raise ErrorResponse(400, "Período inválido", {"message": f"O período pode ter no máximo {self.MAX_DIAS_DISPONIBILIDADE} dias."})
+		return de, ate, noites, pessoas, modo, limite
+
+	def parse_ordem(self, valor: str | None) -> str:
+		"""?ordem=inicio | -inicio | fim | -fim | idReserva | -idReserva (padrão idReserva)."""
+		if not valor:
+			return "idReserva"
+		if valor not in ReservaDAO.ORDENACOES:
+			raise ErrorResponse(400, "Parâmetro ordem inválido", {
+				"message": f"Use: {', '.join(ReservaDAO.ORDENACOES)}"
+			})
+		return valor
+
+	def parse_paginacao(self, args) -> dict | None:
+		"""
+		?pagina=2&por_pagina=50 ou ?limit=50&offset=50; None se nenhum foi informado.
+		por_pagina/limit: padrão 50, máximo 500.
+		"""
+		if not any(chave in args for chave in ("pagina", "por_pagina", "limit", "offset")):
+			return None
+		try:
+			por_pagina = int(args.get("por_pagina", args.get("limit", 50)))
+			if "offset" in args or "limit" in args:
+				offset = int(args.get("offset", 0))
+				pagina = offset // por_pagina + 1 if por_pagina > 0 else 1
+			else:
+				pagina = int(args.get("pagina", 1))
+				offset = (pagina - 1) * por_pagina
+		except ValueError:
+			raise ErrorResponse(400, "Paginação inválida", {"message": "pagina, por_pagina, limit e offset devem ser inteiros."})
+		if not 1 <= por_pagina <= 500 or pagina < 1 or offset < 0:
+			raise ErrorResponse(400, "Paginação inválida", {"message": "por_pagina/limit entre 1 e 500; pagina >= 1; offset >= 0."})
+		return {"pagina": pagina, "por_pagina": por_pagina, "offset": offset}
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+"""
+Armazenamento local (arquivo SQLite) compartilhado entre threads e processos
+do mesmo servidor.
+
+Usado para estado operacional que não pertence ao banco principal
+(fila de reservas públicas, etc.). O arquivo usa WAL, então vários workers
+do gunicorn podem ler e gravar ao mesmo tempo; escritas concorrentes são
+serializadas pelo próprio SQLite (busy timeout).
+
+Configuração: LOCAL_STORE_PATH (padrão api/system/local_store.db).
+"""
+
+CAMINHO_PADRAO = "api/system/local_store.db"
+
+
+class ArmazenamentoLocal:
+    def __init__(self, path: str | None = None):
+        self.path = path or os.environ.get("LOCAL_STORE_PATH", CAMINHO_PADRAO)
+        self.__local = threading.local()
+        self.__trava = threading.Lock()
+        self.__esquemas = set()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        print(f"⬆️  ArmazenamentoLocal.__init__({self.path})")
+
+    def __conexao(self) -> sqlite3.Connection:
+        # uma conexão por thread (sqlite3 não compartilha conexões entre threads)
+        conexao = getattr(self.__local, "conexao", None)
+        if conexao is None:
+            conexao = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conexao.row_factory = sqlite3.Row
+            conexao.execute("PRAGMA journal_mode = WAL")
+            conexao.execute("PRAGMA synchronous = NORMAL")
+            self.__local.conexao = conexao
+        return conexao
+
+    def garantir_esquema(self, nome: str, ddl: str):
+        """Executa o DDL (CREATE ... IF NOT EXISTS) uma vez por processo."""
+        with self.__trava:
+            if nome in self.__esquemas:
+                return
+            self.__conexao().executescript(ddl)
+            self.__esquemas.add(nome)
+
+    def executar(self, sql: str, params=()) -> int:
+        """Executa uma escrita (autocommit) e devolve as linhas afetadas."""
+        return self.__conexao().execute(sql, params).rowcount
+
+    def consultar(self, sql: str, params=()) -> list[dict]:
+        return [dict(linha) for linha in self.__conexao().execute(sql, params).fetchall()]
+
+    def consultar_um(self, sql: str, params=()) -> dict | None:
+        linha = self.__conexao().execute(sql, params).fetchone()
+        return dict(linha) if linha is not None else None
+
+    @contextmanager
+    def transacao(self):
+        """
+        Transação com trava de escrita imediata (BEGIN IMMEDIATE): leitura e
+        escrita dentro do bloco são atômicas em relação aos outros processos.
+        """
+        conexao = self.__conexao()
+        conexao.execute("BEGIN IMMEDIATE")
+        try:
+            yield conexao
+        except BaseException:
+            conexao.execute("ROLLBACK")
+            raise
+        else:
+            conexao.execute("COMMIT")
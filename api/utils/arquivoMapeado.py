@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl  # trava entre processos (Linux/macOS)
+except ImportError:  # Windows: vale apenas a trava entre threads
+    fcntl = None
+
+"""
+Arquivo de tamanho fixo mapeado com mmap e compartilhado pelos workers do host.
+
+Base de CacheCompartilhado, GeracaoCompartilhada e LimitadorTaxa:
+- abre (criando o diretório e estendendo o arquivo até 'tamanho') no primeiro
+  acesso de cada processo; depois de um fork o filho reabre o próprio arquivo;
+- travado() dá exclusão mútua entre threads (RLock) e entre processos (flock)
+  para as escritas; leituras usam 'mapa' direto, sem trava.
+"""
+
+
+class ArquivoMapeado:
+    def __init__(self, path: str, tamanho: int, iniciar=None):
+        """
+        :param path: arquivo do mapa
+        :param tamanho: tamanho do arquivo em bytes
+        :param iniciar: função opcional iniciar(mapa), chamada com o flock a cada abertura (ex.: validar o cabeçalho)
+        """
+        self.path = path
+        self.tamanho = tamanho
+        self.__iniciar = iniciar
+        self.__trava = threading.RLock()
+        self.__pid = None
+        self.__arquivo = None
+        self.__mapa = None
+
+    @property
+    def mapa(self) -> mmap.mmap:
+        if self.__pid != os.getpid():
+            self.__abrir()
+        return self.__mapa
+
+    @contextmanager
+    def travado(self):
+        """Mapa com a trava de escrita (thread + flock) mantida durante o bloco."""
+        mapa = self.mapa
+        with self.__trava:
+            self.__travar(self.__arquivo)
+            try:
+                yield mapa
+            finally:
+                self.__destravar(self.__arquivo)
+
+    def __abrir(self):
+        # reabre após fork: flock herdado seria compartilhado com o processo pai
+        with self.__trava:
+            if self.__pid == os.getpid():
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            arquivo = open(self.path, "a+b")
+            self.__travar(arquivo)
+            try:
+                if os.fstat(arquivo.fileno()).st_size < self.tamanho:
+                    arquivo.truncate(self.tamanho)
+                mapa = mmap.mmap(arquivo.fileno(), self.tamanho)
+                if self.__iniciar is not None:
+                    self.__iniciar(mapa)
+            finally:
+                self.__destravar(arquivo)
+            self.__arquivo = arquivo
+            self.__mapa = mapa
+            self.__pid = os.getpid()
+
+    @staticmethod
+    def __travar(arquivo):
+        if fcntl:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX)
+
+    @staticmethod
+    def __destravar(arquivo):
+        if fcntl:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
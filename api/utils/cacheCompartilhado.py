@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import struct
+from api.utils.arquivoMapeado import ArquivoMapeado
+
+"""
+Cache chave -> bytes compartilhado pelos workers do mesmo host (arquivo mapeado com mmap).
+
+O que um worker calcula (resposta serializada, catálogo de chalés...) os outros
+leem direto do mapa, sem ir ao banco e sem aquecer o próprio cache depois de
+um deploy.
+
+Layout do arquivo:
+- cabeçalho: magic, número de slots, tamanho do arquivo, topo da área de dados
+  e época (incrementada a cada compactação);
+- tabela de slots endereçada pelo hash da chave (sondagem linear);
+- área de dados onde os valores são gravados em sequência (bump pointer).
+
+Versões e invalidação: cada valor é gravado com a geração em que foi calculado
+(GeracaoCompartilhada). obter(chave, geracao) só devolve o valor se as gerações
+batem, então incrementar a geração invalida a entrada em todos os workers.
+
+Concorrência: escritas são serializadas (ArquivoMapeado.travado()). Leituras não
+travam: cada slot tem um contador de sequência (ímpar durante a escrita) lido
+antes e depois da cópia dos bytes; se mudou, a leitura vira miss.
+
+Quando a área de dados (ou a tabela) enche, tudo é descartado de uma vez e a
+gravação recomeça do início: os valores são recalculáveis por definição.
+"""
+
+MAGIC = 0x43424341434845  # "CBCACHE"
+CABECALHO = struct.Struct("<QQQQQ")  # magic, slots, tamanho, topo, epoca
+SLOT = struct.Struct("<QQQQQ")  # hash, seq, geracao, offset, tamanho
+ENTRADA = struct.Struct("<I")  # tamanho da chave (a chave é gravada antes do valor)
+MAX_SONDAGEM = 64  # slots visitados a partir do hash; sem slot livre nesse trecho, compacta
+
+
+def _hash_chave(chave: bytes) -> int:
+    valor = int.from_bytes(hashlib.blake2b(chave, digest_size=8).digest(), "little")
+    return valor or 1  # 0 marca slot vazio
+
+
+class CacheCompartilhado:
+    def __init__(self, path: str | None = None, tamanho_mb: int | None = None, slots: int = 4096):
+        """
+        :param path: arquivo do mapa (padrão CACHE_COMPARTILHADO_PATH ou api/system/cache_compartilhado.bin)
+        :param tamanho_mb: tamanho do arquivo em MB (padrão CACHE_COMPARTILHADO_MB ou 32)
+        :param slots: máximo de chaves distintas
+        """
+        self.path = path or os.environ.get("CACHE_COMPARTILHADO_PATH", "api/system/cache_compartilhado.bin")
+        self.slots = slots
+        self.__tamanho = (tamanho_mb or int(os.environ.get("CACHE_COMPARTILHADO_MB", 32))) * 1024 * 1024
+        self.__inicio_dados = CABECALHO.size + slots * SLOT.size
+        self.__maximo_valor = (self.__tamanho - self.__inicio_dados) // 4
+        self.__arquivo = ArquivoMapeado(self.path, self.__tamanho, self.__iniciar)
+
+    def __iniciar(self, mapa):
+        magic, slots, tamanho, _, _ = CABECALHO.unpack_from(mapa, 0)
+        if (magic, slots, tamanho) != (MAGIC, self.slots, self.__tamanho):
+            # arquivo novo ou criado com outra configuração: recomeça vazio
+            mapa[:self.__inicio_dados] = bytes(self.__inicio_dados)
+            CABECALHO.pack_into(mapa, 0, MAGIC, self.slots, self.__tamanho, self.__inicio_dados, 0)
+
+    def obter(self, chave: str, geracao: int = 0) -> bytes | None:
+        """Valor gravado para a chave na geração 'geracao', ou None."""
+        chave_bytes = chave.encode()
+        hash_chave = _hash_chave(chave_bytes)
+        mapa = self.__arquivo.mapa
+
+        posicao = self.__localizar(mapa, hash_chave)
+        if posicao is None:
+            return None
+        hash_slot, seq, geracao_slot, offset, tamanho = SLOT.unpack_from(mapa, posicao)
+        if seq % 2 or hash_slot != hash_chave or geracao_slot != geracao:
+            return None
+
+        inicio_valor = offset + ENTRADA.size + len(chave_bytes)
+        if offset < self.__inicio_dados or inicio_valor + tamanho > self.__tamanho:
+            return None  # slot lido pela metade durante uma escrita
+        if ENTRADA.unpack_from(mapa, offset)[0] != len(chave_bytes) or mapa[offset + ENTRADA.size:inicio_valor] != chave_bytes:
+            return None
+        valor = mapa[inicio_valor:inicio_valor + tamanho]  # única cópia: bytes prontos para a resposta
+
+        # a entrada foi regravada (ou o mapa compactado) durante a cópia
+        if SLOT.unpack_from(mapa, posicao)[1] != seq:
+            return None
+        return valor
+
+    def guardar(self, chave: str, valor: bytes, geracao: int = 0) -> bool:
+        """Grava o valor; False se ele for grande demais para o cache (> 1/4 da área de dados)."""
+        if len(valor) > self.__maximo_valor:
+            return False
+        chave_bytes = chave.encode()
+        hash_chave = _hash_chave(chave_bytes)
+        tamanho_entrada = ENTRADA.size + len(chave_bytes) + len(valor)
+
+        with self.__arquivo.travado() as mapa:
+            _, _, _, topo, epoca = CABECALHO.unpack_from(mapa, 0)
+            posicao = self.__localizar(mapa, hash_chave, reservar=True)
+            if posicao is None or topo + tamanho_entrada > self.__tamanho:
+                self.__compactar(mapa, epoca)
+                topo = self.__inicio_dados
+                posicao = self.__localizar(mapa, hash_chave, reservar=True)
+
+            offset = topo
+            ENTRADA.pack_into(mapa, offset, len(chave_bytes))
+            inicio_valor = offset + ENTRADA.size
+            mapa[inicio_valor:inicio_valor + len(chave_bytes)] = chave_bytes
+            inicio_valor += len(chave_bytes)
+            mapa[inicio_valor:inicio_valor + len(valor)] = valor
+
+            seq = SLOT.unpack_from(mapa, posicao)[1]
+            SLOT.pack_into(mapa, posicao, hash_chave, seq + 1, geracao, offset, len(valor))  # gravando
+            SLOT.pack_into(mapa, posicao, hash_chave, seq + 2, geracao, offset, len(valor))
+            struct.pack_into("<Q", mapa, 24, offset + tamanho_entrada)  # topo
+        return True
+
+    def __localizar(self, mapa, hash_chave: int, reservar: bool = False) -> int | None:
+        """Posição do slot da chave; com reservar=True devolve um slot vazio (None se a tabela está cheia)."""
+        inicio = hash_chave % self.slots
+        for i in range(min(MAX_SONDAGEM, self.slots)):
+            posicao = CABECALHO.size + ((inicio + i) % self.slots) * SLOT.size
+            hash_slot = SLOT.unpack_from(mapa, posicao)[0]
+            if hash_slot == hash_chave:
+                return posicao
+            if hash_slot == 0:
+                return posicao if reservar else None
+        return None
+
+    def __compactar(self, mapa, epoca: int):
+        """Descarta todas as entradas (chamado com as travas de escrita)."""
+        for i in range(self.slots):
+            posicao = CABECALHO.size + i * SLOT.size
+            seq = SLOT.unpack_from(mapa, posicao)[1]
+            # seq continua crescendo: um leitor no meio da cópia percebe a troca
+            SLOT.pack_into(mapa, posicao, 0, seq + 2, 0, 0, 0)
+        CABECALHO.pack_into(mapa, 0, MAGIC, self.slots, self.__tamanho, self.__inicio_dados, epoca + 1)
+        print(f"♻️  CacheCompartilhado: área cheia, entradas descartadas (época {epoca + 1})")
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from api.utils.geracaoCompartilhada import GeracaoCompartilhada
+from api.utils.cacheCompartilhado import CacheCompartilhado
+
+"""
+Cache de respostas já serializadas (bytes do corpo + ETag) por rota e query string.
+
+- Cada entrada guarda a geração em que foi criada; invalidar() incrementa a
+  geração no GeracaoCompartilhada, então uma escrita em qualquer worker derruba
+  as entradas de todos os workers.
+- O conteúdo fica na memória do processo (LRU com max_entradas): um acerto é
+  uma busca no dict e a cópia dos bytes para a resposta.
+- Com um CacheCompartilhado, cada resposta calculada também vai para o mapa
+  do host: um worker que ainda não tem a entrada a lê de lá (mesma geração)
+  em vez de consultar o banco.
+"""
+
+# status, tamanho do content_type, etag (32 caracteres hex); depois content_type e corpo
+CABECALHO_COMPARTILHADO = struct.Struct("<HH32s")
+
+
+class EntradaResposta:
+    __slots__ = ("geracao", "status", "corpo", "etag", "content_type")
+
+    def __init__(self, geracao: int, status: int, corpo: bytes, etag: str, content_type: str):
+        self.geracao = geracao
+        self.status = status
+        self.corpo = corpo
+        self.etag = etag
+        self.content_type = content_type
+
+
+class CacheRespostas:
+    def __init__(self, nome: str, geracoes: GeracaoCompartilhada, max_entradas: int | None = None,
+                 compartilhado: CacheCompartilhado | None = None):
+        """
+        :param nome: nome do cache (chave da geração compartilhada e das métricas)
+        :param geracoes: contadores de geração compartilhados entre workers
+        :param max_entradas: máximo de respostas guardadas (padrão CACHE_RESPOSTAS_MAX ou 256)
+        :param compartilhado: CacheCompartilhado opcional (respostas visíveis para todos os workers do host)
+        """
+        print(f"⬆️  CacheRespostas.__init__({nome})")
+        self.nome = nome
+        self.__geracoes = geracoes
+        self.__max_entradas = max_entradas or int(os.environ.get("CACHE_RESPOSTAS_MAX", 256))
+        self.__entradas = OrderedDict()
+        self.__trava = threading.Lock()
+        self.__compartilhado = compartilhado
+
+    @staticmethod
+    def calcular_etag(corpo: bytes) -> str:
+        """ETag forte (sem aspas; o header é montado com response.set_etag)."""
+        return hashlib.blake2b(corpo, digest_size=16).hexdigest()
+
+    def geracao(self) -> int:
+        return self.__geracoes.atual(self.nome)
+
+    def obter(self, chave: str) -> EntradaResposta | None:
+        """Entrada válida para a chave, ou None (ausente ou de geração anterior)."""
+        entrada = self.__entradas.get(chave)
+        if entrada is None:
+            return self.__obter_compartilhado(chave)
+        if entrada.geracao != self.geracao():
+            with self.__trava:
+                if self.__entradas.get(chave) is entrada:
+                    del self.__entradas[chave]
+            return self.__obter_compartilhado(chave)
+        with self.__trava:
+            if chave in self.__entradas:
+                self.__entradas.move_to_end(chave)
+        return entrada
+
+    def guardar(self, chave: str, geracao: int, status: int, corpo: bytes, content_type: str) -> EntradaResposta:
+        """
+        Guarda a resposta calculada na geração 'geracao' (lida ANTES de consultar o banco:
+        se houve escrita no meio, a entrada já nasce inválida).
+        """
+        entrada = EntradaResposta(geracao, status, corpo, self.calcular_etag(corpo), content_type)
+        self.__guardar_local(chave, entrada)
+        if self.__compartilhado is not None:
+            tipo = content_type.encode()
+            self.__compartilhado.guardar(
+                self.__chave_compartilhada(chave),
+                CABECALHO_COMPARTILHADO.pack(status, len(tipo), entrada.etag.encode()) + tipo + corpo,
+                geracao,
+            )
+        return entrada
+
+    def __guardar_local(self, chave: str, entrada: EntradaResposta):
+        with self.__trava:
+            self.__entradas[chave] = entrada
+            self.__entradas.move_to_end(chave)
+            while len(self.__entradas) > self.__max_entradas:
+                self.__entradas.popitem(last=False)
+
+    def __chave_compartilhada(self, chave: str) -> str:
+        return f"respostas:{self.nome}:{chave}"
+
+    def __obter_compartilhado(self, chave: str) -> EntradaResposta | None:
+        """Resposta gravada por outro worker nesta geração (passa a valer também no cache local)."""
+        if self.__compartilhado is None:
+            return None
+        geracao = self.geracao()
+        valor = self.__compartilhado.obter(self.__chave_compartilhada(chave), geracao)
+        if valor is None:
+            return None
+        status, tamanho_tipo, etag = CABECALHO_COMPARTILHADO.unpack_from(valor)
+        inicio_corpo = CABECALHO_COMPARTILHADO.size + tamanho_tipo
+        entrada = EntradaResposta(
+            geracao, status, valor[inicio_corpo:], etag.decode(),
+            valor[CABECALHO_COMPARTILHADO.size:inicio_corpo].decode(),
+        )
+        self.__guardar_local(chave, entrada)
+        return entrada
+
+    def invalidar(self):
+        """Chamado pelas escritas do service: descarta todas as respostas, em todos os workers."""
+        geracao = self.__geracoes.incrementar(self.nome)
+        with self.__trava:
+            self.__entradas.clear()
+        print(f"♻️  CacheRespostas[{self.nome}] invalidado (geração {geracao})")
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import OrderedDict
+from api.utils.geracaoCompartilhada import GeracaoCompartilhada
+from api.utils.metricas import Metricas
+
+"""
+Cache de resultados com stale-while-revalidate e coalescência de requisições.
+
+Cada entrada guarda a versão dos dados em que foi calculada e o instante do cálculo:
+- idade < ttl: fresca, devolvida direto;
+- ttl <= idade < ttl + janela_stale: vencida, mas devolvida na hora; uma única
+  thread por chave recalcula em segundo plano (a próxima requisição já vê o valor novo);
+- mais velha que isso, versão diferente (houve escrita) ou ausente: recalcula
+  antes de responder.
+
+Coalescência (singleflight): enquanto um cálculo de (chave, versão) está em
+andamento, quem pede a mesma chave espera por ele em vez de consultar o banco
+de novo; uma rajada de requisições gera exatamente uma query.
+
+Versão: a função 'versao' informada, ou a geração 'nome' do GeracaoCompartilhada
+(invalidar() a incrementa para todos os workers), ou um contador local.
+"""
+
+
+class EntradaSWR:
+    __slots__ = ("versao", "calculado_em", "valor")
+
+    def __init__(self, versao: int, calculado_em: float, valor):
+        self.versao = versao
+        self.calculado_em = calculado_em
+        self.valor = valor
+
+
+class _Calculo:
+    """Cálculo em andamento de uma (chave, versão), aguardado pelos demais pedidos."""
+    __slots__ = ("pronto", "valor", "erro")
+
+    def __init__(self):
+        self.pronto = threading.Event()
+        self.valor = None
+        self.erro = None
+
+
+class CacheSWR:
+    def __init__(self, nome: str, ttl: float, janela_stale: float, max_entradas: int = 64,
+                 geracoes: GeracaoCompartilhada | None = None, versao=None):
+        """
+        :param nome: nome do cache (geração compartilhada e métricas)
+        :param ttl: segundos em que a entrada é fresca
+        :param janela_stale: segundos, depois do ttl, em que a entrada vencida ainda é servida
+        :param max_entradas: máximo de chaves guardadas (LRU)
+        :param geracoes: contadores de geração compartilhados entre workers (opcional)
+        :param versao: função sem argumentos que devolve a versão atual dos dados (opcional)
+        """
+        print(f"⬆️  CacheSWR.__init__({nome})")
+        self.nome = nome
+        self.__ttl = ttl
+        self.__janela_stale = janela_stale
+        self.__max_entradas = max_entradas
+        self.__geracoes = geracoes
+        self.__versao = versao
+        self.__versao_local = 0
+        self.__entradas = OrderedDict()  # chave -> EntradaSWR
+        self.__calculos = {}  # (chave, versao) -> _Calculo
+        self.__trava = threading.Lock()
+
+    def versao(self) -> int:
+        if self.__versao is not None:
+            return self.__versao()
+        if self.__geracoes is not None:
+            return self.__geracoes.atual(self.nome)
+        return self.__versao_local
+
+    def obter(self, chave, calcular):
+        """
+        Valor da chave, calculado por 'calcular()' (sem argumentos) quando necessário.
+
+        Erros de 'calcular' chegam a todos que aguardavam o mesmo cálculo; num
+        recálculo em segundo plano são apenas registrados (a entrada vencida continua valendo).
+        """
+        versao = self.versao()  # lida antes do cálculo: escrita concorrente invalida o resultado
+        entrada = self.__entradas.get(chave)
+        if entrada is not None and entrada.versao == versao:
+            idade = time.monotonic() - entrada.calculado_em
+            if idade < self.__ttl + self.__janela_stale:
+                Metricas.registrar_cache(f"swr_{self.nome}", True)
+                with self.__trava:
+                    if chave in self.__entradas:
+                        self.__entradas.move_to_end(chave)
+                if idade >= self.__ttl:
+                    self.__revalidar(chave, versao, calcular)
+                return entrada.valor
+
+        Metricas.registrar_cache(f"swr_{self.nome}", False)
+        with self.__trava:
+            calculo = self.__calculos.get((chave, versao))
+            dono = calculo is None
+            if dono:
+                calculo = self.__calculos[(chave, versao)] = _Calculo()
+        if not dono:
+            calculo.pronto.wait()
+            if calculo.erro is not None:
+                raise calculo.erro
+            return calculo.valor
+
+        self.__calcular(chave, versao, calcular, calculo)
+        if calculo.erro is not None:
+            raise calculo.erro
+        return calculo.valor
+
+    def invalidar(self):
+        """Chamado pelas escritas do service: as entradas atuais deixam de valer (em todos os workers, com geracoes)."""
+        if self.__geracoes is not None:
+            versao = self.__geracoes.incrementar(self.nome)
+        else:
+            with self.__trava:
+                self.__versao_local += 1
+                versao = self.__versao_local
+        with self.__trava:
+            self.__entradas.clear()
+        print(f"♻️  CacheSWR[{self.nome}] invalidado (versão {versao})")
+
+    def __revalidar(self, chave, versao: int, calcular):
+        with self.__trava:
+            if (chave, versao) in self.__calculos:
+                return  # já há um recálculo (ou cálculo) desta chave em andamento
+            calculo = self.__calculos[(chave, versao)] = _Calculo()
+        threading.Thread(
+            target=self.__calcular, args=(chave, versao, calcular, calculo, True),
+            name=f"swr-{self.nome}", daemon=True,
+        ).start()
+
+    def __calcular(self, chave, versao: int, calcular, calculo: _Calculo, segundo_plano: bool = False):
+        try:
+            calculo.valor = calcular()
+            with self.__trava:
+                self.__entradas[chave] = EntradaSWR(versao, time.monotonic(), calculo.valor)
+                self.__entradas.move_to_end(chave)
+                while len(self.__entradas) > self.__max_entradas:
+                    self.__entradas.popitem(last=False)
+        except Exception as e:
+            calculo.erro = e
+            if segundo_plano:
+                print(f"❌ CacheSWR[{self.nome}]: falha ao recalcular {chave}: {e}")
+        finally:
+            with self.__trava:
+                self.__calculos.pop((chave, versao), None)
+            calculo.pronto.set()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+from datetime import date
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet indisponível; CSV continua funcionando
+    pa = None
+    pq = None
+
+"""
+Serialização em streaming de lotes de linhas (list[dict]) para download.
+
+Cada função recebe um iterável de lotes (ex.: SqlExecutor.iterar) e devolve um
+gerador de bytes: um pedaço por lote, então a memória usada é a de um lote,
+qualquer que seja o total de linhas.
+
+- CSV: UTF-8 com BOM (o Excel reconhece os acentos), cabeçalho na primeira linha.
+- Parquet: cada lote vira um row group gravado pelo pyarrow.ParquetWriter; os
+  bytes já gravados são enviados e descartados a cada row group.
+"""
+
+FORMATOS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def parquet_disponivel() -> bool:
+    return pq is not None
+
+
+def gerar_csv(lotes, colunas: list[str]):
+    buffer = io.StringIO()
+    escritor = csv.DictWriter(buffer, fieldnames=colunas, extrasaction="ignore", lineterminator="\r\n")
+    escritor.writeheader()
+    yield b"\xef\xbb\xbf" + buffer.getvalue().encode()
+
+    for lote in lotes:
+        buffer.seek(0)
+        buffer.truncate()
+        escritor.writerows(lote)
+        yield buffer.getvalue().encode()
+
+
+class _BufferSaida(io.RawIOBase):
+    """Destino do ParquetWriter: acumula o que foi gravado até ser retirado."""
+
+    def __init__(self):
+        self.__partes = []
+        self.__posicao = 0
+
+    def writable(self):
+        return True
+
+    def write(self, dados):
+        dados = bytes(dados)
+        self.__partes.append(dados)
+        self.__posicao += len(dados)
+        return len(dados)
+
+    def tell(self):
+        return self.__posicao
+
+    def retirar(self) -> bytes:
+        dados = b"".join(self.__partes)
+        self.__partes = []
+        return dados
+
+
+def gerar_parquet(lotes, esquema: "pa.Schema"):
+    if pq is None:
+        raise RuntimeError("pyarrow não está instalado")
+
+    saida = _BufferSaida()
+    with pq.ParquetWriter(saida, esquema, compression="snappy") as escritor:
+        for lote in lotes:
+            escritor.write_table(pa.Table.from_pylist(lote, schema=esquema))
+            yield saida.retirar()
+    yield saida.retirar()  # rodapé (metadados) gravado no close()
+
+
+def esquema_parquet(colunas: dict[str, type]) -> "pa.Schema":
+    """{"idReserva": int, "inicio": date, "inquilino": str} -> pa.schema."""
+    tipos = {int: pa.int64(), str: pa.string(), date: pa.date32(), float: pa.float64()}
+    return pa.schema([(nome, tipos[tipo]) for nome, tipo in colunas.items()])
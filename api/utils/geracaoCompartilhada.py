@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import struct
+from api.utils.arquivoMapeado import ArquivoMapeado
+
+"""
+Contadores de geração compartilhados entre workers (arquivo mapeado com mmap).
+
+Um cache local guarda junto de cada entrada a geração em que ela foi criada;
+uma escrita incrementa a geração e todas as entradas antigas deixam de valer,
+em todos os processos. Ler a geração é um unpack no mmap (sem syscall).
+
+Slot (16 bytes): hash do nome (uint64), geração (uint64). Endereçado pelo hash
+do nome com sondagem linear, como em LimitadorTaxa.
+"""
+
+FORMATO_SLOT = struct.Struct("<QQ")
+
+
+def _hash_nome(nome: str) -> int:
+    valor = int.from_bytes(hashlib.blake2b(nome.encode(), digest_size=8).digest(), "little")
+    return valor or 1  # 0 marca slot vazio
+
+
+class GeracaoCompartilhada:
+    def __init__(self, path: str | None = None, slots: int = 256):
+        self.path = path or os.environ.get("CACHE_GERACAO_PATH", "api/system/cache_geracao.bin")
+        self.slots = slots
+        self.__arquivo = ArquivoMapeado(self.path, slots * FORMATO_SLOT.size)
+        self.__posicoes = {}
+
+    def atual(self, nome: str) -> int:
+        """Geração atual de 'nome' (0 se nunca foi incrementada)."""
+        mapa = self.__arquivo.mapa
+        posicao = self.__posicoes.get(nome)
+        if posicao is None:
+            posicao = self.__localizar(mapa, _hash_nome(nome), reservar=False)
+            if posicao is None:
+                return 0
+            self.__posicoes[nome] = posicao
+        return FORMATO_SLOT.unpack_from(mapa, posicao)[1]
+
+    def incrementar(self, nome: str) -> int:
+        """Invalida tudo o que foi gerado com a geração anterior; devolve a nova."""
+        hash_nome = _hash_nome(nome)
+        with self.__arquivo.travado() as mapa:
+            posicao = self.__localizar(mapa, hash_nome, reservar=True)
+            geracao = FORMATO_SLOT.unpack_from(mapa, posicao)[1] + 1
+            FORMATO_SLOT.pack_into(mapa, posicao, hash_nome, geracao)
+        self.__posicoes[nome] = posicao
+        return geracao
+
+    def __localizar(self, mapa, hash_nome: int, reservar: bool) -> int | None:
+        inicio = hash_nome % self.slots
+        for i in range(self.slots):
+            posicao = ((inicio + i) % self.slots) * FORMATO_SLOT.size
+            hash_slot, _ = FORMATO_SLOT.unpack_from(mapa, posicao)
+            if hash_slot == hash_nome:
+                return posicao
+            if hash_slot == 0:
+                if not reservar:
+                    return None
+                FORMATO_SLOT.pack_into(mapa, posicao, hash_nome, 0)
+                return posicao
+        raise RuntimeError("GeracaoCompartilhada: todos os slots estão ocupados")
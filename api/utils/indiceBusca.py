@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+import bisect
+import os
+import re
+import threading
+import time
+import unicodedata
+
+"""
+Índice de busca em memória (trigramas + prefixos) para typeahead.
+
+- Busca sem acento e sem diferenciar maiúsculas ("joao" encontra "João").
+- Consultas com 3+ caracteres: interseção das listas de trigramas e
+  conferência da substring no texto normalizado (sem falsos positivos).
+- Consultas com 1-2 caracteres: prefixo de palavra ("jo" -> "João", "Jorge").
+- Campos numéricos (telefone, cpf) também são indexados só com dígitos,
+  então "123.456" e "123456" encontram o mesmo CPF.
+- Ranking: nomes que começam com o termo (em ordem alfabética, via busca
+  binária numa lista ordenada), depois palavra do nome que começa com o
+  termo, depois substring no nome e por fim nos demais campos. Termos muito
+  comuns param a varredura assim que o limite é preenchido.
+
+O índice é mantido pelas escritas do service (adicionar/remover) e
+reconstruído por completo a cada ttl segundos, para refletir escritas feitas
+por outros workers. A reconstrução monta novas estruturas e troca as
+referências de uma vez: as buscas nunca veem um índice pela metade.
+"""
+
+REGEX_NAO_ALFANUMERICO = re.compile(r"[^0-9a-z@._\- ]+")
+REGEX_NAO_DIGITO = re.compile(r"[^0-9]")
+REGEX_PALAVRA = re.compile(r"[0-9a-z]+")
+
+
+def normalizar(texto) -> str:
+    """Minúsculas, sem acentos e com espaços unificados."""
+    if texto is None:
+        return ""
+    decomposto = unicodedata.normalize("NFKD", str(texto).lower())
+    sem_acento = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return " ".join(REGEX_NAO_ALFANUMERICO.sub(" ", sem_acento).split())
+
+
+def _trigramas(texto: str) -> set:
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceBusca:
+    def __init__(self, campos: tuple, chave: str, campos_numericos: tuple = (), ttl: float | None = None):
+        """
+        :param campos: campos pesquisáveis (o primeiro tem prioridade no ranking)
+        :param chave: campo identificador do documento (ex.: "idInquilino")
+        :param campos_numericos: campos também indexados apenas com dígitos
+        :param ttl: segundos até a próxima reconstrução completa (padrão: BUSCA_TTL ou 300)
+        """
+        self.campos = campos
+        self.chave = chave
+        self.campos_numericos = campos_numericos
+        self.ttl = ttl if ttl is not None else float(os.environ.get("BUSCA_TTL", 300))
+        self.__trava = threading.Lock()
+        self.__reconstruindo = False
+        self.__construido_em = 0.0
+        self.__documentos = {}   # id -> documento (apenas chave + campos)
+        self.__textos = {}       # id -> texto normalizado pesquisável
+        self.__trigramas = {}    # trigrama -> set(ids)
+        self.__prefixos = {}     # prefixo de 1-2 letras de palavra -> set(ids)
+        self.__nomes = []        # [(nome normalizado, id)] ordenada: prefixo do nome por bisect
+        self.__pendentes = []    # escritas feitas durante a reconstrução, reaplicadas na troca
+
+    # ---------------- construção ----------------
+    VARREDURA_MAXIMA = 2000  # candidatos conferidos antes de aceitar resultados de prioridade menor
+
+    def reconstruir(self, carregar):
+        """
+        Reconstrói o índice inteiro.
+
+        :param carregar: função que devolve a lista de documentos (lida do banco)
+        """
+        with self.__trava:
+            self.__pendentes = []
+        textos, trigramas, prefixos, docs = {}, {}, {}, {}
+        for documento in carregar():
+            self.__indexar(documento, docs, textos, trigramas, prefixos)
+        nomes = sorted((texto.split("|", 1)[0], identificador) for identificador, texto in textos.items())
+        with self.__trava:
+            self.__documentos, self.__textos, self.__nomes = docs, textos, nomes
+            self.__trigramas, self.__prefixos = trigramas, prefixos
+            # escritas concorrentes com a leitura do banco não podem se perder na troca
+            for operacao, valor in self.__pendentes:
+                if operacao == "adicionar":
+                    self.__remover(valor[self.chave])
+                    self.__indexar(valor, docs, textos, trigramas, prefixos)
+                    bisect.insort(nomes, (textos[valor[self.chave]].split("|", 1)[0], valor[self.chave]))
+                else:
+                    self.__remover(valor)
+            self.__pendentes = []
+            self.__construido_em = time.monotonic()
+        print(f"✅ IndiceBusca.reconstruir() -> {len(docs)} documentos")
+
+    def precisa_reconstruir(self) -> bool:
+        return not self.__construido_em or time.monotonic() - self.__construido_em > self.ttl
+
+    def construido(self) -> bool:
+        return bool(self.__construido_em)
+
+    def marcar_reconstrucao(self) -> bool:
+        """Reserva a próxima reconstrução (evita várias threads reconstruindo juntas)."""
+        with self.__trava:
+            if self.__reconstruindo:
+                return False
+            self.__reconstruindo = True
+            return True
+
+    def liberar_reconstrucao(self):
+        with self.__trava:
+            self.__reconstruindo = False
+
+    def adicionar(self, documento: dict):
+        """Insere ou atualiza um documento."""
+        with self.__trava:
+            if self.__reconstruindo:
+                self.__pendentes.append(("adicionar", documento))
+            self.__remover(documento[self.chave])
+            self.__indexar(documento, self.__documentos, self.__textos, self.__trigramas, self.__prefixos)
+            identificador = documento[self.chave]
+            bisect.insort(self.__nomes, (self.__textos[identificador].split("|", 1)[0], identificador))
+
+    def remover(self, identificador):
+        with self.__trava:
+            if self.__reconstruindo:
+                self.__pendentes.append(("remover", identificador))
+            self.__remover(identificador)
+
+    def __texto(self, documento: dict) -> str:
+        partes = [normalizar(documento.get(campo)) for campo in self.campos]
+        partes.extend(REGEX_NAO_DIGITO.sub("", str(documento.get(campo) or "")) for campo in self.campos_numericos)
+        # separador que não aparece nos textos normalizados: trigramas não cruzam campos
+        return "|".join(partes)
+
+    def __indexar(self, documento, docs, textos, trigramas, prefixos):
+        identificador = documento[self.chave]
+        texto = self.__texto(documento)
+        docs[identificador] = {self.chave: identificador, **{campo: documento.get(campo) for campo in self.campos}}
+        textos[identificador] = texto
+        for trigrama in _trigramas(texto):
+            trigramas.setdefault(trigrama, set()).add(identificador)
+        for palavra in REGEX_PALAVRA.findall(texto):
+            prefixos.setdefault(palavra[:1], set()).add(identificador)
+            if len(palavra) > 1:
+                prefixos.setdefault(palavra[:2], set()).add(identificador)
+
+    def __remover(self, identificador):
+        texto = self.__textos.pop(identificador, None)
+        if texto is None:
+            return
+        self.__documentos.pop(identificador, None)
+        entrada = (texto.split("|", 1)[0], identificador)
+        posicao = bisect.bisect_left(self.__nomes, entrada)
+        if posicao < len(self.__nomes) and self.__nomes[posicao] == entrada:
+            del self.__nomes[posicao]
+        for trigrama in _trigramas(texto):
+            ids = self.__trigramas.get(trigrama)
+            if ids is not None:
+                ids.discard(identificador)
+                if not ids:
+                    del self.__trigramas[trigrama]
+        for palavra in REGEX_PALAVRA.findall(texto):
+            for prefixo in {palavra[:1], palavra[:2]}:
+                ids = self.__prefixos.get(prefixo)
+                if ids is not None:
+                    ids.discard(identificador)
+                    if not ids:
+                        del self.__prefixos[prefixo]
+
+    # ---------------- consulta ----------------
+    def buscar(self, consulta: str, limite: int = 20) -> list[dict]:
+        termo = normalizar(consulta)
+        if not termo:
+            return []
+        digitos = REGEX_NAO_DIGITO.sub("", termo)
+        # "123.456-78" procura pelos dígitos (telefone/cpf indexados sem máscara)
+        if digitos and len(digitos) >= len(termo.replace(" ", "")) * 0.6:
+            termo = digitos
+
+        with self.__trava:
+            # prioridade 0: nome começa com o termo (fatia contígua da lista ordenada)
+            resultados = []
+            posicao = bisect.bisect_left(self.__nomes, (termo,))
+            while posicao < len(self.__nomes) and len(resultados) < limite:
+                nome, identificador = self.__nomes[posicao]
+                if not nome.startswith(termo):
+                    break
+                resultados.append(identificador)
+                posicao += 1
+
+            if len(resultados) < limite:
+                resultados.extend(self.__demais(termo, limite - len(resultados)))
+            return [dict(self.__documentos[i]) for i in resultados]
+
+    def __demais(self, termo: str, faltam: int) -> list:
+        """Prioridades 1-3 (a 0 já veio da lista ordenada), com parada antecipada."""
+        niveis = {1: [], 2: [], 3: []}
+        conferir_substring = len(termo) >= 3
+        for conferidos, identificador in enumerate(self.__candidatos(termo), 1):
+            texto = self.__textos[identificador]
+            if conferir_substring and termo not in texto:
+                continue
+            prioridade = self.__prioridade(texto.split("|", 1)[0], termo)
+            if prioridade:
+                niveis[prioridade].append(identificador)
+            if len(niveis[1]) >= faltam:
+                break
+            if conferidos >= self.VARREDURA_MAXIMA and sum(map(len, niveis.values())) >= faltam:
+                break
+        resultados = []
+        for prioridade in (1, 2, 3):
+            resultados.extend(sorted(niveis[prioridade], key=lambda i: self.__textos[i]))
+        return resultados[:faltam]
+
+    def __candidatos(self, termo: str) -> set:
+        if len(termo) < 3:
+            return self.__prefixos.get(termo, set())
+        listas = []
+        for trigrama in _trigramas(termo):
+            ids = self.__trigramas.get(trigrama)
+            if not ids:
+                return set()
+            listas.append(ids)
+        listas.sort(key=len)
+        candidatos = set(listas[0])
+        for ids in listas[1:]:
+            candidatos &= ids
+            if not candidatos:
+                break
+        return candidatos
+
+    @staticmethod
+    def __prioridade(principal: str, termo: str) -> int:
+        if principal.startswith(termo):
+            return 0
+        if f" {termo}" in f" {principal}":
+            return 1
+        if termo in principal:
+            return 2
+        return 3
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from datetime import date, timedelta
+
+"""
+Busca de janelas livres numa agenda de reservas.
+
+Uma reserva ocupa as noites de [inicio, fim): o dia do check-out fica livre
+para o próximo check-in (mesma regra de ReservaService._existe_sobreposicao).
+
+janelas_livres() percorre os intervalos ocupados de um chalé, já ordenados por
+início, uma única vez: o cursor marca o primeiro dia livre e cada intervalo
+que começa depois dele deixa um buraco; se o buraco comporta a estadia, todas
+as datas de check-in de uma faixa contínua servem.
+"""
+
+
+def janelas_livres(ocupados, primeiro_checkin: date, ultimo_checkout: date, noites: int):
+    """
+    Gera (primeiro, ultimo) check-in possíveis para uma estadia de 'noites' noites
+    entre primeiro_checkin e ultimo_checkout.
+
+    :param ocupados: iterável de (inicio, fim) ordenado por inicio; podem se sobrepor
+                     ou começar antes da janela
+    :return: gerador de tuplas (date, date), em ordem crescente e sem sobreposição
+    """
+    estadia = timedelta(days=noites)
+    cursor = primeiro_checkin
+    for inicio, fim in ocupados:
+        if inicio >= ultimo_checkout:
+            break
+        if inicio - cursor >= estadia:
+            yield cursor, inicio - estadia
+        if fim > cursor:
+            cursor = fim
+            if ultimo_checkout - cursor < estadia:
+                return
+    if ultimo_checkout - cursor >= estadia:
+        yield cursor, ultimo_checkout - estadia
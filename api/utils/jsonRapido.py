@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import dataclasses
+import json
+import threading
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson  # encoder em C (opcional)
+except ImportError:
+    orjson = None
+
+"""
+JSONProvider do Flask com caminhos rápidos para as respostas da API.
+
+- Usa orjson quando instalado; sem ele, cai no json da biblioteca padrão
+  (que também tem encoder em C) com o mesmo resultado.
+- Datas continuam no formato HTTP do Flask ("Tue, 01 Jan 2030 00:00:00 GMT"),
+  mas formatadas sem passar por email.utils e guardadas num cache: uma listagem
+  de reservas repete poucas datas distintas, então quase tudo é acerto.
+- Decimal, UUID, dataclasses e objetos com __html__ seguem o provider padrão;
+  qualquer outro tipo gera TypeError.
+- Chaves ordenadas (sort_keys), como no provider padrão: a mesma resposta
+  gera sempre os mesmos bytes (útil para ETag).
+- response() monta o corpo direto em bytes, sem a conversão str -> bytes.
+"""
+
+DIAS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MESES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MAX_DATAS_CACHE = 20000
+
+_cache_datas = {}
+_trava_cache = threading.Lock()
+
+
+def formatar_http_date(valor: date | datetime) -> str:
+    """Equivalente a werkzeug.http.http_date para date e datetime sem fuso (UTC)."""
+    if type(valor) is date:
+        return f"{DIAS[valor.weekday()]}, {valor.day:02d} {MESES[valor.month - 1]} {valor.year:04d} 00:00:00 GMT"
+    if isinstance(valor, datetime) and valor.tzinfo is None:
+        return (f"{DIAS[valor.weekday()]}, {valor.day:02d} {MESES[valor.month - 1]} {valor.year:04d} "
+                f"{valor.hour:02d}:{valor.minute:02d}:{valor.second:02d} GMT")
+    return http_date(valor)  # datetime com fuso: converte para UTC
+
+
+def padrao(valor):
+    """Serializa tipos que o encoder não conhece (date, datetime, Decimal, UUID, dataclass, __html__)."""
+    if isinstance(valor, date):
+        texto = _cache_datas.get(valor)
+        if texto is None:
+            texto = formatar_http_date(valor)
+            with _trava_cache:
+                if len(_cache_datas) >= MAX_DATAS_CACHE:
+                    _cache_datas.clear()
+                _cache_datas[valor] = texto
+        return texto
+    if isinstance(valor, (Decimal, uuid.UUID)):
+        return str(valor)
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        return dataclasses.asdict(valor)
+    if hasattr(valor, "__html__"):
+        return str(valor.__html__())
+    raise TypeError(f"Object of type {type(valor).__name__} is not JSON serializable")
+
+
+class RapidoJSONProvider(DefaultJSONProvider):
+    default = staticmethod(padrao)
+    # saída em UTF-8 (como o orjson) também no fallback: menos bytes e menos trabalho
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is not None and self.__suportado(kwargs):
+            return orjson.dumps(obj, default=kwargs.get("default", self.default), option=self.__opcoes(kwargs)).decode()
+        kwargs.setdefault("default", self.default)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indentar = (self.compact is None and self._app.debug) or self.compact is False
+
+        if orjson is None:
+            dump_args = {"indent": 2} if indentar else {"separators": (",", ":")}
+            corpo = f"{self.dumps(obj, **dump_args)}\n".encode()
+        else:
+            corpo = orjson.dumps(obj, default=self.default, option=self.__opcoes({"indent": 2} if indentar else {}))
+            corpo += b"\n"
+        return self._app.response_class(corpo, mimetype=self.mimetype)
+
+    # ---------------- orjson ----------------
+    @staticmethod
+    def __suportado(kwargs: dict) -> bool:
+        # opções de json.dumps sem equivalente no orjson usam a biblioteca padrão
+        return set(kwargs) <= {"indent", "separators", "default", "sort_keys"} and kwargs.get("indent") in (None, 2)
+
+    def __opcoes(self, kwargs: dict) -> int:
+        # datas passam pelo default para manter o formato HTTP do Flask
+        opcoes = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            opcoes |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            opcoes |= orjson.OPT_INDENT_2
+        return opcoes
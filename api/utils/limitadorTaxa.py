@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import struct
+import time
+from api.utils.arquivoMapeado import ArquivoMapeado
+
+"""
+Token buckets em memória compartilhada (arquivo mapeado com mmap).
+
+Todos os workers do gunicorn mapeiam o mesmo arquivo, então um limite vale
+para o servidor inteiro e não por processo. O arquivo é uma tabela fixa de
+slots endereçada pelo hash da chave (sondagem linear); quando a janela de
+sondagem está cheia, o slot usado há mais tempo é reaproveitado.
+
+Slot (24 bytes): hash da chave (uint64), tokens (double), última atualização (double).
+
+A verificação faz uma trava (ArquivoMapeado.travado(): threading + flock),
+algumas leituras/escritas struct no mmap e nenhuma alocação de arquivo: custa
+poucos microssegundos.
+"""
+
+FORMATO_SLOT = struct.Struct("<Qdd")
+SONDAGEM_MAXIMA = 8
+
+
+def _hash_chave(chave: str) -> int:
+    valor = int.from_bytes(hashlib.blake2b(chave.encode(), digest_size=8).digest(), "little")
+    return valor or 1  # 0 marca slot vazio
+
+
+class LimitadorTaxa:
+    def __init__(self, path: str | None = None, slots: int = 4096):
+        self.path = path or os.environ.get("RATE_LIMIT_PATH", "api/system/rate_limit.bin")
+        self.slots = slots
+        self.__arquivo = ArquivoMapeado(self.path, slots * FORMATO_SLOT.size)
+
+    def consumir(self, baldes: list[tuple[str, float, float]], custo: float = 1.0) -> tuple[bool, float]:
+        """
+        Consome um token de cada balde, atomicamente (ou de todos, ou de nenhum).
+
+        :param baldes: lista de (chave, capacidade, tokens_por_segundo)
+        :return: (permitido, segundos até haver token em todos os baldes)
+        """
+        agora = time.time()
+        with self.__arquivo.travado() as mapa:
+            estados = []
+            espera = 0.0
+            for chave, capacidade, taxa in baldes:
+                hash_chave = _hash_chave(chave)
+                posicao, tokens = self.__localizar(mapa, hash_chave, capacidade, agora, taxa)
+                # grava já o saldo reabastecido: ocupa o slot antes do próximo balde ser localizado
+                FORMATO_SLOT.pack_into(mapa, posicao, hash_chave, tokens, agora)
+                estados.append((posicao, tokens, hash_chave))
+                if tokens < custo:
+                    espera = max(espera, (custo - tokens) / taxa if taxa > 0 else float("inf"))
+
+            permitido = espera == 0.0
+            if permitido:
+                for posicao, tokens, hash_chave in estados:
+                    FORMATO_SLOT.pack_into(mapa, posicao, hash_chave, tokens - custo, agora)
+            return permitido, espera
+
+    def __localizar(self, mapa, hash_chave: int, capacidade: float, agora: float, taxa: float) -> tuple[int, float]:
+        """Devolve (offset do slot, tokens disponíveis agora) da chave."""
+        inicio = hash_chave % self.slots
+        mais_antigo = None
+        for i in range(SONDAGEM_MAXIMA):
+            posicao = ((inicio + i) % self.slots) * FORMATO_SLOT.size
+            hash_slot, tokens, ultima = FORMATO_SLOT.unpack_from(mapa, posicao)
+            if hash_slot == hash_chave:
+                return posicao, min(capacidade, tokens + (agora - ultima) * taxa)
+            if hash_slot == 0:
+                return posicao, capacidade
+            if mais_antigo is None or ultima < mais_antigo[1]:
+                mais_antigo = (posicao, ultima)
+        # janela cheia: reaproveita o slot menos recente como balde novo (cheio)
+        return mais_antigo[0], capacidade
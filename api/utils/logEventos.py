@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+import time
+from api.utils.armazenamentoLocal import ArmazenamentoLocal
+
+"""
+Log de eventos limitado, gravado numa tabela do ArmazenamentoLocal.
+
+- publicar() grava o evento com id crescente (AUTOINCREMENT) e acorda quem
+  está esperando neste processo.
+- Eventos publicados por outros workers chegam pela releitura da tabela a
+  cada intervalo de verificação (consulta pela chave primária, id > ?).
+- O id é o "id" do Server-Sent Events: o cliente reconecta com Last-Event-ID
+  e recebe tudo o que veio depois, enquanto ainda estiver no log.
+- A tabela guarda no máximo max_eventos; os mais antigos são descartados.
+"""
+
+DDL_EVENTOS = """
+CREATE TABLE IF NOT EXISTS {tabela} (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    tipo       TEXT NOT NULL,
+    dados      TEXT NOT NULL,
+    criado_em  REAL NOT NULL
+);
+"""
+
+
+class LogEventos:
+    LIMPEZA_A_CADA = 100  # publicações entre limpezas dos eventos excedentes
+
+    def __init__(self, armazenamento: ArmazenamentoLocal, tabela: str, max_eventos: int | None = None):
+        """
+        :param armazenamento: ArmazenamentoLocal onde fica a tabela do log
+        :param tabela: nome da tabela (ex.: "eventos_reserva")
+        :param max_eventos: eventos mantidos para retomada (padrão EVENTOS_MAX ou 1000)
+        """
+        print(f"⬆️  LogEventos.__init__({tabela})")
+        self.__armazenamento = armazenamento
+        self.__tabela = tabela
+        self.__max_eventos = max_eventos or int(os.environ.get("EVENTOS_MAX", 1000))
+        self.__novo_evento = threading.Condition()
+        self.__publicacoes = 0
+        self.__armazenamento.garantir_esquema(tabela, DDL_EVENTOS.format(tabela=tabela))
+
+    def publicar(self, tipo: str, dados: dict) -> int:
+        """Grava o evento e devolve o id."""
+        with self.__armazenamento.transacao() as conexao:
+            cursor = conexao.execute(
+                f"INSERT INTO {self.__tabela} (tipo, dados, criado_em) VALUES (?, ?, ?)",
+                (tipo, json.dumps(dados, ensure_ascii=False, default=str), time.time()),
+            )
+            id_evento = cursor.lastrowid
+        with self.__novo_evento:
+            self.__publicacoes += 1
+            limpar = self.__publicacoes % self.LIMPEZA_A_CADA == 0
+            self.__novo_evento.notify_all()
+        if limpar:
+            self.__armazenamento.executar(f"DELETE FROM {self.__tabela} WHERE id <= ?", (id_evento - self.__max_eventos,))
+        print(f"📣 LogEventos[{self.__tabela}] {tipo} -> {id_evento}")
+        return id_evento
+
+    def ultimo_id(self) -> int:
+        linha = self.__armazenamento.consultar_um(f"SELECT COALESCE(MAX(id), 0) AS id FROM {self.__tabela}")
+        return linha["id"]
+
+    def disponivel_desde(self, ultimo_id: int) -> bool:
+        """False se eventos posteriores a ultimo_id já foram descartados (cliente deve recarregar tudo)."""
+        linha = self.__armazenamento.consultar_um(f"SELECT MIN(id) AS id FROM {self.__tabela}")
+        return linha["id"] is None or linha["id"] <= ultimo_id + 1
+
+    def desde(self, ultimo_id: int, limite: int = 100) -> list[dict]:
+        linhas = self.__armazenamento.consultar(
+            f"SELECT id, tipo, dados FROM {self.__tabela} WHERE id > ? ORDER BY id LIMIT ?",
+            (ultimo_id, limite),
+        )
+        return [{"id": linha["id"], "tipo": linha["tipo"], "dados": json.loads(linha["dados"])} for linha in linhas]
+
+    def aguardar(self, ultimo_id: int, timeout: float, intervalo: float = 1.0) -> list[dict]:
+        """
+        Espera até haver eventos depois de ultimo_id ou o timeout acabar.
+
+        Publicações deste processo acordam na hora; as de outros workers são vistas
+        na próxima verificação (a cada 'intervalo' segundos).
+        """
+        limite_tempo = time.monotonic() + timeout
+        while True:
+            eventos = self.desde(ultimo_id)
+            restante = limite_tempo - time.monotonic()
+            if eventos or restante <= 0:
+                return eventos
+            with self.__novo_evento:
+                self.__novo_evento.wait(min(intervalo, restante))
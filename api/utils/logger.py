@@ -1,4 +1,6 @@
+import logging
 import os
+import re
 import traceback
 from datetime import datetime
 
@@ -46,4 +48,24 @@ class Logger:
             with open(Logger.LOG_FILE, "a", encoding="utf-8") as f:
                 f.write(entry)
         except Exception as e:
-            print("🔴 Falha ao gravar log:", e)
\ No newline at end of file
+            print("🔴 Falha ao gravar log:", e)
+
+
+class FiltroCredenciais(logging.Filter):
+    """
+    Filtro para o log de acesso (logger "werkzeug"): troca o valor de
+    ?ticket= e ?token= na linha da requisição por "***", para credenciais
+    enviadas na URL não irem parar no log.
+    """
+
+    PADRAO = re.compile(r"([?&](?:ticket|token)=)[^&\s\"]*")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                self.PADRAO.sub(r"\1***", arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        elif isinstance(record.msg, str):
+            record.msg = self.PADRAO.sub(r"\1***", record.msg)
+        return True
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+"""
+Métricas de desempenho da API (formato Prometheus e header Server-Timing).
+
+Registra:
+- Latência das requisições por rota/método (histograma) e total por status
+- Quantidade e tempo de queries por requisição e tempo por método de DAO
+- Tempo de espera por conexão no pool
+- Acertos/erros dos caches (hit ratio)
+
+Desabilitada por padrão (METRICS_ENABLED=1 habilita). Desabilitada, cada
+ponto de medição custa apenas a leitura de Metricas.habilitado.
+"""
+
+BUCKETS_SEGUNDOS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_QUANTIDADE = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+# Acumuladores da requisição corrente: {"queries": int, "db": s, "pool": s}
+_requisicao_atual: ContextVar[dict | None] = ContextVar("metricas_requisicao", default=None)
+# Profundidade de chamadas de DAO (findById -> findByField conta como 1 query)
+_profundidade_dao: ContextVar[int] = ContextVar("metricas_profundidade_dao", default=0)
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatar_labels(nomes: tuple, valores: tuple, extra: str = "") -> str:
+    partes = [f'{n}="{_escapar(v)}"' for n, v in zip(nomes, valores)]
+    if extra:
+        partes.append(extra)
+    return "{" + ",".join(partes) + "}" if partes else ""
+
+
+class Histograma:
+    """Histograma com rótulos (label) no formato Prometheus."""
+
+    def __init__(self, nome: str, ajuda: str, labels: tuple = (), buckets: tuple = BUCKETS_SEGUNDOS):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.labels = labels
+        self.buckets = buckets
+        self.__series = {}  # valores dos labels -> [contagens por bucket..., soma, total]
+        self.__trava = threading.Lock()
+
+    def observar(self, valor: float, *labels):
+        with self.__trava:
+            serie = self.__series.get(labels)
+            if serie is None:
+                serie = self.__series[labels] = [0] * (len(self.buckets) + 2)
+            for i, limite in enumerate(self.buckets):
+                if valor <= limite:
+                    serie[i] += 1
+            serie[-2] += valor
+            serie[-1] += 1
+
+    def exportar(self) -> list[str]:
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} histogram"]
+        with self.__trava:
+            series = {k: list(v) for k, v in self.__series.items()}
+        for labels, serie in sorted(series.items()):
+            rotulos = _formatar_labels(self.labels, labels)
+            for limite, contagem in zip(self.buckets, serie):
+                le = _formatar_labels(self.labels, labels, 'le="%s"' % limite)
+                linhas.append(f"{self.nome}_bucket{le} {contagem}")
+            le = _formatar_labels(self.labels, labels, 'le="+Inf"')
+            linhas.append(f"{self.nome}_bucket{le} {serie[-1]}")
+            linhas.append(f"{self.nome}_sum{rotulos} {serie[-2]}")
+            linhas.append(f"{self.nome}_count{rotulos} {serie[-1]}")
+        return linhas
+
+
+class Contador:
+    """Contador monotônico com rótulos (label) no formato Prometheus."""
+
+    def __init__(self, nome: str, ajuda: str, labels: tuple = ()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.labels = labels
+        self.__valores = {}
+        self.__trava = threading.Lock()
+
+    def incrementar(self, *labels, valor: float = 1):
+        with self.__trava:
+            self.__valores[labels] = self.__valores.get(labels, 0) + valor
+
+    def valores(self) -> dict:
+        with self.__trava:
+            return dict(self.__valores)
+
+    def exportar(self) -> list[str]:
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} counter"]
+        for labels, valor in sorted(self.valores().items()):
+            linhas.append(f"{self.nome}{_formatar_labels(self.labels, labels)} {valor}")
+        return linhas
+
+
+class Metricas:
+    """
+    Registro global de métricas (métodos estáticos, como Logger).
+
+    Uso:
+    - Server chama iniciar_requisicao()/finalizar_requisicao() nos hooks do Flask
+    - DAOs usam o decorator @Metricas.medir_dao
+    - DatabaseConfig chama registrar_espera_pool()
+    - Caches chamam registrar_cache(nome, acerto)
+    """
+
+    habilitado = False
+
+    requisicoes_duracao = Histograma(
+        "casabranca_http_request_duration_seconds", "Latência das requisições HTTP.", ("rota", "metodo"))
+    requisicoes_total = Contador(
+        "casabranca_http_requests_total", "Total de requisições HTTP.", ("rota", "metodo", "status"))
+    queries_por_requisicao = Histograma(
+        "casabranca_db_queries_per_request", "Queries executadas por requisição.", ("rota", "metodo"),
+        BUCKETS_QUANTIDADE)
+    db_por_requisicao = Histograma(
+        "casabranca_db_time_per_request_seconds", "Tempo em queries por requisição.", ("rota", "metodo"))
+    dao_duracao = Histograma(
+        "casabranca_db_query_duration_seconds", "Duração das chamadas de DAO.", ("dao",))
+    pool_espera = Histograma(
+        "casabranca_db_pool_wait_seconds", "Espera por uma conexão do pool.")
+    cache_total = Contador(
+        "casabranca_cache_requests_total", "Consultas aos caches por resultado.", ("cache", "resultado"))
+
+    @staticmethod
+    def configurar(habilitado: bool):
+        Metricas.habilitado = bool(habilitado)
+
+    # ---------------- requisição ----------------
+    @staticmethod
+    def iniciar_requisicao():
+        if not Metricas.habilitado:
+            return
+        _requisicao_atual.set({"inicio": time.perf_counter(), "queries": 0, "db": 0.0, "pool": 0.0})
+
+    @staticmethod
+    def finalizar_requisicao(rota: str, metodo: str, status: int) -> dict | None:
+        """
+        Registra a requisição corrente e devolve seus acumuladores
+        (duracao, queries, db, pool) para montar o header Server-Timing.
+        """
+        if not Metricas.habilitado:
+            return None
+        atual = _requisicao_atual.get()
+        if atual is None:
+            return None
+        _requisicao_atual.set(None)
+
+        atual["duracao"] = time.perf_counter() - atual["inicio"]
+        Metricas.requisicoes_duracao.observar(atual["duracao"], rota, metodo)
+        Metricas.requisicoes_total.incrementar(rota, metodo, str(status))
+        Metricas.queries_por_requisicao.observar(atual["queries"], rota, metodo)
+        Metricas.db_por_requisicao.observar(atual["db"], rota, metodo)
+        return atual
+
+    @staticmethod
+    def server_timing(atual: dict) -> str:
+        """Valor do header Server-Timing (durações em ms)."""
+        return (
+            f'app;dur={atual["duracao"] * 1000:.2f}, '
+            f'db;dur={atual["db"] * 1000:.2f};desc="{atual["queries"]} queries", '
+            f'pool;dur={atual["pool"] * 1000:.2f}'
+        )
+
+    # ---------------- banco ----------------
+    @staticmethod
+    def medir_dao(func):
+        """Decorator para métodos de DAO: conta a query e mede o tempo."""
+        nome = func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Metricas.habilitado:
+                return func(*args, **kwargs)
+
+            profundidade = _profundidade_dao.get()
+            token = _profundidade_dao.set(profundidade + 1)
+            inicio = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duracao = time.perf_counter() - inicio
+                _profundidade_dao.reset(token)
+                if profundidade == 0:
+                    Metricas.dao_duracao.observar(duracao, nome)
+                    atual = _requisicao_atual.get()
+                    if atual is not None:
+                        atual["queries"] += 1
+                        atual["db"] += duracao
+        return wrapper
+
+    @staticmethod
+    def registrar_espera_pool(duracao: float):
+        if not Metricas.habilitado:
+            return
+        Metricas.pool_espera.observar(duracao)
+        atual = _requisicao_atual.get()
+        if atual is not None:
+            atual["pool"] += duracao
+
+    # ---------------- caches ----------------
+    @staticmethod
+    def registrar_cache(nome: str, acerto: bool):
+        if not Metricas.habilitado:
+            return
+        Metricas.cache_total.incrementar(nome, "hit" if acerto else "miss")
+
+    # ---------------- exportação ----------------
+    @staticmethod
+    def exportar_prometheus() -> str:
+        linhas = []
+        for metrica in (
+            Metricas.requisicoes_duracao, Metricas.requisicoes_total,
+            Metricas.queries_por_requisicao, Metricas.db_por_requisicao,
+            Metricas.dao_duracao, Metricas.pool_espera, Metricas.cache_total,
+        ):
+            linhas.extend(metrica.exportar())
+
+        # Razão de acerto por cache (derivada do contador)
+        caches = {}
+        for (cache, resultado), valor in Metricas.cache_total.valores().items():
+            caches.setdefault(cache, {"hit": 0, "miss": 0})[resultado] += valor
+        linhas.append("# HELP casabranca_cache_hit_ratio Razão de acertos por cache.")
+        linhas.append("# TYPE casabranca_cache_hit_ratio gauge")
+        for cache, contagem in sorted(caches.items()):
+            total = contagem["hit"] + contagem["miss"]
+            linhas.append(f'casabranca_cache_hit_ratio{{cache="{_escapar(cache)}"}} {contagem["hit"] / total if total else 0}')
+
+        return "\n".join(linhas) + "\n"
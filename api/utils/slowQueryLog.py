@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+"""
+Log de queries lentas da camada DAO.
+
+Cada statement executado pelo SqlExecutor que passar de SLOW_QUERY_MS
+(padrão 200 ms; 0 desabilita) é registrado com:
+- SQL normalizado (literais e listas IN colapsados, espaços unificados)
+- formato dos parâmetros (apenas os tipos, nunca os valores)
+- quantidade de linhas e duração
+- plano do EXPLAIN, capturado uma única vez por statement normalizado
+
+As entradas vão para api/system/slow_query.log (arquivo rotativo, uma linha
+JSON por query) e ficam agregadas em memória para GET /api/v1/admin/slow-queries.
+"""
+
+REGEX_ESPACOS = re.compile(r"\s+")
+REGEX_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+REGEX_NUMERO = re.compile(r"\b\d+(?:\.\d+)?\b")
+REGEX_LISTA_IN = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+
+
+def normalizar_sql(sql: str) -> str:
+    """Reduz o SQL a uma forma canônica para agrupar execuções do mesmo statement."""
+    sql = sql.replace("%s", "?")
+    sql = REGEX_STRING.sub("?", sql)
+    sql = REGEX_NUMERO.sub("?", sql)
+    sql = REGEX_LISTA_IN.sub("IN (...)", sql)
+    return REGEX_ESPACOS.sub(" ", sql).strip().rstrip(";").strip()
+
+
+def formato_parametros(params) -> str:
+    """Descreve os parâmetros apenas pelos tipos, ex.: "(int, str, date)"."""
+    if not params:
+        return "()"
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in params.items()) + "}"
+    return "(" + ", ".join(type(v).__name__ for v in params) + ")"
+
+
+class SlowQueryLog:
+    """
+    Registro global de queries lentas (métodos estáticos, como Logger).
+    """
+
+    LOG_FILE = "api/system/slow_query.log"
+    LIMITE_MS = float(os.environ.get("SLOW_QUERY_MS", 200))
+    MAX_BYTES = 5 * 1024 * 1024
+    BACKUPS = 3
+    MAX_STATEMENTS = 500
+
+    __estatisticas = {}
+    __trava = threading.Lock()
+    __logger = None
+
+    @staticmethod
+    def configurar(limite_ms: float | None = None, log_file: str | None = None):
+        if limite_ms is not None:
+            SlowQueryLog.LIMITE_MS = float(limite_ms)
+        if log_file is not None and log_file != SlowQueryLog.LOG_FILE:
+            SlowQueryLog.LOG_FILE = log_file
+            SlowQueryLog.__logger = None
+
+    @staticmethod
+    def habilitado() -> bool:
+        return SlowQueryLog.LIMITE_MS > 0
+
+    @staticmethod
+    def lenta(duracao: float) -> bool:
+        return 0 < SlowQueryLog.LIMITE_MS <= duracao * 1000
+
+    @staticmethod
+    def registrar(sql: str, params, linhas: int, duracao: float, explicar=None):
+        """
+        Registra uma execução lenta.
+
+        :param explicar: callable(sql, params) -> list[dict] que executa o EXPLAIN;
+                         chamado apenas na primeira vez que o statement aparece.
+        """
+        normalizado = normalizar_sql(sql)
+        formato = formato_parametros(params)
+        duracao_ms = duracao * 1000
+
+        with SlowQueryLog.__trava:
+            estatistica = SlowQueryLog.__estatisticas.get(normalizado)
+            novo = estatistica is None
+            if novo:
+                if len(SlowQueryLog.__estatisticas) >= SlowQueryLog.MAX_STATEMENTS:
+                    menor = min(SlowQueryLog.__estatisticas, key=lambda k: SlowQueryLog.__estatisticas[k]["total_ms"])
+                    del SlowQueryLog.__estatisticas[menor]
+                estatistica = SlowQueryLog.__estatisticas[normalizado] = {
+                    "sql": normalizado,
+                    "ocorrencias": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "linhas_max": 0,
+                    "parametros": formato,
+                    "explain": None,
+                    "ultima_em": None,
+                }
+            estatistica["ocorrencias"] += 1
+            estatistica["total_ms"] += duracao_ms
+            estatistica["max_ms"] = max(estatistica["max_ms"], duracao_ms)
+            estatistica["linhas_max"] = max(estatistica["linhas_max"], linhas or 0)
+            estatistica["parametros"] = formato
+            estatistica["ultima_em"] = datetime.utcnow().isoformat()
+
+        # EXPLAIN fora da trava: executa outra query no banco
+        if novo and explicar is not None:
+            try:
+                plano = explicar(sql, params)
+            except Exception as e:
+                plano = [{"erro": str(e)}]
+            with SlowQueryLog.__trava:
+                estatistica["explain"] = plano
+
+        SlowQueryLog._escrever({
+            "em": datetime.utcnow().isoformat(),
+            "duracao_ms": round(duracao_ms, 2),
+            "linhas": linhas,
+            "sql": normalizado,
+            "parametros": formato,
+            "explain": estatistica["explain"] if novo else None,
+        })
+
+    @staticmethod
+    def top(limite: int = 20, ordem: str = "total_ms") -> list[dict]:
+        """Statements mais custosos, ordenados por total_ms, max_ms ou ocorrencias."""
+        if ordem not in ("total_ms", "max_ms", "ocorrencias"):
+            ordem = "total_ms"
+        with SlowQueryLog.__trava:
+            itens = [dict(e) for e in SlowQueryLog.__estatisticas.values()]
+        for item in itens:
+            item["media_ms"] = round(item["total_ms"] / item["ocorrencias"], 2)
+            item["total_ms"] = round(item["total_ms"], 2)
+            item["max_ms"] = round(item["max_ms"], 2)
+        itens.sort(key=lambda e: e[ordem], reverse=True)
+        return itens[:limite]
+
+    @staticmethod
+    def limpar():
+        with SlowQueryLog.__trava:
+            SlowQueryLog.__estatisticas.clear()
+
+    @staticmethod
+    def _escrever(entrada: dict):
+        try:
+            if SlowQueryLog.__logger is None:
+                SlowQueryLog.__logger = SlowQueryLog._criar_logger()
+            SlowQueryLog.__logger.warning(json.dumps(entrada, ensure_ascii=False, default=str))
+        except Exception as e:
+            print("🔴 Falha ao gravar slow query log:", e)
+
+    @staticmethod
+    def _criar_logger() -> logging.Logger:
+        os.makedirs(os.path.dirname(SlowQueryLog.LOG_FILE) or ".", exist_ok=True)
+        logger = logging.getLogger("casabranca.slow_query")
+        logger.setLevel(logging.WARNING)
+        logger.propagate = False
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        handler = RotatingFileHandler(
+            SlowQueryLog.LOG_FILE,
+            maxBytes=SlowQueryLog.MAX_BYTES,
+            backupCount=SlowQueryLog.BACKUPS,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        return logger
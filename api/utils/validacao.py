@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from api.utils.errorResponse import ErrorResponse
+
+"""
+Etapa única de validação compartilhada por middleware, control e service.
+
+Objetivo:
+- O middleware valida o corpo da requisição UMA vez e guarda o objeto do
+  modelo (já validado) em flask.g.
+- O service aceita tanto o objeto já validado (caminho HTTP) quanto um dict
+  (outros chamadores, ex.: ReservaPublicaService), validando só no segundo caso.
+"""
+
+
+def validar_entidade(cls, dados, mensagem: str):
+    """
+    Retorna um objeto do modelo validado.
+
+    :param cls: Classe do modelo (Chale, Inquilino, Reserva)
+    :param dados: Objeto já validado (retornado como está) ou dict a validar
+    :param mensagem: str - Mensagem do ErrorResponse em caso de falha
+    :return: Instância de cls
+    :raises ErrorResponse: 400 com a lista de erros de validação
+    """
+    if isinstance(dados, cls):
+        return dados
+
+    if not isinstance(dados, dict):
+        raise ErrorResponse(400, mensagem, {"errors": [f"O objeto '{cls.__name__}' deve ser um objeto JSON."]})
+
+    obj, erros = cls.from_dict(dados)
+    if erros:
+        raise ErrorResponse(400, mensagem, {"errors": erros})
+
+    return obj
+
+
+def parse_campos(valor: str | None, permitidos) -> tuple | None:
+    """
+    Converte o parâmetro ?fields=a,b em uma tupla de colunas, validada contra
+    a lista de campos permitidos do DAO (a mesma usada por findByField).
+
+    :return: None quando o parâmetro não foi informado (todas as colunas)
+    :raises ErrorResponse: 400 se algum campo não for permitido
+    """
+    if valor is None:
+        return None
+    campos = tuple(dict.fromkeys(campo.strip() for campo in valor.split(",") if campo.strip()))
+    invalidos = [campo for campo in campos if campo not in permitidos]
+    if invalidos or not campos:
+        raise ErrorResponse(400, "Parâmetro fields inválido", {
+            "message": f"Campos inválidos: {', '.join(invalidos) or '(vazio)'}. Use: {', '.join(permitidos)}"
+        })
+    return campos
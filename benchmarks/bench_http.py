@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+Teste de carga HTTP de todas as rotas da API.
+
+Percorre as rotas de InquilinoRoteador, ChaleRoteador, ReservaRoteador e
+AuthRoteador em dois modos:
+- cliente:  Flask test client (sem rede, mede o custo da aplicação)
+- servidor: servidor HTTP real (werkzeug em thread) ou --url externo (ex.: gunicorn)
+
+Cada cenário é executado com N requisições distribuídas em C threads
+concorrentes. O relatório traz vazão e p50/p95/p99 por rota, e o JSON
+é salvo em benchmarks/resultados/ para comparação entre execuções.
+
+Os registros criados pelo benchmark (chalés, inquilinos e reservas) são
+removidos pelos próprios cenários de DELETE no final.
+
+O rate limit (login 10/60, reserva pública 5/60 por IP) é desligado no app
+iniciado pelo benchmark (RATE_LIMIT_ENABLED=0), senão auth.login e
+reservas.publica mediriam respostas 429; --com-rate-limit mantém os limites.
+Com --url, o servidor externo deve ser iniciado com RATE_LIMIT_ENABLED=0.
+reservas.publica depende do inquilino 999 e dos chalés com tipo (semeados no
+esquema SQLite; no MySQL, migrations/004_chale_tipo.sql).
+
+Uso:
+    python -m benchmarks.bench_http --modo cliente --requisicoes 200 --concorrencia 8
+    python -m benchmarks.bench_http --modo servidor --concorrencia 16
+    python -m benchmarks.bench_http --modo servidor --url http://127.0.0.1:8000
+    python -m benchmarks.bench_http --sqlite              (banco SQLite em memória, sem MySQL)
+"""
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from urllib.parse import urlparse
+
+from benchmarks.comum import imprimir_linha, resumir, salvar_resultados
+
+
+def gerar_cpf(semente: int) -> str:
+    """Gera um CPF válido (dígitos verificadores corretos) a partir de um número."""
+    base = [int(c) for c in f"{semente % 10**9:09d}"]
+    if len(set(base)) == 1:
+        base[-1] = (base[-1] + 1) % 10
+    for i in (9, 10):
+        soma = sum(base[j] * (i + 1 - j) for j in range(i))
+        base.append((soma * 10 % 11) % 10)
+    return "".join(str(d) for d in base)
+
+
+class ClienteTeste:
+    """Executa requisições no Flask test client (um cliente por thread)."""
+
+    def __init__(self, app):
+        self.__app = app
+        self.__local = threading.local()
+
+    def requisitar(self, metodo: str, caminho: str, corpo: dict | None, headers: dict) -> tuple[int, bytes]:
+        cliente = getattr(self.__local, "cliente", None)
+        if cliente is None:
+            cliente = self.__local.cliente = self.__app.test_client()
+        resposta = cliente.open(caminho, method=metodo, json=corpo, headers=headers)
+        return resposta.status_code, resposta.get_data()
+
+
+class ClienteHTTP:
+    """Executa requisições em um servidor HTTP real (uma conexão por thread)."""
+
+    def __init__(self, url_base: str):
+        url = urlparse(url_base)
+        self.__host = url.hostname
+        self.__porta = url.port or 80
+        self.__local = threading.local()
+
+    def __conexao(self) -> http.client.HTTPConnection:
+        conexao = getattr(self.__local, "conexao", None)
+        if conexao is None:
+            conexao = self.__local.conexao = http.client.HTTPConnection(self.__host, self.__porta, timeout=30)
+        return conexao
+
+    def requisitar(self, metodo: str, caminho: str, corpo: dict | None, headers: dict) -> tuple[int, bytes]:
+        dados = json.dumps(corpo).encode("utf-8") if corpo is not None else None
+        headers = dict(headers)
+        if dados is not None:
+            headers["Content-Type"] = "application/json"
+
+        for tentativa in (1, 2):
+            conexao = self.__conexao()
+            try:
+                conexao.request(metodo, caminho, body=dados, headers=headers)
+                resposta = conexao.getresponse()
+                return resposta.status, resposta.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                # O servidor de desenvolvimento fecha conexões (HTTP/1.0); reabre e tenta de novo
+                conexao.close()
+                self.__local.conexao = None
+                if tentativa == 2:
+                    raise
+
+
+class Cenario:
+    """Uma rota a ser exercitada: método, caminho e corpo por iteração."""
+
+    def __init__(self, nome, metodo, caminho, corpo=None, autenticado=True, coletar=None, quantidade=None):
+        self.nome = nome
+        self.metodo = metodo
+        self.caminho = caminho          # callable(i, ctx) -> str
+        self.corpo = corpo              # callable(i, ctx) -> dict | None
+        self.autenticado = autenticado
+        self.coletar = coletar          # callable(i, resposta_json, ctx) -> None
+        self.quantidade = quantidade    # callable(ctx) -> int | None (limita o número de requisições)
+
+
+def _ids(ctx, chave):
+    ids = ctx[chave]
+    if not ids:
+        raise RuntimeError(f"Nenhum registro em '{chave}': o cenário de criação falhou.")
+    return ids
+
+
+def montar_cenarios(execucao: int, email: str, senha: str) -> list[Cenario]:
+    """Cenários na ordem de execução (criações antes de leituras, remoções no final)."""
+    hoje = date.today()
+
+    def coletar_chale(i, resposta, ctx):
+        ctx["chales"].append(resposta["data"]["Chales"][0]["idChale"])
+
+    def coletar_inquilino(i, resposta, ctx):
+        ctx["inquilinos"].append(resposta["data"]["Inquilinos"][0]["idInquilino"])
+
+    def coletar_reserva(i, resposta, ctx):
+        r = resposta["data"]["Reservas"][0]
+        ctx["reservas"].append(r)
+
+    def corpo_chale(i, ctx):
+        return {"Chale": {"nome": f"Bench Chalé {execucao}-{i}", "capacidade": 2 + i % 6}}
+
+    def corpo_inquilino(i, ctx):
+        return {"Inquilino": {
+            "nomeInquilino": f"Bench Hóspede {execucao}-{i}",
+            "email": f"bench{execucao}.{i}@casabranca.com",
+            "telefone": "(54) 99999-0000",
+            "requisicao": "benchmark",
+            "cpf": gerar_cpf(execucao * 1000 + i),
+        }}
+
+    def corpo_reserva(i, ctx):
+        chales = _ids(ctx, "chales")
+        # Um período de 1 noite distinto por (chalé, i) -> nenhuma sobreposição
+        inicio = hoje + timedelta(days=30 + 2 * (i // len(chales)))
+        return {"Reserva": {
+            "idInquilino": _ids(ctx, "inquilinos")[i % len(ctx["inquilinos"])],
+            "idChale": chales[i % len(chales)],
+            "inicio": inicio.isoformat(),
+            "fim": (inicio + timedelta(days=1)).isoformat(),
+        }}
+
+    def corpo_reserva_existente(i, ctx):
+        r = _ids(ctx, "reservas")[i % len(ctx["reservas"])]
+        return {"Reserva": {k: r[k] for k in ("idInquilino", "idChale", "inicio", "fim")}}
+
+    def corpo_publica(i, ctx):
+        inicio = hoje + timedelta(days=400 + 2 * i)
+        return {"reserva_publica": {
+            "nome": f"Bench Site {i}",
+            "email": f"site{i}@casabranca.com",
+            "telefone": "(54) 99999-0000",
+            "chale_desejado": ("romantico", "familiar", "premium")[i % 3],
+            "data_inicio": inicio.isoformat(),
+            "data_fim": (inicio + timedelta(days=1)).isoformat(),
+            "numero_pessoas": 2,
+        }}
+
+    def item(chave):
+        return lambda base: (lambda i, ctx: f"{base}{_ids(ctx, chave)[i % len(ctx[chave])]}")
+
+    def id_reserva(i, ctx):
+        return f"/api/v1/reservas/{_ids(ctx, 'reservas')[i % len(ctx['reservas'])]['idReserva']}"
+
+    um_por_registro = lambda chave: (lambda ctx: len(ctx[chave]))
+
+    return [
+        Cenario("auth.login", "POST", lambda i, ctx: "/api/v1/auth/login",
+                lambda i, ctx: {"usuario": {"email": email, "senha": senha}}, autenticado=False),
+
+        Cenario("chales.store", "POST", lambda i, ctx: "/api/v1/chales/", corpo_chale, coletar=coletar_chale),
+        Cenario("chales.index", "GET", lambda i, ctx: "/api/v1/chales/"),
+        Cenario("chales.show", "GET", item("chales")("/api/v1/chales/")),
+        Cenario("chales.update", "PUT", item("chales")("/api/v1/chales/"),
+                lambda i, ctx: {"Chale": {"nome": f"Bench Chalé {execucao}-{i}-u", "capacidade": 4}},
+                quantidade=um_por_registro("chales")),
+
+        Cenario("inquilinos.store", "POST", lambda i, ctx: "/api/v1/inquilinos/", corpo_inquilino,
+                coletar=coletar_inquilino),
+        Cenario("inquilinos.index", "GET", lambda i, ctx: "/api/v1/inquilinos/"),
+        Cenario("inquilinos.show", "GET", item("inquilinos")("/api/v1/inquilinos/")),
+        Cenario("inquilinos.update", "PUT", item("inquilinos")("/api/v1/inquilinos/"), corpo_inquilino,
+                quantidade=um_por_registro("inquilinos")),
+
+        Cenario("reservas.store", "POST", lambda i, ctx: "/api/v1/reservas/", corpo_reserva,
+                coletar=coletar_reserva),
+        Cenario("reservas.index", "GET", lambda i, ctx: "/api/v1/reservas/"),
+        Cenario("reservas.show", "GET", id_reserva),
+        Cenario("reservas.update", "PUT", id_reserva, corpo_reserva_existente,
+                quantidade=um_por_registro("reservas")),
+        Cenario("reservas.publica", "POST", lambda i, ctx: "/api/v1/reservas/publica", corpo_publica,
+                autenticado=False),
+
+        Cenario("reservas.destroy", "DELETE", id_reserva, quantidade=um_por_registro("reservas")),
+        Cenario("inquilinos.destroy", "DELETE", item("inquilinos")("/api/v1/inquilinos/"),
+                quantidade=um_por_registro("inquilinos")),
+        Cenario("chales.destroy", "DELETE", item("chales")("/api/v1/chales/"),
+                quantidade=um_por_registro("chales")),
+    ]
+
+
+def executar_cenario(cliente, cenario: Cenario, requisicoes: int, concorrencia: int, token: str, ctx: dict) -> dict:
+    headers_auth = {"Authorization": f"Bearer {token}"} if cenario.autenticado else {}
+    total = requisicoes
+    if cenario.quantidade:
+        total = min(total, cenario.quantidade(ctx))
+
+    trava = threading.Lock()
+    latencias = []
+    respostas = []
+    erros = [0]
+
+    def uma(i):
+        caminho = cenario.caminho(i, ctx)
+        corpo = cenario.corpo(i, ctx) if cenario.corpo else None
+        inicio = time.perf_counter()
+        status, dados = cliente.requisitar(cenario.metodo, caminho, corpo, headers_auth)
+        duracao = time.perf_counter() - inicio
+        with trava:
+            latencias.append(duracao)
+            if status >= 400:
+                erros[0] += 1
+            elif cenario.coletar:
+                respostas.append((i, dados))
+
+    inicio_total = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        list(executor.map(uma, range(total)))
+    duracao_total = time.perf_counter() - inicio_total
+
+    if cenario.coletar:
+        for i, dados in sorted(respostas, key=lambda r: r[0]):
+            cenario.coletar(i, json.loads(dados), ctx)
+
+    return resumir(latencias, duracao_total, erros[0])
+
+
+def criar_app():
+    """Cria a aplicação completa (mesma inicialização de main.py)."""
+    from server import Server
+    server = Server()
+    server.init()
+    return server._Server__app
+
+
+@contextlib.contextmanager
+def servidor_local(app):
+    """Sobe o app em um servidor HTTP real (werkzeug, multi-thread) numa porta livre."""
+    from werkzeug.serving import make_server
+    servidor = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{servidor.server_port}"
+    finally:
+        servidor.shutdown()
+
+
+def executar(args) -> dict:
+    from api.http.meu_token_jwt import MeuTokenJWT
+    token = MeuTokenJWT().gerar_token({"user_id": 0, "email": args.email, "role": "admin", "name": "benchmark"})
+    ctx = {"chales": [], "inquilinos": [], "reservas": []}
+    cenarios = montar_cenarios(int(time.time()), args.email, args.senha)
+    if args.rotas:
+        filtro = set(args.rotas.split(","))
+        cenarios = [c for c in cenarios if c.nome in filtro or c.nome.endswith((".store", ".destroy"))]
+
+    resultados = {}
+    silencio = contextlib.redirect_stdout(io.StringIO()) if not args.verboso else contextlib.nullcontext()
+
+    with contextlib.ExitStack() as pilha:
+        if args.modo == "cliente":
+            cliente = ClienteTeste(criar_app())
+        elif args.url:
+            cliente = ClienteHTTP(args.url)
+        else:
+            cliente = ClienteHTTP(pilha.enter_context(servidor_local(criar_app())))
+
+        for cenario in cenarios:
+            with silencio:
+                resumo = executar_cenario(cliente, cenario, args.requisicoes, args.concorrencia, token, ctx)
+            resultados[cenario.nome] = resumo
+            imprimir_linha(f"[{args.modo}] {cenario.nome}", resumo)
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga HTTP das rotas da API")
+    parser.add_argument("--modo", choices=["cliente", "servidor"], default="cliente")
+    parser.add_argument("--url", help="URL de um servidor já em execução (apenas no modo servidor)")
+    parser.add_argument("--requisicoes", type=int, default=200, help="Requisições por rota")
+    parser.add_argument("--concorrencia", type=int, default=8, help="Threads concorrentes")
+    parser.add_argument("--rotas", help="Lista de cenários separados por vírgula (ex.: chales.index,reservas.index)")
+    parser.add_argument("--email", default="admin@casabranca.com", help="Usuário do cenário auth.login")
+    parser.add_argument("--senha", default="admin123")
+    parser.add_argument("--sqlite", nargs="?", const=":memory:", metavar="CAMINHO",
+                        help="Usa o backend SQLite (padrão :memory:) em vez do MySQL")
+    parser.add_argument("--com-rate-limit", action="store_true",
+                        help="Mantém o rate limit da API (por padrão é desligado no app do benchmark)")
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    parser.add_argument("--verboso", action="store_true", help="Mantém os prints da aplicação no console")
+    args = parser.parse_args()
+
+    if not args.com_rate_limit:
+        os.environ["RATE_LIMIT_ENABLED"] = "0"
+    if args.sqlite:
+        os.environ["DB_BACKEND"] = "sqlite"
+        os.environ["DB_SQLITE_PATH"] = args.sqlite
+
+    resultados = executar(args)
+    salvar_resultados(
+        "http",
+        {k: v for k, v in vars(args).items() if k not in ("senha", "saida", "verboso")},
+        resultados,
+        args.saida,
+    )
+
+
+if __name__ == "__main__":
+    main()
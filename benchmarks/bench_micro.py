@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmarks das funções mais quentes da API.
+
+Casos:
+- ReservaService._existe_sobreposicao com N reservas no mesmo chalé
+- Validação dos modelos (from_dict e validate_many)
+- MeuTokenJWT.validar_token
+- jsonify de listas grandes de reservas (com datas), com o provider padrão do
+  Flask e com o RapidoJSONProvider (orjson, se instalado)
+
+Não acessa o banco: o ReservaService recebe DAOs em memória, para isolar
+o custo de CPU da camada de serviço.
+
+Uso:
+    python -m benchmarks.bench_micro [--iteracoes 2000] [--reservas 1000] [--linhas 10000]
+"""
+import argparse
+import contextlib
+import io
+from datetime import date, timedelta
+
+from benchmarks.comum import imprimir_linha, medir_chamadas, salvar_resultados
+
+
+class _ReservaDAOMemoria:
+    """DAO em memória com a mesma interface usada por ReservaService."""
+
+    def __init__(self, reservas: list[dict]):
+        self.__reservas = reservas
+
+    def findByField(self, field, value):
+        return [r for r in self.__reservas if r.get(field) == value]
+
+
+class _EntidadeDAOMemoria:
+    def findById(self, _id):
+        return {"id": _id}
+
+
+def gerar_reservas(n: int, id_chale: int = 1) -> list[dict]:
+    """Reservas de 2 noites, sem sobreposição entre si, a partir de amanhã."""
+    base = date.today() + timedelta(days=1)
+    return [
+        {
+            "idReserva": i + 1,
+            "idInquilino": 1 + i % 50,
+            "idChale": id_chale,
+            "inicio": base + timedelta(days=3 * i),
+            "fim": base + timedelta(days=3 * i + 2),
+        }
+        for i in range(n)
+    ]
+
+
+def casos_sobreposicao(n_reservas: int) -> dict:
+    from api.service.reservaService import ReservaService
+
+    reservas = gerar_reservas(n_reservas)
+    service = ReservaService(_ReservaDAOMemoria(reservas), _EntidadeDAOMemoria(), _EntidadeDAOMemoria())
+    # Período depois da última reserva: percorre a lista inteira sem conflito
+    inicio = reservas[-1]["fim"] + timedelta(days=1)
+    fim = inicio + timedelta(days=2)
+
+    return {
+        f"reserva._existe_sobreposicao[{n_reservas}]": lambda: service._existe_sobreposicao(1, inicio, fim),
+    }
+
+
+def casos_validacao(n_linhas: int) -> dict:
+    from api.modelo.reserva import Reserva
+    from api.modelo.inquilino import Inquilino
+    from benchmarks.bench_modelos import gerar_inquilinos
+
+    amanha = (date.today() + timedelta(days=1)).isoformat()
+    depois = (date.today() + timedelta(days=3)).isoformat()
+    reserva = {"idInquilino": 1, "idChale": 2, "inicio": amanha, "fim": depois}
+    inquilinos = gerar_inquilinos(n_linhas)
+
+    return {
+        "modelo.Reserva.from_dict": lambda: Reserva.from_dict(reserva),
+        "modelo.Inquilino.from_dict": lambda: Inquilino.from_dict(inquilinos[0]),
+        f"modelo.Inquilino.validate_many[{n_linhas}]": lambda: Inquilino.validate_many(inquilinos),
+    }
+
+
+def casos_jwt() -> dict:
+    from api.http.meu_token_jwt import MeuTokenJWT
+
+    token = "Bearer " + MeuTokenJWT().gerar_token({"user_id": 1, "email": "admin@casabranca.com", "role": "admin"})
+    return {
+        "jwt.validar_token": lambda: MeuTokenJWT().validar_token(token),
+    }
+
+
+def casos_json(n_linhas: int) -> dict:
+    from flask import Flask, jsonify
+    from api.utils import jsonRapido
+    from api.utils.jsonRapido import RapidoJSONProvider
+
+    reservas = gerar_reservas(n_linhas)
+    corpo = {
+        "success": True,
+        "message": "Busca realizada com sucesso",
+        "data": {"Reservas": reservas},
+    }
+
+    app_padrao = Flask(__name__)
+    app_rapido = Flask(__name__)
+    app_rapido.json = RapidoJSONProvider(app_rapido)
+    assert app_rapido.json.loads(app_rapido.json.dumps(corpo)) == app_padrao.json.loads(app_padrao.json.dumps(corpo))
+
+    def jsonify_em(app):
+        def chamar():
+            with app.app_context():
+                return jsonify(corpo).get_data()
+        return chamar
+
+    encoder = "orjson" if jsonRapido.orjson is not None else "json"
+    return {
+        f"json.jsonify_reservas[{n_linhas}]": jsonify_em(app_padrao),
+        f"json.rapido_{encoder}_reservas[{n_linhas}]": jsonify_em(app_rapido),
+    }
+
+
+def executar(args) -> dict:
+    grupos = {
+        "sobreposicao": lambda: casos_sobreposicao(args.reservas),
+        "validacao": lambda: casos_validacao(args.linhas),
+        "jwt": casos_jwt,
+        "json": lambda: casos_json(args.linhas),
+    }
+    selecionados = args.casos.split(",") if args.casos else list(grupos)
+
+    resultados = {}
+    for grupo in selecionados:
+        for nome, func in grupos[grupo]().items():
+            # Itens "em lote" (listas grandes) usam menos iterações
+            iteracoes = max(10, args.iteracoes // 100) if "[" in nome else args.iteracoes
+            with contextlib.redirect_stdout(io.StringIO()):
+                resumo = medir_chamadas(func, iteracoes, aquecimento=min(iteracoes, 20))
+            resultados[nome] = resumo
+            imprimir_linha(nome, resumo)
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks das funções quentes da API")
+    parser.add_argument("--iteracoes", type=int, default=2000)
+    parser.add_argument("--reservas", type=int, default=1000, help="Reservas no chalé para _existe_sobreposicao")
+    parser.add_argument("--linhas", type=int, default=10000, help="Linhas para validate_many e jsonify")
+    parser.add_argument("--casos", help="Grupos separados por vírgula: sobreposicao,validacao,jwt,json")
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    args = parser.parse_args()
+
+    resultados = executar(args)
+    salvar_resultados("micro", {k: v for k, v in vars(args).items() if k != "saida"}, resultados, args.saida)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark dos modelos de domínio.
+
+Compara:
+- Modelos legados (atributos em __dict__, regex recompilada nos setters)
+- Modelos atuais (__slots__ + validadores pré-compilados), objeto a objeto
+- Validação em lote via validate_many()
+
+Uso:
+    python -m benchmarks.bench_modelos [--linhas 10000] [--repeticoes 5]
+"""
+import argparse
+import re
+import time
+
+from benchmarks.comum import salvar_resultados
+from api.modelo.inquilino import Inquilino
+from api.modelo.chale import Chale
+
+
+class _InquilinoLegado:
+    """Reprodução do modelo Inquilino anterior (referência para comparação)."""
+
+    def __init__(self):
+        self.__nomeInquilino = None
+        self.__email = None
+        self.__telefone = None
+        self.__requisicao = None
+        self.__cpf = None
+
+    @property
+    def nomeInquilino(self):
+        return self.__nomeInquilino
+
+    @nomeInquilino.setter
+    def nomeInquilino(self, value):
+        if not isinstance(value, str):
+            raise ValueError("nomeInquilino deve ser uma string.")
+        nome = value.strip()
+        if len(nome) < 3:
+            raise ValueError("nomeInquilino deve ter pelo menos 3 caracteres.")
+        self.__nomeInquilino = nome
+
+    @property
+    def email(self):
+        return self.__email
+
+    @email.setter
+    def email(self, value):
+        email_trimmed = value.strip()
+        if not re.match(r"^[^\s@]+@[^\s@]+\.[^\s@]+$", email_trimmed):
+            raise ValueError("email em formato inválido.")
+        self.__email = email_trimmed
+
+    @property
+    def telefone(self):
+        return self.__telefone
+
+    @telefone.setter
+    def telefone(self, value):
+        def validar_telefone(telefone):
+            numero = re.sub(r'[^0-9]', '', telefone)
+            if len(numero) not in [10, 11]:
+                return False
+            ddd = int(numero[:2])
+            if ddd < 11 or ddd > 99:
+                return False
+            if len(numero) == 11 and numero[2] != '9':
+                return False
+            return True
+
+        if not validar_telefone(value):
+            raise ValueError("telefone em formato inválido.")
+        self.__telefone = value
+
+    @property
+    def requisicao(self):
+        return self.__requisicao
+
+    @requisicao.setter
+    def requisicao(self, value):
+        self.__requisicao = value
+
+    @property
+    def cpf(self):
+        return self.__cpf
+
+    @cpf.setter
+    def cpf(self, value):
+        def validar_cpf(cpf):
+            cpf = re.sub(r'[^0-9]', '', cpf)
+            if len(cpf) != 11 or cpf == cpf[0] * 11:
+                return False
+            for i in range(9, 11):
+                soma = sum(int(cpf[j]) * (i + 1 - j) for j in range(0, i))
+                digito = (soma * 10 % 11) % 10
+                if digito != int(cpf[i]):
+                    return False
+            return True
+
+        if not validar_cpf(value):
+            raise ValueError("CPF em formato inválido.")
+        self.__cpf = value
+
+
+class _ChaleLegado:
+    """Reprodução do modelo Chale anterior (referência para comparação)."""
+
+    def __init__(self):
+        self.__nome = None
+        self.__capacidade = None
+
+    @property
+    def nome(self):
+        return self.__nome
+
+    @nome.setter
+    def nome(self, value):
+        if not isinstance(value, str):
+            raise ValueError("nome deve ser uma string.")
+        nome = value.strip()
+        if len(nome) < 3:
+            raise ValueError("nome deve ter pelo menos 3 caracteres.")
+        self.__nome = nome
+
+    @property
+    def capacidade(self):
+        return self.__capacidade
+
+    @capacidade.setter
+    def capacidade(self, valor):
+        try:
+            capacidade = int(valor)
+        except (ValueError, TypeError):
+            raise ValueError("capacidade deve ser um número inteiro.")
+        if capacidade <= 0:
+            raise ValueError("capacidade deve ser um número inteiro positivo.")
+        self.__capacidade = capacidade
+
+
+def gerar_inquilinos(n: int) -> list[dict]:
+    return [
+        {
+            "nomeInquilino": f"Hóspede {i}",
+            "email": f"hospede{i}@casabranca.com",
+            "telefone": "(54) 99999-0000",
+            "requisicao": "Sem observações",
+            "cpf": "529.982.247-25",
+        }
+        for i in range(n)
+    ]
+
+
+def gerar_chales(n: int) -> list[dict]:
+    return [{"nome": f"Chalé {i}", "capacidade": 2 + i % 6} for i in range(n)]
+
+
+def um_a_um(cls, linhas: list[dict], campos: tuple) -> list:
+    """Validação objeto a objeto, como os services fazem hoje."""
+    objetos = []
+    for linha in linhas:
+        obj = cls()
+        for campo in campos:
+            setattr(obj, campo, linha[campo])
+        objetos.append(obj)
+    return objetos
+
+
+def medir(func, repeticoes: int) -> float:
+    """Retorna o melhor tempo (s) entre as repetições."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def executar(linhas: int, repeticoes: int) -> dict:
+    inquilinos = gerar_inquilinos(linhas)
+    chales = gerar_chales(linhas)
+    campos_inquilino = ("nomeInquilino", "email", "telefone", "requisicao", "cpf")
+    campos_chale = ("nome", "capacidade")
+
+    casos = {
+        "inquilino.legado": lambda: um_a_um(_InquilinoLegado, inquilinos, campos_inquilino),
+        "inquilino.slots": lambda: um_a_um(Inquilino, inquilinos, campos_inquilino),
+        "inquilino.validate_many": lambda: Inquilino.validate_many(inquilinos),
+        "chale.legado": lambda: um_a_um(_ChaleLegado, chales, campos_chale),
+        "chale.slots": lambda: um_a_um(Chale, chales, campos_chale),
+        "chale.validate_many": lambda: Chale.validate_many(chales),
+    }
+
+    resultados = {}
+    for nome, func in casos.items():
+        segundos = medir(func, repeticoes)
+        resultados[nome] = {"segundos": segundos, "linhas_por_segundo": linhas / segundos}
+        print(f"{nome:<26} {segundos * 1000:9.2f} ms  {linhas / segundos:12,.0f} linhas/s")
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark dos modelos de domínio")
+    parser.add_argument("--linhas", type=int, default=10000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", help="Arquivo JSON de saída")
+    args = parser.parse_args()
+
+    resultados = executar(args.linhas, args.repeticoes)
+    salvar_resultados("modelos", {"linhas": args.linhas, "repeticoes": args.repeticoes}, resultados, args.saida)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Compara dois arquivos de resultados gerados pelos benchmarks.
+
+Mostra, para cada caso presente nos dois arquivos, a variação de vazão
+e de p50/p95/p99 (negativo em latência = melhoria).
+
+Uso:
+    python -m benchmarks.comparar benchmarks/resultados/http-A.json benchmarks/resultados/http-B.json
+"""
+import argparse
+import json
+
+
+def _variacao(antes: float, depois: float) -> str:
+    if not antes:
+        return "    n/a"
+    return f"{(depois - antes) / antes * 100:+7.1f}%"
+
+
+def comparar(caminho_antes: str, caminho_depois: str):
+    with open(caminho_antes, encoding="utf-8") as f:
+        antes = json.load(f)["resultados"]
+    with open(caminho_depois, encoding="utf-8") as f:
+        depois = json.load(f)["resultados"]
+
+    print(f"{'caso':<42} {'vazão':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for nome in antes:
+        if nome not in depois:
+            continue
+        a, d = antes[nome], depois[nome]
+        if "vazao_por_segundo" not in a:
+            continue
+        print(
+            f"{nome:<42} {_variacao(a['vazao_por_segundo'], d['vazao_por_segundo']):>9} "
+            f"{_variacao(a['p50_ms'], d['p50_ms']):>9} {_variacao(a['p95_ms'], d['p95_ms']):>9} "
+            f"{_variacao(a['p99_ms'], d['p99_ms']):>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara dois resultados de benchmark")
+    parser.add_argument("antes")
+    parser.add_argument("depois")
+    args = parser.parse_args()
+    comparar(args.antes, args.depois)
+
+
+if __name__ == "__main__":
+    main()
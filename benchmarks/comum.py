@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Utilitários compartilhados pelos benchmarks.
+
+- Cálculo de vazão e percentis (p50/p95/p99) a partir das latências medidas
+- Gravação dos resultados em JSON (benchmarks/resultados/) para comparar execuções
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+PASTA_RESULTADOS = Path(__file__).resolve().parent / "resultados"
+
+# Permite executar os scripts diretamente (python benchmarks/bench_x.py)
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
+
+
+def percentil(valores_ordenados: list[float], p: float) -> float:
+    """
+    Percentil por interpolação linear (mesmo critério do numpy padrão).
+
+    :param valores_ordenados: list[float] - Amostras já ordenadas
+    :param p: float - Percentil entre 0 e 100
+    """
+    if not valores_ordenados:
+        return 0.0
+
+    posicao = (len(valores_ordenados) - 1) * (p / 100)
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(valores_ordenados) - 1)
+    fracao = posicao - inferior
+    return valores_ordenados[inferior] + (valores_ordenados[superior] - valores_ordenados[inferior]) * fracao
+
+
+def resumir(latencias_s: list[float], duracao_total_s: float, erros: int = 0) -> dict:
+    """
+    Resume uma série de latências (em segundos).
+
+    :return: dict com total, erros, vazão (op/s) e percentis em milissegundos
+    """
+    ordenadas = sorted(latencias_s)
+    total = len(ordenadas)
+    return {
+        "total": total,
+        "erros": erros,
+        "vazao_por_segundo": (total / duracao_total_s) if duracao_total_s > 0 else 0.0,
+        "media_ms": (sum(ordenadas) / total * 1000) if total else 0.0,
+        "p50_ms": percentil(ordenadas, 50) * 1000,
+        "p95_ms": percentil(ordenadas, 95) * 1000,
+        "p99_ms": percentil(ordenadas, 99) * 1000,
+        "max_ms": (ordenadas[-1] * 1000) if total else 0.0,
+    }
+
+
+def imprimir_linha(nome: str, resumo: dict):
+    """Imprime uma linha de relatório no console."""
+    print(
+        f"{nome:<42} {resumo['vazao_por_segundo']:>11,.1f}/s "
+        f"p50={resumo['p50_ms']:>8.3f}ms p95={resumo['p95_ms']:>8.3f}ms "
+        f"p99={resumo['p99_ms']:>8.3f}ms erros={resumo['erros']}"
+    )
+
+
+def medir_chamadas(func, iteracoes: int, aquecimento: int = 0) -> dict:
+    """
+    Executa func() várias vezes medindo cada chamada individualmente.
+
+    :param func: callable sem argumentos
+    :param iteracoes: int - Número de chamadas medidas
+    :param aquecimento: int - Chamadas executadas antes da medição
+    """
+    for _ in range(aquecimento):
+        func()
+
+    latencias = []
+    relogio = time.perf_counter
+    inicio_total = relogio()
+    for _ in range(iteracoes):
+        inicio = relogio()
+        func()
+        latencias.append(relogio() - inicio)
+    duracao = relogio() - inicio_total
+
+    return resumir(latencias, duracao)
+
+
+def _commit_atual() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def salvar_resultados(suite: str, parametros: dict, resultados: dict, destino: str | None = None) -> Path:
+    """
+    Grava os resultados em JSON para comparação entre execuções.
+
+    :param suite: str - Nome da suíte (ex.: "http", "micro")
+    :param parametros: dict - Parâmetros usados na execução
+    :param resultados: dict - {nome_do_caso: resumo}
+    :param destino: str | None - Caminho do arquivo (padrão: benchmarks/resultados/<suite>-<data>.json)
+    :return: Path do arquivo gravado
+    """
+    if destino:
+        caminho = Path(destino)
+    else:
+        carimbo = datetime.now().strftime("%Y%m%d-%H%M%S")
+        caminho = PASTA_RESULTADOS / f"{suite}-{carimbo}.json"
+
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    documento = {
+        "suite": suite,
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit_atual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+        "parametros": parametros,
+        "resultados": resultados,
+    }
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(documento, f, ensure_ascii=False, indent=2)
+
+    print(f"💾 Resultados gravados em {caminho}")
+    return caminho
@@ -1,40 +1,67 @@
+import logging
 import os
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException, NotFound
 from dotenv import load_dotenv  # ✅ ADICIONAR
 
 from api.database.database import DatabaseConfig
+from api.database.circuito import BancoIndisponivelError
 from api.utils.errorResponse import ErrorResponse
-from api.utils.logger import Logger
+from api.utils.logger import Logger, FiltroCredenciais
+from api.utils.metricas import Metricas
+from api.utils.slowQueryLog import SlowQueryLog
+from api.utils.armazenamentoLocal import ArmazenamentoLocal
+from api.utils.limitadorTaxa import LimitadorTaxa
+from api.utils.jsonRapido import RapidoJSONProvider
+from api.utils.geracaoCompartilhada import GeracaoCompartilhada
+from api.utils.cacheRespostas import CacheRespostas
+from api.utils.cacheCompartilhado import CacheCompartilhado
+from api.utils.cacheSWR import CacheSWR
+from api.utils.logEventos import LogEventos
 
 # Middlewares
 from api.Middleware.jwt_middleware import JwtMiddleware
 from api.Middleware.inquilinoMiddleware import InquilinoMiddleware
 from api.Middleware.chaleMiddleware import ChaleMiddleware
 from api.Middleware.reservaMiddleware import ReservaMiddleware
+from api.Middleware.idempotenciaMiddleware import IdempotenciaMiddleware
+from api.Middleware.rateLimitMiddleware import RateLimitMiddleware
+from api.Middleware.cacheRespostaMiddleware import CacheRespostaMiddleware
+from api.Middleware.contingenciaMiddleware import ContingenciaMiddleware
 
 # Controls
 from api.controle.inquilinoControl import InquilinoControl
 from api.controle.chaleControl import ChaleControl
 from api.controle.reservaControl import ReservaControl
+from api.controle.reservaPublicaControl import ReservaPublicaControl
+from api.controle.reservaEventosControl import ReservaEventosControl
+from api.controle.relatorioControl import RelatorioControl
 
 # Services
 from api.service.inquilinoService import InquilinoService
 from api.service.chaleService import ChaleService
 from api.service.reservaService import ReservaService
+from api.service.reservaPublicaService import ReservaPublicaService
+from api.service.filaReservaPublica import FilaReservaPublica
+from api.service.relatorioService import RelatorioService
+from api.service.catalogoChales import CatalogoChales
+from api.service.arquivoReservas import ArquivoReservas
 
 # DAOs
 from api.dao.inquilinoDAO import InquilinoDAO
 from api.dao.chaleDAO import ChaleDAO
 from api.dao.reservaDAO import ReservaDAO
 from api.dao.usuariosDAO import UsuarioDAO
+from api.dao.relatorioDAO import RelatorioDAO
 
 # Routers
 from api.router.inquilinoRoteador import InquilinoRoteador
 from api.router.chaleRoteador import ChaleRoteador
 from api.router.reservaRoteador import ReservaRoteador
 from api.router.authRoteador import AuthRoteador
+from api.router.adminRoteador import AdminRoteador
+from api.router.relatorioRoteador import RelatorioRoteador
 
 import traceback
 
@@ -53,6 +80,11 @@ class Server:
 
         # Instância Flask
         self.__app = Flask(__name__, static_folder="static", static_url_path="")
+        # ✅ jsonify com orjson (se instalado) e datas no mesmo formato do provider padrão
+        self.__app.json = RapidoJSONProvider(self.__app)
+
+        # ✅ Log de acesso sem o ?ticket= do stream SSE
+        logging.getLogger("werkzeug").addFilter(FiltroCredenciais())
 
         # ✅ CORS configurado
         CORS(self.__app, resources={
@@ -63,7 +95,7 @@ class Server:
                     "http://localhost:8000"
                 ],
                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-                "allow_headers": ["Content-Type", "Authorization"]
+                "allow_headers": ["Content-Type", "Authorization", "Idempotency-Key"]
             }
         })
 
@@ -72,6 +104,7 @@ class Server:
         self.__inquilino_middleware = InquilinoMiddleware()
         self.__chale_middleware = ChaleMiddleware()
         self.__reserva_middleware = ReservaMiddleware()
+        self.__rate_limit_middleware = RateLimitMiddleware(LimitadorTaxa())
 
         # DAOs, Services e Controls
         self.__inquilino_dao = None
@@ -85,28 +118,37 @@ class Server:
         self.__reserva_control = None
         self.__usuario_dao = None
         self.__db_connection = None
+        self.__armazenamento_local = None
+        self.__geracoes = None
+        self.__cache_compartilhado = None
+        self.__fila_reserva_publica = None
+        self.__eventos_reserva = None
+        self.__arquivo_reservas = None
 
     def init(self):
         """Inicializa a aplicação"""
         self.__before_routing()
+        self.__setup_metricas()
 
-        # ✅ Conexão com MySQL usando variáveis de ambiente
-        self.__db_connection = DatabaseConfig(
-            pool_name="mypool",
-            pool_size=10,
-            host=os.environ.get('DB_HOST', '127.0.0.1'),
-            user=os.environ.get('DB_USER', 'root'),
-            password=os.environ.get('DB_PASSWORD', '85252317b'),
-            database=os.environ.get('DB_NAME', 'casa_branca'),
-            port=int(os.environ.get('DB_PORT', 3306))
-        )
+        # ✅ Limite do slow query log: lido aqui, depois do load_dotenv (o import do módulo é anterior)
+        SlowQueryLog.configurar(os.environ.get('SLOW_QUERY_MS', 200))
 
-        self.__db_connection.connect()
+        # ✅ Conexão com o banco usando variáveis de ambiente (MySQL ou SQLite via DB_BACKEND)
+        self.__db_connection = DatabaseConfig.from_env(pool_name="mypool", pool_size=10)
 
+        # ✅ Banco fora do ar na subida: a API sobe assim mesmo (503 até o circuito fechar)
+        try:
+            self.__db_connection.connect()
+        except BancoIndisponivelError as error:
+            print(f"⚠️  Iniciando sem banco: {error.getError()['message']}")
+
+        self.__setup_contingencia()
         self.__setup_inquilino()
         self.__setup_chale()
         self.__setup_reserva()
+        self.__setup_relatorios()
         self.__setup_auth()
+        self.__setup_admin()
         self.__error_middleware()
 
     def __setup_inquilino(self):
@@ -126,12 +168,15 @@ class Server:
         """Configura o módulo Chale"""
         print("⬆️  Setup Chale")
         self.__chale_dao = ChaleDAO(self.__db_connection)
-        self.__chale_service = ChaleService(self.__chale_dao)
+        # respostas dos GETs de chalés em cache; geração compartilhada entre workers
+        cache_chales = CacheRespostas("chales", self.__get_geracoes(), compartilhado=self.__get_cache_compartilhado())
+        self.__chale_service = ChaleService(self.__chale_dao, cache_chales)
         self.__chale_control = ChaleControl(self.__chale_service)
         chale_router = ChaleRoteador(
             self.__jwt_middleware,
             self.__chale_middleware,
-            self.__chale_control
+            self.__chale_control,
+            CacheRespostaMiddleware(cache_chales)
         )
         self.__app.register_blueprint(chale_router.create_routes(), url_prefix="/api/v1/chales")
 
@@ -143,21 +188,157 @@ class Server:
             self.__inquilino_dao = InquilinoDAO(self.__db_connection)
         if self.__chale_dao is None:
             self.__chale_dao = ChaleDAO(self.__db_connection)
-        self.__reserva_service = ReservaService(self.__reserva_dao, self.__inquilino_dao, self.__chale_dao)
+        # ✅ feed de alterações (GET /api/v1/reservas/eventos), compartilhado entre workers
+        self.__eventos_reserva = LogEventos(self.__get_armazenamento_local(), "eventos_reserva")
+        # ✅ listagens (GET /api/v1/reservas) com stale-while-revalidate: vencidas são servidas
+        # enquanto uma única thread recalcula; escritas em qualquer worker invalidam (geração "reservas")
+        listas_reserva = CacheSWR(
+            "reservas",
+            float(os.environ.get('RESERVAS_LISTA_TTL', 30)),
+            float(os.environ.get('RESERVAS_LISTA_STALE', 300)),
+            int(os.environ.get('RESERVAS_LISTA_MAX', 64)),
+            geracoes=self.__get_geracoes()
+        )
+        self.__reserva_service = ReservaService(
+            self.__reserva_dao, self.__inquilino_dao, self.__chale_dao, self.__eventos_reserva, listas_reserva
+        )
         self.__reserva_control = ReservaControl(self.__reserva_service)
+
+        # ✅ ARQUIVO_RESERVAS_ENABLED=1: reservas encerradas há ARQUIVO_IDADE_DIAS dias vão, em lotes,
+        # para reserva_historico (a tabela quente fica só com o que ainda pode conflitar)
+        if os.environ.get('ARQUIVO_RESERVAS_ENABLED', '').lower() in ('1', 'true', 'sim'):
+            self.__arquivo_reservas = ArquivoReservas.from_env(self.__reserva_dao, listas_reserva)
+            self.__arquivo_reservas.iniciar()
+
+        # ✅ Reserva pública: service/control criados uma vez; com RESERVA_PUBLICA_ASSINCRONA=1
+        # os pedidos vão para a fila local e são processados em segundo plano
+        # o chalé é alocado pelo tipo pedido no site (catálogo invalidado pelas escritas de chalés)
+        catalogo_chales = CatalogoChales(self.__chale_dao, self.__get_geracoes(), compartilhado=self.__get_cache_compartilhado())
+        reserva_publica_service = ReservaPublicaService(self.__reserva_service, catalogo_chales)
+        if os.environ.get('RESERVA_PUBLICA_ASSINCRONA', '').lower() in ('1', 'true', 'sim'):
+            self.__fila_reserva_publica = FilaReservaPublica.from_env(self.__get_armazenamento_local(), reserva_publica_service)
+            self.__fila_reserva_publica.iniciar()
+        reserva_publica_control = ReservaPublicaControl(reserva_publica_service, self.__fila_reserva_publica)
+
         reserva_router = ReservaRoteador(
             self.__jwt_middleware,
             self.__reserva_middleware,
-            self.__reserva_control
+            self.__reserva_control,
+            reserva_publica_control,
+            IdempotenciaMiddleware(self.__get_armazenamento_local()),
+            self.__rate_limit_middleware,
+            ReservaEventosControl(self.__eventos_reserva)
         )
         self.__app.register_blueprint(reserva_router.create_routes(), url_prefix="/api/v1/reservas")
 
+    def __setup_relatorios(self):
+        """Configura os relatórios gerenciais (GET /api/v1/relatorios/ocupacao)"""
+        print("⬆️  Setup Relatórios")
+        # dados carregados em DataFrames e reaproveitados até surgir um evento novo de reserva
+        relatorio_service = RelatorioService(RelatorioDAO(self.__db_connection), self.__eventos_reserva)
+        relatorio_router = RelatorioRoteador(self.__jwt_middleware, RelatorioControl(relatorio_service))
+        self.__app.register_blueprint(relatorio_router.create_routes(), url_prefix="/api/v1/relatorios")
+
+    def __setup_contingencia(self):
+        """
+        Queda do banco (BancoIndisponivelError, inclusive com o circuito aberto):
+        - GETs de chalés, reservas e inquilinos recebem a última resposta boa, marcada como desatualizada
+        - demais requisições falham na hora com 503 e Retry-After
+        """
+        print("⬆️  Setup Contingência")
+        contingencia = None
+        if os.environ.get('CONTINGENCIA_ENABLED', '1').lower() not in ('0', 'false', 'nao'):
+            # arquivo próprio: as cópias de contingência não disputam espaço com as respostas
+            # e o catálogo do CacheCompartilhado (só são lidas com o banco fora do ar)
+            compartilhado = None
+            if self.__get_cache_compartilhado() is not None:
+                compartilhado = CacheCompartilhado(
+                    os.environ.get('CONTINGENCIA_PATH', 'api/system/contingencia.bin'),
+                    int(os.environ.get('CONTINGENCIA_MB', 16))
+                )
+            contingencia = ContingenciaMiddleware(
+                ("/api/v1/chales", "/api/v1/reservas", "/api/v1/inquilinos"),
+                compartilhado
+            )
+            self.__app.after_request(contingencia.guardar)
+
+        @self.__app.errorhandler(BancoIndisponivelError)
+        def banco_indisponivel(error):
+            resposta = contingencia.responder() if contingencia else None
+            if resposta is None:
+                Logger.log_error(error)
+                resposta = jsonify({
+                    "success": False,
+                    "error": {
+                        "message": error.getMessage(),
+                        "code": 503,
+                        "details": error.getError()
+                    },
+                    "data": {"message": "Banco de dados indisponível"}
+                })
+                resposta.status_code = 503
+            resposta.headers["Retry-After"] = str(error.retry_after)
+            return resposta
+
+    def __get_geracoes(self) -> GeracaoCompartilhada:
+        """Contadores de geração dos caches, compartilhados entre workers (criados sob demanda)."""
+        if self.__geracoes is None:
+            self.__geracoes = GeracaoCompartilhada()
+        return self.__geracoes
+
+    def __get_cache_compartilhado(self) -> CacheCompartilhado | None:
+        """Cache entre workers do host (mmap); None com CACHE_COMPARTILHADO_ENABLED=0."""
+        if os.environ.get('CACHE_COMPARTILHADO_ENABLED', '1').lower() in ('0', 'false', 'nao'):
+            return None
+        if self.__cache_compartilhado is None:
+            self.__cache_compartilhado = CacheCompartilhado()
+        return self.__cache_compartilhado
+
+    def __get_armazenamento_local(self) -> ArmazenamentoLocal:
+        """Armazenamento local (SQLite) compartilhado pelos módulos que precisam de estado operacional"""
+        if self.__armazenamento_local is None:
+            self.__armazenamento_local = ArmazenamentoLocal()
+        return self.__armazenamento_local
+
     def __setup_auth(self):
         """Configura autenticação"""
         print("⬆️  Setup Auth")
-        auth_router = AuthRoteador(self.__db_connection)
+        auth_router = AuthRoteador(self.__db_connection, self.__rate_limit_middleware)
         self.__app.register_blueprint(auth_router.create_routes(), url_prefix="/api/v1/auth")
 
+    def __setup_admin(self):
+        """Configura as rotas administrativas (diagnóstico)"""
+        print("⬆️  Setup Admin")
+        admin_router = AdminRoteador(self.__jwt_middleware)
+        self.__app.register_blueprint(admin_router.create_routes(), url_prefix="/api/v1/admin")
+
+    def __setup_metricas(self):
+        """
+        Métricas de desempenho (METRICS_ENABLED=1):
+        - GET /metrics no formato Prometheus
+        - Header Server-Timing (app, db e pool) em todas as respostas
+        """
+        Metricas.configurar(os.environ.get('METRICS_ENABLED', '').lower() in ('1', 'true', 'sim'))
+        if not Metricas.habilitado:
+            return
+        print("⬆️  Setup Métricas")
+
+        @self.__app.before_request
+        def iniciar_metricas():
+            Metricas.iniciar_requisicao()
+
+        @self.__app.after_request
+        def finalizar_metricas(response):
+            rota = request.url_rule.rule if request.url_rule else "<sem_rota>"
+            atual = Metricas.finalizar_requisicao(rota, request.method, response.status_code)
+            if atual is not None:
+                response.headers["Server-Timing"] = Metricas.server_timing(atual)
+            return response
+
+        @self.__app.route('/metrics', methods=['GET'])
+        def metricas():
+            return Response(Metricas.exportar_prometheus(), mimetype="text/plain; version=0.0.4")
+
     def __before_routing(self):
         """Middleware e rotas HTML"""
 
@@ -319,6 +319,57 @@ export default class ApiService {
         }
     }
 
+    /**
+     * Abre um stream Server-Sent Events (EventSource) autenticado.
+     * O EventSource não permite enviar headers, e o token de acesso não vai na URL:
+     * ele é trocado por um ticket de curta duração (POST {endpoint}/ticket), enviado em ?ticket=.
+     * Quando o stream cai, pede outro ticket e reabre com ?lastEventId= (sem perder eventos).
+     * @param {string} endpoint - Endpoint relativo (ex: "/api/v1/reservas/eventos")
+     * @param {Object<string, Function>} ouvintes - Tipo do evento (ex: "reserva.criada") -> função
+     * @returns {{fechar: Function}} Controle do stream.
+     */
+    eventos(endpoint, ouvintes) {
+        let stream = null;
+        let ultimoId = null;
+        let fechado = false;
+
+        const abrir = async () => {
+            const resposta = await this.post(`${endpoint}/ticket`, {});
+            if (fechado) return;
+            if (!resposta.success) {
+                console.warn("⚠️ Ticket do feed não emitido, tentando de novo...", resposta.error?.message);
+                setTimeout(abrir, 3000);
+                return;
+            }
+
+            const params = new URLSearchParams({ ticket: resposta.data.ticket });
+            if (ultimoId !== null) params.set("lastEventId", ultimoId);
+            const separador = endpoint.includes("?") ? "&" : "?";
+            stream = new EventSource(`${this.#buildURL(endpoint)}${separador}${params}`);
+
+            for (const [tipo, funcao] of Object.entries(ouvintes)) {
+                stream.addEventListener(tipo, (evento) => {
+                    if (evento.lastEventId) ultimoId = evento.lastEventId;
+                    funcao(evento);
+                });
+            }
+            stream.onerror = () => {
+                // o ticket já expirou: a reconexão automática do EventSource seria recusada
+                console.warn("⚠️ Feed desconectado, reconectando...");
+                stream.close();
+                setTimeout(abrir, 3000);
+            };
+        };
+
+        abrir();
+        return {
+            fechar: () => {
+                fechado = true;
+                stream?.close();
+            }
+        };
+    }
+
     /**
      * Getter para o token privado.
      * @returns {string|null} Retorna o token atual.
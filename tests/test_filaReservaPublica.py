@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import unittest
+from api.service.filaReservaPublica import FilaReservaPublica
+from api.service.reservaPublicaService import ReservaPublicaService
+from api.utils.armazenamentoLocal import ArmazenamentoLocal
+from tests.test_reservaPublicaService import ReservaServiceFalso, formulario
+
+
+class PublicaServiceInstavel:
+    """Falha de infraestrutura em toda chamada."""
+
+    def criar_reserva_simples(self, dados):
+        raise OSError("conexão recusada")
+
+
+class TestProcessarUm(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.armazenamento = ArmazenamentoLocal(os.path.join(self.diretorio.name, "fila.db"))
+        self.reserva_service = ReservaServiceFalso()
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def fila(self, publica_service=None):
+        return FilaReservaPublica(self.armazenamento, publica_service or ReservaPublicaService(self.reserva_service))
+
+    def test_payload_invalido_rejeitado_na_primeira_tentativa(self):
+        fila = self.fila()
+        tracking = fila.enfileirar(formulario(data_inicio="2027-13-01"))
+
+        self.assertTrue(fila.processar_um())
+
+        pedido = fila.status(tracking)
+        self.assertEqual(pedido["status"], "rejeitada")
+        self.assertEqual(pedido["tentativas"], 1)
+        self.assertEqual(pedido["erro"], "Data inválida")
+        self.assertEqual(self.reserva_service.chamadas, [])
+
+    def test_campos_faltando_rejeitado(self):
+        fila = self.fila()
+        tracking = fila.enfileirar(formulario(numero_pessoas=None))
+
+        fila.processar_um()
+
+        self.assertEqual(fila.status(tracking)["status"], "rejeitada")
+
+    def test_erro_de_infraestrutura_volta_para_a_fila(self):
+        fila = self.fila(PublicaServiceInstavel())
+        tracking = fila.enfileirar(formulario())
+
+        fila.processar_um()
+
+        pedido = fila.status(tracking)
+        self.assertEqual(pedido["status"], "pendente")
+        self.assertEqual(pedido["erro"], "conexão recusada")
+
+    def test_pedido_valido_concluido(self):
+        fila = self.fila()
+        tracking = fila.enfileirar(formulario())
+
+        fila.processar_um()
+
+        pedido = fila.status(tracking)
+        self.assertEqual((pedido["status"], pedido["reserva_id"]), ("concluida", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
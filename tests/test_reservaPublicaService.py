@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import unittest
+from api.service.reservaPublicaService import ReservaPublicaService
+from api.utils.errorResponse import ErrorResponse
+
+
+def formulario(**campos):
+    dados = {
+        "nome": "Ana Souza",
+        "email": "ana@email.com",
+        "telefone": "(54) 99999-0000",
+        "chale_desejado": "romantico",
+        "data_inicio": "2030-01-10",
+        "data_fim": "2030-01-12",
+        "numero_pessoas": 2,
+    }
+    dados.update(campos)
+    return dados
+
+
+class ReservaServiceFalso:
+    """Registra as chamadas: a validação não deve chegar na alocação."""
+
+    def __init__(self):
+        self.chamadas = []
+
+    def chalesLivres(self, ids, inicio, fim):
+        self.chamadas.append(("chalesLivres", ids, inicio, fim))
+        return []
+
+    def createReserva(self, dados):
+        self.chamadas.append(("createReserva", dados))
+        return 1
+
+
+class TestValidarFormulario(unittest.TestCase):
+    def setUp(self):
+        self.reserva_service = ReservaServiceFalso()
+        self.service = ReservaPublicaService(self.reserva_service)
+
+    def assertErro400(self, dados):
+        with self.assertRaises(ErrorResponse) as contexto:
+            self.service.criar_reserva_simples(dados)
+        self.assertEqual(contexto.exception.getHttpCode(), 400)
+        self.assertEqual(self.reserva_service.chamadas, [])
+        return contexto.exception
+
+    def test_data_impossivel_responde_400_sem_alocar(self):
+        erro = self.assertErro400(formulario(data_inicio="2027-13-01", data_fim="2027-13-05"))
+        self.assertEqual(erro.getMessage(), "Data inválida")
+
+    def test_data_fim_impossivel(self):
+        self.assertErro400(formulario(data_fim="2030-02-30"))
+
+    def test_fim_antes_do_inicio(self):
+        erro = self.assertErro400(formulario(data_inicio="2030-01-12", data_fim="2030-01-10"))
+        self.assertEqual(erro.getMessage(), "Período inválido")
+
+    def test_datas_em_formatos_diferentes_comparadas_como_data(self):
+        # "10/01/2030" > "2030-01-09" como texto, mas é posterior como data
+        self.assertEqual(self.service.validar_formulario(formulario(data_inicio="2030-01-09", data_fim="10/01/2030")), "romantico")
+
+    def test_campos_faltando(self):
+        self.assertErro400(formulario(email=""))
+
+    def test_numero_pessoas_invalido(self):
+        self.assertErro400(formulario(numero_pessoas="duas"))
+
+    def test_tipo_de_chale_desconhecido(self):
+        erro = self.assertErro400(formulario(chale_desejado="castelo"))
+        self.assertEqual(erro.getMessage(), "Chalé não encontrado")
+
+    def test_formulario_valido(self):
+        self.assertEqual(self.service.criar_reserva_simples(formulario()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()